@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+
+# Blue file big-endian payload benchmark
+# Builds a synthetic IEEE (big-endian) Blue file and compares the conversion
+# throughput of byte swapping to a little-endian SigMF datatype against
+# emitting the matching *_be datatype with no swap, plus normalized cf32_le.
+
+import os
+import sys
+import struct
+import tempfile
+import argparse
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from blue_file_to_sigmf import (  # noqa: E402
+    DATATYPE_MAP_BE,
+    DATATYPE_MAP_LE,
+    FORMAT_MAP,
+    HEADER_SIZE,
+    normalized_datatype,
+    parse_data_values,
+    read_hcb,
+)
+
+
+def write_big_endian_file(path, data_format, size_bytes, chunk_bytes=64 * 1024 * 1024):
+    """Write a big-endian type 1000 Blue file with roughly ``size_bytes`` of payload."""
+    elem_type, elems_per_sample = FORMAT_MAP[data_format]
+    elem_dtype = np.dtype(elem_type).newbyteorder(">")
+    sample_bytes = elem_dtype.itemsize * elems_per_sample
+    data_size = size_bytes // sample_bytes * sample_bytes
+
+    header = bytearray(HEADER_SIZE)
+    header[0:12] = b"BLUEIEEEIEEE"
+    struct.pack_into(">ddi2s", header, 32, HEADER_SIZE, data_size, 1000, data_format.encode("ascii"))
+    struct.pack_into(">ddi", header, 256, 0.0, 1e-6, 1)
+
+    rng = np.random.default_rng(0)
+    with open(path, "wb") as f:
+        f.write(header)
+        remaining = data_size
+        while remaining > 0:
+            count = min(chunk_bytes, remaining) // elem_dtype.itemsize
+            f.write(rng.integers(-1000, 1000, count).astype(elem_dtype).tobytes())
+            remaining -= count * elem_dtype.itemsize
+
+
+def best_of(path, hcb, datatype, chunk_size, repeat):
+    """Return the fastest wall time of ``repeat`` conversions to ``datatype``."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse_data_values(path, hcb, ">", chunk_size, None, datatype)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark big-endian Blue payload conversion")
+    parser.add_argument("--format", default="CI", choices=sorted(FORMAT_MAP), help="Blue data format code")
+    parser.add_argument("--size-mb", type=int, default=256, help="payload size in MB")
+    parser.add_argument("--chunk-size", type=int, default=1024 * 1024, help="samples per chunk")
+    parser.add_argument("--repeat", type=int, default=3, help="number of timed runs, best is reported")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "big_endian.tmp")
+        write_big_endian_file(path, args.format, args.size_mb * 1024 * 1024)
+        hcb = read_hcb(path)
+        size_mb = hcb["data_size"] / 1e6
+
+        print(f"format {args.format}, {size_mb:.1f} MB payload, {args.chunk_size} samples per chunk")
+        cases = [
+            ("no swap", DATATYPE_MAP_BE[args.format]),
+            ("byteswap", DATATYPE_MAP_LE[args.format]),
+            ("normalize", normalized_datatype(args.format)),
+        ]
+        for label, datatype in cases:
+            seconds = best_of(path, hcb, datatype, args.chunk_size, args.repeat)
+            print(f"{label:10s} -> {datatype:8s}: {seconds:7.3f} s  {size_mb / seconds:8.1f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
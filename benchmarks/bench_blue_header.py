@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+
+# Blue file header parsing benchmark
+# Builds a synthetic keyword-heavy Blue file (similar to lots_of_keywords.tmp)
+# and compares the single-read buffer decoder used by read_header() against
+# the previous approach of issuing several small f.read calls per keyword.
+
+import os
+import sys
+import struct
+import tempfile
+import argparse
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from blue_file_to_sigmf import BLOCK_SIZE, HEADER_SIZE, TYPE_MAP, read_hcb, read_header  # noqa: E402
+
+
+def write_keyword_file(path, keyword_count, sample_count=1024):
+    """Write a little-endian type 1000 CI Blue file with many extended header keywords."""
+    payload = np.zeros(sample_count * 2, dtype="<i2").tobytes()
+
+    ext = bytearray()
+    for index in range(keyword_count):
+        tag = f"KEYWORD_{index}".encode("ascii")
+        if index % 2:
+            value = f"value {index}".encode("ascii")
+            type_char = b"A"
+        else:
+            value = struct.pack("<d", index * 1.5)
+            type_char = b"D"
+        total = 8 + len(value) + len(tag)
+        pad = (8 - (total % 8)) % 8
+        lkey = total + pad
+        ext += struct.pack("<ihb", lkey, lkey - len(value), len(tag)) + type_char + value + tag + b"\x00" * pad
+
+    data_end = HEADER_SIZE + len(payload)
+    ext_start = (data_end + BLOCK_SIZE - 1) // BLOCK_SIZE
+
+    header = bytearray(HEADER_SIZE)
+    header[0:12] = b"BLUEEEEIEEEI"
+    struct.pack_into("<ii", header, 24, ext_start, len(ext))
+    struct.pack_into("<ddi2s", header, 32, HEADER_SIZE, len(payload), 1000, b"CI")
+    struct.pack_into("<ddi", header, 256, 0.0, 1e-6, 1)
+
+    with open(path, "wb") as f:
+        f.write(header)
+        f.write(payload)
+        f.write(b"\x00" * (ext_start * BLOCK_SIZE - data_end))
+        f.write(ext)
+
+
+def legacy_parse_extended_header(file_path, hcb, endian="<"):
+    """Reference copy of the per-field reader that read_header() replaced."""
+    entries = []
+    with open(file_path, "rb") as f:
+        f.seek(int(hcb["ext_start"]) * BLOCK_SIZE)
+        bytes_remaining = int(hcb["ext_size"])
+        while bytes_remaining > 0:
+            lkey = struct.unpack(f"{endian}i", f.read(4))[0]
+            lext = struct.unpack(f"{endian}h", f.read(2))[0]
+            ltag = struct.unpack(f"{endian}b", f.read(1))[0]
+            type_char = f.read(1).decode("ascii", errors="replace")
+
+            dtype, bytes_per_element = TYPE_MAP.get(type_char, (np.dtype("S1"), 1))
+            val_len = lkey - lext
+            val_count = val_len // bytes_per_element if bytes_per_element else 0
+
+            if type_char == "A":
+                value = f.read(val_len).rstrip(b"\x00").decode("ascii", errors="replace")
+            else:
+                value = np.frombuffer(f.read(val_len), dtype=dtype, count=val_count)
+                value = value[0] if value.size == 1 else value.tolist()
+
+            tag = f.read(ltag).decode("ascii", errors="replace") if ltag > 0 else ""
+
+            pad = (8 - ((8 + val_len + ltag) % 8)) % 8
+            if pad:
+                f.read(pad)
+
+            entries.append({"tag": tag, "type": type_char, "value": value, "lkey": lkey, "lext": lext, "ltag": ltag})
+            bytes_remaining -= lkey
+    return entries
+
+
+def legacy_read(path):
+    """Previous header path - read_hcb then a separate per-field extended header pass."""
+    hcb = read_hcb(path)
+    return legacy_parse_extended_header(path, hcb)
+
+
+def best_of(func, path, repeat):
+    """Return the fastest wall time of ``repeat`` calls."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(path)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Blue file header parsing")
+    parser.add_argument("--keywords", type=int, default=20000, help="number of extended header keywords")
+    parser.add_argument("--repeat", type=int, default=5, help="number of timed runs, best is reported")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "lots_of_keywords.tmp")
+        write_keyword_file(path, args.keywords)
+
+        # Both paths must agree before timing means anything
+        assert [e["tag"] for e in legacy_read(path)] == [e["tag"] for e in read_header(path).ext]
+
+        legacy = best_of(legacy_read, path, args.repeat)
+        single = best_of(read_header, path, args.repeat)
+
+    print(f"keywords          : {args.keywords}")
+    print(f"per-field reads   : {legacy * 1e3:9.2f} ms")
+    print(f"single-read buffer: {single * 1e3:9.2f} ms")
+    print(f"speedup           : {legacy / single:9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+
+# Blue file multithreaded transcoding benchmark
+# Builds one large synthetic Blue file and compares serial conversion with
+# conversion of the same file split over a pool of transcoding threads, and
+# checks that both produce the same .sigmf-data hash.
+
+import os
+import sys
+import time
+import hashlib
+import tempfile
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from blue_file_to_sigmf import (  # noqa: E402
+    FORMAT_MAP,
+    normalized_datatype,
+    parse_data_values,
+    read_header,
+)
+from bench_converters import write_blue_file  # noqa: E402
+
+
+def best_of(path, header, datatype, chunk_size, threads, repeat):
+    """Return the fastest wall time of ``repeat`` conversions and the data hash."""
+    timings = []
+    for _ in range(repeat):
+        sha512 = hashlib.sha512()
+        start = time.perf_counter()
+        parse_data_values(path, header.hcb, header.data_endianess, chunk_size, sha512, datatype, threads=threads)
+        timings.append(time.perf_counter() - start)
+    return min(timings), sha512.hexdigest()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark multithreaded Blue payload transcoding")
+    parser.add_argument("--format", default="CI", choices=sorted(FORMAT_MAP), help="Blue data format code")
+    parser.add_argument("--data-rep", default="IEEE", choices=("EEEI", "IEEE"), help="payload byte order")
+    parser.add_argument("--normalize", action="store_true", help="convert to normalized float")
+    parser.add_argument("--size-mb", type=int, default=1024, help="payload size in MB")
+    parser.add_argument("--chunk-size", type=int, default=1024 * 1024, help="samples per segment")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, os.cpu_count()], help="thread counts")
+    parser.add_argument("--repeat", type=int, default=3, help="number of timed runs, best is reported")
+    parser.add_argument("--tmp-dir", help="directory for the synthetic file, defaults to the system temp dir")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.tmp_dir) as temp_dir:
+        path = os.path.join(temp_dir, "threads.tmp")
+        write_blue_file(path, args.format, args.data_rep, 1000, args.size_mb * 1024 * 1024, 0)
+        header = read_header(path)
+        size_mb = header.hcb["data_size"] / 1e6
+        datatype = normalized_datatype(args.format) if args.normalize else None
+
+        print(f"format {args.format} {args.data_rep}, {size_mb:.1f} MB payload, {args.chunk_size} samples per segment")
+        serial_seconds = None
+        serial_hash = None
+        for threads in sorted(set(args.threads)):
+            seconds, digest = best_of(path, header, datatype, args.chunk_size, threads, args.repeat)
+            if serial_seconds is None:
+                serial_seconds, serial_hash = seconds, digest
+            same = "same hash" if digest == serial_hash else "HASH DIFFERS"
+            print(
+                f"{threads:3d} threads: {seconds:7.3f} s  {size_mb / seconds:8.1f} MB/s  "
+                f"x{serial_seconds / seconds:4.2f}  {same}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+
+# Converter benchmark suite
+# Generates synthetic Blue files (every supported format, both endiannesses,
+# type 1000 and 2000, large extended header keyword blocks) and synthetic R&S
+# IQ.TAR archives (with and without a large PreviewData block, which is either
+# skipped or kept), runs the converters on them and reports throughput, the
+# per-stage ConversionStats (wall time, CPU time, bytes read and written) and
+# peak RSS.
+# Each case runs in a fresh worker process so that peak RSS is per case.
+# Results are written as JSON lines, one record per case, so that runs can be
+# compared against a stored baseline to catch regressions.
+#
+# Example:
+#   python benchmarks/bench_converters.py --sizes-mb 1 64 4096 -o results.jsonl
+
+import os
+import sys
+import json
+import time
+import tarfile
+import argparse
+import platform
+import resource
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from blue_file_to_sigmf import FORMAT_MAP, SUPPORTED_TYPES, ConversionStats, blue_file_to_sigmf  # noqa: E402
+from sigmf_to_blue_file import build_extended_header, build_hcb  # noqa: E402
+
+# Elements written per generator chunk
+GENERATE_CHUNK_ELEMENTS = 8 * 1024 * 1024
+
+# Number of elements per frame for the type 2000 cases
+FRAME_SUBSIZE = 16
+
+
+def _write_random_elements(f, dtype, count, rng):
+    """Write ``count`` random elements of ``dtype`` in bounded chunks."""
+    while count > 0:
+        n = min(GENERATE_CHUNK_ELEMENTS, count)
+        if dtype.kind == "f":
+            values = rng.standard_normal(n).astype(dtype)
+        else:
+            values = rng.integers(-100, 100, n).astype(dtype)
+        f.write(values.tobytes())
+        count -= n
+
+
+def write_blue_file(path, data_format, data_rep, file_type, size_bytes, keywords):
+    """
+    Write a synthetic Blue file.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file to write.
+    data_format : str
+        Blue format code, for example 'CI'.
+    data_rep : str
+        'EEEI' or 'IEEE'.
+    file_type : int
+        1000 or 2000.
+    size_bytes : int
+        Approximate payload size in bytes.
+    keywords : int
+        Number of extended header keywords.
+    """
+    endian = "<" if data_rep == "EEEI" else ">"
+    elem_type, elems_per_sample = FORMAT_MAP[data_format]
+    elem_dtype = np.dtype(elem_type).newbyteorder(endian)
+    frame_elems = elems_per_sample * (FRAME_SUBSIZE if file_type == 2000 else 1)
+    elem_count = size_bytes // elem_dtype.itemsize // frame_elems * frame_elems
+    data_size = elem_count * elem_dtype.itemsize
+
+    ext_bytes = build_extended_header(
+        [(f"KEY_{i}", "value" if i % 3 == 0 else (float(i) if i % 3 == 1 else i)) for i in range(keywords)]
+        + [("RF_FREQ", 1e9)],
+        endian,
+    )
+    ext_start = (512 + data_size + 511) // 512
+    fields = {
+        "version": "BLUE",
+        "head_rep": data_rep,
+        "data_rep": data_rep,
+        "ext_start": ext_start,
+        "ext_size": len(ext_bytes),
+        "data_start": 512.0,
+        "data_size": float(data_size),
+        "type": file_type,
+        "format": data_format,
+        "timecode": 2331152000.0,
+    }
+    if file_type == 2000:
+        adjunct = [("d", 0.0), ("d", 1e-3), ("i", 1), ("i", FRAME_SUBSIZE), ("d", 0.0), ("d", 1e-6), ("i", 1)]
+    else:
+        adjunct = [("d", 0.0), ("d", 1e-6), ("i", 1)]
+
+    rng = np.random.default_rng(0)
+    with open(path, "wb") as f:
+        f.write(build_hcb(fields, adjunct, endian))
+        _write_random_elements(f, elem_dtype, elem_count, rng)
+        f.write(b"\x00" * (ext_start * 512 - 512 - data_size))
+        f.write(ext_bytes)
+
+
+def write_iq_tar(path, size_bytes, preview_points):
+    """
+    Write a synthetic R&S IQ.TAR archive with complex float32 samples.
+
+    Parameters
+    ----------
+    path : str
+        Path of the archive to write.
+    size_bytes : int
+        Approximate payload size in bytes.
+    preview_points : int
+        Number of points per PreviewData trace, 0 for no PreviewData.
+    """
+    sample_count = size_bytes // 8
+    data_name = "File.complex.1ch.float32"
+
+    preview = ""
+    if preview_points:
+        floats = "".join(f"<float>{-70.0 - (i % 40) * 0.25}</float>" for i in range(preview_points))
+        trace = f'<ArrayOfFloat length="{preview_points}">{floats}</ArrayOfFloat>'
+        preview = (
+            '<PreviewData><ArrayOfChannel length="1"><Channel><Name>Channel 1</Name>'
+            f"<PowerVsTime><Min>{trace}</Min><Max>{trace}</Max></PowerVsTime>"
+            f"<Spectrum><Min>{trace}</Min><Max>{trace}</Max></Spectrum>"
+            "</Channel></ArrayOfChannel></PreviewData>"
+        )
+    xml = (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<RS_IQ_TAR_FileFormat fileFormatVersion="2">'
+        "<Name>Synthetic</Name><Comment>benchmark</Comment>"
+        f"<Samples>{sample_count}</Samples><Clock unit=\"Hz\">1e6</Clock>"
+        "<Format>complex</Format><DataType>float32</DataType>"
+        '<ScalingFactor unit="V">1</ScalingFactor><NumberOfChannels>1</NumberOfChannels>'
+        f"<DataFilename>{data_name}</DataFilename><UserData></UserData>"
+        "<EpochNanos>1700000000000000000</EpochNanos>"
+        f"{preview}</RS_IQ_TAR_FileFormat>"
+    ).encode("utf-8")
+
+    directory = os.path.dirname(path)
+    data_path = os.path.join(directory, data_name)
+    with open(data_path, "wb") as f:
+        _write_random_elements(f, np.dtype("<f4"), sample_count * 2, np.random.default_rng(0))
+    xml_path = os.path.join(directory, "synthetic.xml")
+    with open(xml_path, "wb") as f:
+        f.write(xml)
+    with tarfile.open(path, "w") as tar:
+        tar.add(xml_path, arcname="synthetic.xml")
+        tar.add(data_path, arcname=data_name)
+    os.remove(data_path)
+    os.remove(xml_path)
+
+
+def _peak_rss_mb():
+    """Peak resident set size of this process in MB (ru_maxrss is KB on Linux, bytes on macOS)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_blue_case(path, chunk_size):
+    """Convert one Blue file and return its timings (runs in a worker process)."""
+    baseline_rss = _peak_rss_mb()
+    stats = ConversionStats()
+    start = time.perf_counter()
+    blue_file_to_sigmf(path, chunk_size=chunk_size, stats=stats)
+    seconds = time.perf_counter() - start
+
+    return {
+        "payload_bytes": stats.stages["data_transcode"]["bytes_read"],
+        "wall_seconds": seconds,
+        "stages": stats.as_dict(),
+        "baseline_rss_mb": baseline_rss,
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+
+
+def run_rohdeschwarz_case(path, preview=False):
+    """Convert one IQ.TAR archive, keeping its PreviewData or not, and return the timings (runs in a worker process)."""
+    # The R&S converter is installed as sigmf.convert.rohdeschwarz in sigmf-python
+    from sigmf.convert.rohdeschwarz import ConversionStats, rohdeschwarz_to_sigmf
+
+    baseline_rss = _peak_rss_mb()
+    stats = ConversionStats()
+    out_path = os.path.join(os.path.dirname(path), "converted")
+    start = time.perf_counter()
+    rohdeschwarz_to_sigmf(path, out_path=out_path, overwrite=True, stats=stats, preview=preview)
+    seconds = time.perf_counter() - start
+
+    return {
+        "payload_bytes": stats.stages["data_transcode"]["bytes_read"],
+        "wall_seconds": seconds,
+        "stages": stats.as_dict(),
+        "baseline_rss_mb": baseline_rss,
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+
+
+def _run_isolated(func, *args):
+    """Run ``func`` in a fresh worker process so its peak RSS is measured on its own."""
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        return executor.submit(func, *args).result()
+
+
+def benchmark_cases(args):
+    """Yield (case description, generator, runner) for the requested cases."""
+    for size_mb in args.sizes_mb:
+        size_bytes = int(size_mb * 1024 * 1024)
+        if "blue" in args.converters:
+            for data_format in sorted(SUPPORTED_TYPES):
+                for data_rep in ("EEEI", "IEEE"):
+                    for file_type in (1000, 2000):
+                        case = {
+                            "converter": "blue",
+                            "format": data_format,
+                            "data_rep": data_rep,
+                            "type": file_type,
+                            "keywords": args.keywords,
+                            "size_mb": size_mb,
+                        }
+                        yield (
+                            case,
+                            lambda path, f=data_format, r=data_rep, t=file_type: write_blue_file(
+                                path, f, r, t, size_bytes, args.keywords
+                            ),
+                            lambda path: _run_isolated(run_blue_case, path, args.chunk_size),
+                            ".tmp",
+                        )
+        if "rohdeschwarz" in args.converters:
+            for preview_points, keep_preview in ((0, False), (args.preview_points, False), (args.preview_points, True)):
+                case = {
+                    "converter": "rohdeschwarz",
+                    "preview_points": preview_points,
+                    "keep_preview": keep_preview,
+                    "size_mb": size_mb,
+                }
+                yield (
+                    case,
+                    lambda path, p=preview_points: write_iq_tar(path, size_bytes, p),
+                    lambda path, k=keep_preview: _run_isolated(run_rohdeschwarz_case, path, k),
+                    ".iq.tar",
+                )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Blue and R&S converters on synthetic data")
+    parser.add_argument("--sizes-mb", type=float, nargs="+", default=[1, 16], help="payload sizes in MB")
+    parser.add_argument("--converters", nargs="+", default=["blue", "rohdeschwarz"], choices=["blue", "rohdeschwarz"])
+    parser.add_argument("--keywords", type=int, default=5000, help="extended header keywords per Blue file")
+    parser.add_argument("--preview-points", type=int, default=20000, help="points per PreviewData trace")
+    parser.add_argument("--chunk-size", type=int, default=1024 * 1024, help="samples per chunk for the Blue converter")
+    parser.add_argument("--tmp-dir", help="directory for the synthetic files, defaults to the system temp dir")
+    parser.add_argument("-o", "--output", help="append JSON-lines results to this file as well as stdout")
+    args = parser.parse_args(argv)
+
+    host = {
+        "machine": platform.machine(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "cpus": os.cpu_count(),
+    }
+    out = open(args.output, "a") if args.output else None
+    failures = 0
+    try:
+        for case, generate, run, suffix in benchmark_cases(args):
+            with tempfile.TemporaryDirectory(dir=args.tmp_dir) as temp_dir:
+                path = os.path.join(temp_dir, "synthetic" + suffix)
+                generate(path)
+                record = dict(case, host=host, timestamp=time.time())
+                try:
+                    result = run(path)
+                except Exception as e:
+                    failures += 1
+                    record["error"] = str(e)
+                else:
+                    record.update(result, mb_per_s=result["payload_bytes"] / 1e6 / result["wall_seconds"])
+            line = json.dumps(record)
+            print(line, flush=True)
+            if out is not None:
+                out.write(line + "\n")
+    finally:
+        if out is not None:
+            out.close()
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
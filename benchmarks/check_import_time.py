@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+
+# Import-time budget check
+# Imports each converter module in a fresh interpreter with -X importtime and
+# fails if its cumulative import time is over budget, or if it pulls in a
+# heavy dependency (NumPy, sigmf, astropy) before any sample data is touched.
+# CI runs it on every push and pull request (.github/workflows/import-time.yml):
+#   python benchmarks/check_import_time.py --budget-scale 1.5
+
+import os
+import re
+import sys
+import argparse
+import subprocess
+
+REPO_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+# Modules that must start without the heavy imports, with their budget in ms.
+# The catalog also pulls in tarfile and the XML parser for IQ.TAR scanning.
+MODULES = {"blue_file_to_sigmf": 50.0, "iq_file_catalog": 80.0}
+HEAVY_MODULES = ("numpy", "sigmf", "astropy")
+
+# '-X importtime' lines look like 'import time:   self [us] | cumulative | name'
+IMPORTTIME_LINE = re.compile(r"^import time:\s+\d+\s+\|\s+(\d+)\s+\|\s+(\S.*)$")
+
+
+def import_time(module, repeat=5):
+    """
+    Measure the import of ``module`` in fresh interpreters.
+
+    Returns
+    -------
+    tuple of (float, list of str)
+        Best cumulative import time in milliseconds, and the heavy modules it imported.
+    """
+    best = None
+    heavy = []
+    check = f"import sys, {module}; print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", check],
+            cwd=REPO_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        for line in result.stderr.splitlines():
+            match = IMPORTTIME_LINE.match(line)
+            if match and match.group(2).strip() == module:
+                micros = int(match.group(1))
+                best = micros if best is None else min(best, micros)
+        heavy = [m for m in result.stdout.strip().split(",") if m]
+    return (best or 0) / 1000.0, heavy
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check the import time of the converter modules")
+    parser.add_argument("--budget-scale", type=float, default=1.0, help="multiply every budget, for slow CI hosts")
+    parser.add_argument("--repeat", type=int, default=5, help="fresh interpreters per module, best is used")
+    args = parser.parse_args(argv)
+
+    failures = 0
+    for module, budget in MODULES.items():
+        budget *= args.budget_scale
+        millis, heavy = import_time(module, args.repeat)
+        ok = millis <= budget and not heavy
+        failures += not ok
+        extra = f"  imports {', '.join(heavy)}" if heavy else ""
+        print(f"{'OK    ' if ok else 'FAILED'} {module}: {millis:.1f} ms (budget {budget:.0f} ms){extra}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,14 +10,23 @@
 # Date: November 12, 2025
 
 import os
+import sys
+import glob
 import json
+import time
 import struct
 import hashlib
-import numpy as np
-from astropy.time import Time
-from sigmf import SigMFFile # Assuming sigmf library is installed
+import logging
+import argparse
+import contextlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 
+# NumPy is imported inside the functions that touch sample data, so that
+# header-only work (catalog scans, NCD metadata, --help) starts quickly
+
+log = logging.getLogger(__name__)
 
 # --- HCB Layout (fixed fields up to adjunct) ---
 HCB_LAYOUT = [
@@ -48,22 +57,327 @@ HCB_LAYOUT = [
     # Adjunct starts at 256
 ]
 
-# --- Extended header type map ---
-TYPE_MAP = {
-    "B": (np.int8,    1),
-    "I": (np.int16,   2),
-    "L": (np.int32,   4),
-    "X": (np.int64,   8),
-    "F": (np.float32, 4),
-    "D": (np.float64, 8),
-    "A": (np.dtype("S1"), 1),
+# --- Extended header type codes: type -> (NumPy type code, bytes) ---
+TYPE_CODES = {
+    "B": ("i1", 1),
+    "I": ("i2", 2),
+    "L": ("i4", 4),
+    "X": ("i8", 8),
+    "F": ("f4", 4),
+    "D": ("f8", 8),
+    "A": ("S1", 1),
 }
 
+# --- Extended header type -> struct format code ---
+STRUCT_CODES = {"B": "b", "I": "h", "L": "i", "X": "q", "F": "f", "D": "d"}
+
 SUPPORTED_TYPES = {'CI', 'CL', 'CF', 'SB', 'SI', 'SL', 'SX', 'SF', 'SD'}
 
+# Default number of samples per chunk when batch converting from the command line
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+# Bytes of output written between checkpoints of a resumable conversion
+CHECKPOINT_INTERVAL = 256 * 1024 * 1024
+
+# File extensions commonly used for Blue files
+BLUE_EXTENSIONS = (".cdif", ".tmp", ".prm", ".blue")
+
+# S - Scalar
+# C-  Complex
+# V - Vector
+# Q-  Quad - TODO: Pri 2 - Add support for other types if they are commonly used.
+
+# B: 8-bit integer
+# I: 16-bit integer
+# L: 32-bit integer
+# X: 64-bit integer
+# F: 32-bit float
+# D: 64-bit float
+
+# --- Global datatype object - little endian---
+DATATYPE_MAP_LE = {
+    "SB": "ri8_le",
+    "SI": "ri16_le",
+    "SL": "ri32_le",
+    "SX": "ri64_le",
+    "SF": "rf32_le",
+    "SD": "rf64_le",
+    "CB": "ci8_le",
+    "CI": "ci16_le",
+    "CL": "ci32_le",
+    "CX": "ci64_le",
+    "CF": "cf32_le",
+    "CD": "cf64_le",
+}
+
+# --- Global datatype object - big endian---
+DATATYPE_MAP_BE = {
+    "SB": "ri8_be",
+    "SI": "ri16_be",
+    "SL": "ri32_be",
+    "SX": "ri64_be",
+    "SF": "rf32_be",
+    "SD": "rf64_be",
+    "CB": "ci8_be",
+    "CI": "ci16_be",
+    "CL": "ci32_be",
+    "CX": "ci64_be",
+    "CF": "cf32_be",
+    "CD": "cf64_be",
+}
+
+# --- Bytes per sample for each SigMF datatype ---
+DATATYPE_SIZES = {
+    "ri8_le": 1,
+    "ri16_le": 2,
+    "ri32_le": 4,
+    "ci16_le": 4,
+    "ci32_le": 8,
+    "cf32_le": 8,
+    "rf32_le": 4,
+    "rf64_le": 8,
+    "ri64_le": 8,
+    "cf64_le": 16,
+    "ri8_be": 1,
+    "ri16_be": 2,
+    "ri32_be": 4,
+    "ci16_be": 4,
+    "ci32_be": 8,
+    "cf32_be": 8,
+    "rf32_be": 4,
+    "rf64_be": 8,
+    "ri64_be": 8,
+    "cf64_be": 16,
+}
+
+# --- Full scale of the integer formats, used to normalize to -1.0 to +1.0 ---
+NORMALIZE_SCALE = {
+    "CI": 32767.0,
+    "CL": 2147483647.0,
+    "SB": 127.0,
+    "SI": 32767.0,
+    "SL": 2147483647.0,
+    "SX": 9223372036854775807.0,
+}
+
+# --- Data format codes: format code -> (NumPy element type code, elements per sample) ---
+FORMAT_CODES = {
+    "CI": ("i2", 2),
+    "CL": ("i4", 2),
+    "CF": ("f4", 2),
+    "SB": ("i1", 1),
+    "SI": ("i2", 1),
+    "SL": ("i4", 1),
+    "SX": ("i8", 1),
+    "SF": ("f4", 1),
+    "SD": ("f8", 1),
+}
+
+
+def __getattr__(name):
+    """
+    Build TYPE_MAP and FORMAT_MAP, which hold NumPy types, on first use.
+
+    They are the NumPy counterparts of TYPE_CODES and FORMAT_CODES. Building
+    them lazily keeps NumPy out of the module import.
+    """
+    if name in ("TYPE_MAP", "FORMAT_MAP"):
+        import numpy as np
+        if name == "TYPE_MAP":
+            # Text keywords keep the dtype, numeric ones the scalar type
+            value = {
+                key: (np.dtype(code) if key == "A" else np.dtype(code).type, size)
+                for key, (code, size) in TYPE_CODES.items()
+            }
+        else:
+            value = {key: (np.dtype(code).type, elems) for key, (code, elems) in FORMAT_CODES.items()}
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 HEADER_SIZE = 512
 BLOCK_SIZE = 512
 
+
+class ConversionStats:
+    """
+    Wall time, CPU time and byte counts for each stage of a conversion.
+
+    Pass an instance to blue_file_to_sigmf() and read ``stages`` afterwards,
+    or give it a callback to be told about every timed section as it ends.
+
+    Parameters
+    ----------
+    callback : callable, optional
+        Called as ``callback(stage_name, record)`` after every timed section,
+        with the running totals of that stage.
+    """
+
+    def __init__(self, callback=None):
+        self.callback = callback
+        self.stages = {}
+
+    def _record(self, name):
+        return self.stages.setdefault(
+            name, {"wall_seconds": 0.0, "cpu_seconds": 0.0, "bytes_read": 0, "bytes_written": 0, "calls": 0}
+        )
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        """
+        Time a section of work and add it to the totals of stage ``name``.
+
+        Yields the stage record so the section can add to its
+        ``bytes_read`` and ``bytes_written`` counts.
+        """
+        record = self._record(name)
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield record
+        finally:
+            record["wall_seconds"] += time.perf_counter() - wall_start
+            record["cpu_seconds"] += time.process_time() - cpu_start
+            record["calls"] += 1
+            if self.callback is not None:
+                self.callback(name, record)
+
+    def add(self, name, wall_seconds=0.0, cpu_seconds=0.0, bytes_read=0, bytes_written=0):
+        """
+        Add a section of work measured elsewhere, for example in a worker
+        thread, to the totals of stage ``name``.
+        """
+        record = self._record(name)
+        record["wall_seconds"] += wall_seconds
+        record["cpu_seconds"] += cpu_seconds
+        record["bytes_read"] += bytes_read
+        record["bytes_written"] += bytes_written
+        record["calls"] += 1
+        if self.callback is not None:
+            self.callback(name, record)
+
+    def as_dict(self):
+        """Stage records as a plain dict, ready to export as JSON."""
+        return {name: dict(record) for name, record in self.stages.items()}
+
+
+def _stage(stats, name):
+    """Time a stage on ``stats``, or do nothing when no stats object was given."""
+    if stats is None:
+        return contextlib.nullcontext({"bytes_read": 0, "bytes_written": 0})
+    return stats.stage(name)
+
+
+class ConversionCheckpoint:
+    """
+    Resumable output of one conversion.
+
+    The data file is written under a temporary name, ``<data file>.partial``,
+    and renamed once it is complete. Every ``interval`` bytes of output the
+    number of samples done and the SHA-512 of the output so far are saved to
+    ``<data file>.checkpoint``, so an interrupted conversion of the same
+    source with the same options continues from there instead of starting
+    again. Hash objects cannot be saved, so on resume the written prefix is
+    read back, hashed and checked against the saved digest.
+
+    Parameters
+    ----------
+    data_path : str
+        Final path of the .sigmf-data file.
+    fingerprint : dict
+        Source fingerprint, see source_fingerprint(). A checkpoint left by a
+        different source or different options is ignored.
+    interval : int, optional
+        Bytes of output between checkpoints, CHECKPOINT_INTERVAL by default.
+    """
+
+    def __init__(self, data_path, fingerprint, interval=None):
+        self.data_path = data_path
+        self.partial_path = f"{data_path}.partial"
+        self.path = f"{data_path}.checkpoint"
+        self.fingerprint = fingerprint
+        self.interval = CHECKPOINT_INTERVAL if interval is None else interval
+        self.sha512 = hashlib.sha512()
+        self.samples_done = 0
+        self.bytes_done = 0
+        self._saved_bytes = 0
+
+    def load(self, stats=None, bufsize=1024*1024):
+        """
+        Continue from the last saved checkpoint, if there is a valid one.
+
+        Returns
+        -------
+        int
+            Number of samples already converted, 0 to start from the beginning.
+        """
+        try:
+            with open(self.path) as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return 0
+        if saved.get("fingerprint") != self.fingerprint:
+            log.debug("Ignoring checkpoint %s left by a different source or options", self.path)
+            return 0
+
+        # Re-hash the prefix the checkpoint covers, so the final hash includes it
+        sha512 = hashlib.sha512()
+        remaining = saved["bytes_done"]
+        try:
+            with _stage(stats, "hashing") as record, open(self.partial_path, "rb") as f:
+                while remaining and (chunk := f.read(min(bufsize, remaining))):
+                    sha512.update(chunk)
+                    remaining -= len(chunk)
+                    record["bytes_read"] += len(chunk)
+        except OSError:
+            return 0
+        if remaining or sha512.hexdigest() != saved["sha512"]:
+            log.debug("Partial output %s does not match its checkpoint, starting again", self.partial_path)
+            return 0
+
+        self.sha512 = sha512
+        self.samples_done = saved["samples_done"]
+        self.bytes_done = self._saved_bytes = saved["bytes_done"]
+        log.debug("Resuming %s after %d samples", self.data_path, self.samples_done)
+        return self.samples_done
+
+    def advance(self, samples, nbytes, out):
+        """
+        Count ``samples`` more converted samples, ``nbytes`` of output that
+        are written to ``out`` (file object or descriptor) and hashed, and
+        save a checkpoint once ``interval`` bytes have accumulated.
+        """
+        self.samples_done += samples
+        self.bytes_done += nbytes
+        if self.bytes_done - self._saved_bytes >= self.interval:
+            self.save(out)
+
+    def save(self, out):
+        """Save a checkpoint of the output written so far to ``out``."""
+        # The checkpoint must never claim data that is not on disk yet
+        if not isinstance(out, int):
+            out.flush()
+            out = out.fileno()
+        os.fsync(out)
+
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump({
+                "fingerprint": self.fingerprint,
+                "samples_done": self.samples_done,
+                "bytes_done": self.bytes_done,
+                "sha512": self.sha512.hexdigest(),
+            }, f)
+        os.replace(temp_path, self.path)
+        self._saved_bytes = self.bytes_done
+
+    def finish(self):
+        """Move the completed output to its final name and drop the checkpoint."""
+        os.replace(self.partial_path, self.data_path)
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self.path)
+
 #  TODO: Look at this code and see if can be improved and possibly simplified. 
 def detect_endian(data, layout, probe_fields=("data_size", "version")):
     """
@@ -83,12 +397,19 @@ def detect_endian(data, layout, probe_fields=("data_size", "version")):
         "<" for little-endian or ">" for big-endian.
     """
     
-    # TODO: handle both types of endianess 'EEEI' or IEEE and data rep and signal rep
-    endianness = data[8:12].decode('utf-8') 
-    print('Endianness: ', endianness)
+    # data_rep only describes the payload - the header itself follows head_rep
+    endianness = data[8:12].decode('utf-8', errors='replace')
+    log.debug("Endianness: %s", endianness)
     if endianness not in ('EEEI', 'IEEE'):
        raise ValueError(f"Unexpected endianness: {endianness}")    
-    
+
+    header_endianness = data[4:8].decode('utf-8', errors='replace')
+    if header_endianness == 'EEEI':
+        return "<"
+    if header_endianness == 'IEEE':
+        return ">"
+
+    # Unknown head_rep - probe fields for sane values instead
     for endian in ("<", ">"):
         ok = True
         for name, offset, size, fmt, desc in layout:
@@ -117,6 +438,59 @@ def detect_endian(data, layout, probe_fields=("data_size", "version")):
     return "<"
 
 
+def _parse_hcb(data):
+    """Decode HCB fields and adjunct block from the 512-byte header buffer.
+
+    Parameters
+    ----------
+    data : bytes
+        Raw header data.
+
+    Returns
+    -------
+    dict
+        Parsed HCB fields and adjunct metadata.
+    """
+    if len(data) < HEADER_SIZE:
+        raise ValueError("Incomplete header")
+
+    hcb = {}
+    endian = detect_endian(data, HCB_LAYOUT)
+
+    # Fixed fields
+    for name, offset, size, fmt, desc in HCB_LAYOUT:
+        try:
+            val = struct.unpack_from(endian + fmt, data, offset)[0]
+        except struct.error:
+            raise ValueError(f"Failed to unpack field {name} with endian {endian}")
+        if isinstance(val, bytes):
+            val = val.decode("ascii", errors="replace").strip("\x00 ")
+        hcb[name] = val
+
+    # Adjunct parsing
+    ADJUNCT_OFFSET = 256
+    if hcb["type"] in (1000, 1001):
+        xstart, xdelta, xunits = struct.unpack_from(f"{endian}ddi", data, ADJUNCT_OFFSET)
+        hcb["adjunct"] = {"xstart": xstart, "xdelta": xdelta, "xunits": xunits}
+    elif hcb["type"] == 2000:
+        xstart, xdelta, xunits, subsize, ystart, ydelta, yunits = struct.unpack_from(
+            f"{endian}ddiiddi", data, ADJUNCT_OFFSET
+        )
+        hcb["adjunct"] = {
+            "xstart": xstart,
+            "xdelta": xdelta,
+            "xunits": xunits,
+            "subsize": subsize,
+            "ystart": ystart,
+            "ydelta": ydelta,
+            "yunits": yunits,
+        }
+    else:
+        hcb["adjunct_raw"] = bytes(data[ADJUNCT_OFFSET:HEADER_SIZE])
+
+    return hcb
+
+
 def read_hcb(file_path):
     """Read HCB fields and adjunct block from a Blue file.
 
@@ -130,48 +504,63 @@ def read_hcb(file_path):
     dict
         Parsed HCB fields and adjunct metadata.
     """
-    
-    hcb = {}
     with open(file_path, "rb") as f:
-        data = f.read(HEADER_SIZE)
-        endian = detect_endian(data, HCB_LAYOUT)
+        return _parse_hcb(f.read(HEADER_SIZE))
 
-        # Fixed fields
-        for name, offset, size, fmt, desc in HCB_LAYOUT:
-            raw = data[offset:offset+size]
-            try:
-                val = struct.unpack(endian + fmt, raw)[0]
-            except struct.error:
-                raise ValueError(f"Failed to unpack field {name} with endian {endian}")
-            # Unpack based on format
-            val = struct.unpack(endian+fmt, raw)[0]
-            if isinstance(val, bytes):
-                val = val.decode("ascii", errors="replace").strip("\x00 ")
-            hcb[name] = val
-
-        # Adjunct parsing
-        ADJUNCT_OFFSET = 256
-        f.seek(ADJUNCT_OFFSET)
-        if hcb["type"] in (1000, 1001):
-            hcb["adjunct"] = {
-                "xstart": struct.unpack(f"{endian}d", f.read(8))[0],
-                "xdelta": struct.unpack(f"{endian}d", f.read(8))[0],
-                "xunits": struct.unpack(f"{endian}i", f.read(4))[0],
-            }
-        elif hcb["type"] == 2000:
-            hcb["adjunct"] = {
-                "xstart": struct.unpack(f"{endian}d", f.read(8))[0],
-                "xdelta": struct.unpack(f"{endian}d", f.read(8))[0],
-                "xunits": struct.unpack(f"{endian}i", f.read(4))[0],
-                "subsize": struct.unpack(f"{endian}i", f.read(4))[0],
-                "ystart": struct.unpack(f"{endian}d", f.read(8))[0],
-                "ydelta": struct.unpack(f"{endian}d", f.read(8))[0],
-                "yunits": struct.unpack(f"{endian}i", f.read(4))[0],
-            }
+
+def _parse_extended_header_buffer(buf, endian="<"):
+    """Decode extended header keyword records from an in-memory buffer.
+
+    Parameters
+    ----------
+    buf : bytes
+        The whole extended header block (``ext_size`` bytes).
+    endian : str, optional
+        Endianness ('<' for little-endian, '>' for big-endian).
+
+    Returns
+    -------
+    list of dict
+        List of dictionaries containing parsed records.
+    """
+    buf = bytes(buf)
+    buf_len = len(buf)
+    record_header = struct.Struct(f"{endian}ihbc")
+    entries = []
+    offset = 0
+    while offset + record_header.size <= buf_len:
+        lkey, lext, ltag, type_code = record_header.unpack_from(buf, offset)
+        if lkey <= 0:
+            raise ValueError(f"Invalid extended header record length: {lkey}")
+        type_char = type_code.decode("ascii", errors="replace")
+
+        val_len = lkey - lext
+        val_offset = offset + record_header.size
+        tag_offset = val_offset + val_len
+        if tag_offset + max(ltag, 0) > buf_len:
+            raise ValueError("Unexpected end of extended header")
+
+        code = STRUCT_CODES.get(type_char)
+        if code is not None:
+            val_count = val_len // TYPE_CODES[type_char][1]
+            value = struct.unpack_from(f"{endian}{val_count}{code}", buf, val_offset)
+            if len(value) == 1:
+                value = value[0]
+            else:
+                value = list(value)
         else:
-            hcb["adjunct_raw"] = f.read(ADJUNCT_OFFSET)
+            value = buf[val_offset:tag_offset].rstrip(b"\x00").decode("ascii", errors="replace")
+
+        tag = buf[tag_offset:tag_offset + ltag].decode("ascii", errors="replace") if ltag > 0 else ""
 
-    return hcb 
+        entries.append({
+            "tag": tag, "type": type_char, "value": value,
+            "lkey": lkey, "lext": lext, "ltag": ltag
+        })
+        # lkey covers the whole record including padding to an 8-byte boundary
+        offset += lkey
+
+    return entries
 
 
 def parse_extended_header(file_path, hcb, endian="<"):
@@ -193,219 +582,752 @@ def parse_extended_header(file_path, hcb, endian="<"):
     """
     if hcb["ext_size"] <= 0:
         return []
-    entries = []
     with open(file_path, "rb") as f:
         f.seek(int(hcb["ext_start"]) * BLOCK_SIZE)
-        bytes_remaining = int(hcb["ext_size"])
-        while bytes_remaining > 0:
-            lkey = struct.unpack(f"{endian}i", f.read(4))[0]
-            lext = struct.unpack(f"{endian}h", f.read(2))[0]
-            ltag = struct.unpack(f"{endian}b", f.read(1))[0]
-            type_char = f.read(1).decode("ascii", errors="replace")
-
-            dtype, bytes_per_element = TYPE_MAP.get(type_char, (np.dtype("S1"), 1))
-            val_len = lkey - lext
-            val_count = val_len // bytes_per_element if bytes_per_element else 0
-
-            if type_char == "A":
-                raw = f.read(val_len)
-                if len(raw) < val_len:
-                    raise ValueError("Unexpected end of extended header")
-                value = raw.rstrip(b"\x00").decode("ascii", errors="replace")
-            else:
-                value = np.frombuffer(f.read(val_len), dtype=dtype, count=val_count)
-                if value.size == 1:
-                    value = value[0]
-                else:
-                    value = value.tolist()
+        return _parse_extended_header_buffer(f.read(int(hcb["ext_size"])), endian)
 
-            tag = f.read(ltag).decode("ascii", errors="replace") if ltag > 0 else ""
 
-            total = 4+2+1+1+val_len+ltag
-            pad = (8 - (total % 8)) % 8
-            if pad: f.read(pad)
+class BlueHeader:
+    """
+    Parsed Blue file header shared by every conversion stage.
 
-            entries.append({
-                "tag": tag, "type": type_char, "value": value,
-                "lkey": lkey, "lext": lext, "ltag": ltag
-            })
-            bytes_remaining -= lkey
+    Parameters
+    ----------
+    hcb : dict
+        Header Control Block from read_hcb().
+    ext : list of dict
+        Extended header entries from parse_extended_header().
+    sha256 : str, optional
+        SHA-256 hex digest of the raw HCB and extended header bytes.
+    """
 
-    return entries
+    def __init__(self, hcb, ext, sha256=None):
+        self.hcb = hcb
+        self.ext = ext
+        self.sha256 = sha256
+
+    @property
+    def header_endianess(self):
+        """Endianness of the HCB and extended header, from ``head_rep``."""
+        # head_rep  : 'EEEI' or 'IEEE' # Little or big extended header endianess representation
+        head_rep = self.hcb.get("head_rep")
+        if head_rep == "EEEI":
+            return "<"
+        if head_rep == "IEEE":
+            return ">"
+        raise ValueError(f"Unknown head_rep value: {head_rep}")
+
+    @property
+    def data_endianess(self):
+        """Endianness of the data payload, from ``data_rep``."""
+        # data_rep  : 'EEEI' or 'IEEE' # Little or big data endianess representation
+        return "<" if self.hcb.get("data_rep") == "EEEI" else ">"
+
+
+def read_header(file_path, stats=None):
+    """
+    Read the HCB and the whole extended header of a Blue file in one pass.
 
+    The extended header block is read with a single call and decoded from
+    memory, instead of issuing several small reads per keyword.
 
-def parse_data_values(file_path,hcb,endianess):
+    Parameters
+    ----------
+    file_path : str
+        Path to the Blue file.
+    stats : ConversionStats, optional
+        Records the 'header_parse' and 'extended_header_parse' stages.
+
+    Returns
+    -------
+    BlueHeader
+        Parsed header.
     """
-    Parse key HCB values used for further processing.
+    with open(file_path, "rb") as f:
+        with _stage(stats, "header_parse") as record:
+            data = f.read(HEADER_SIZE)
+            hcb = _parse_hcb(data)
+            record["bytes_read"] += HEADER_SIZE
+            header = BlueHeader(hcb, [])
+            ext_endianess = header.header_endianess
+            header_hash = hashlib.sha256(data)
+        if hcb["ext_size"] > 0:
+            with _stage(stats, "extended_header_parse") as record:
+                f.seek(int(hcb["ext_start"]) * BLOCK_SIZE)
+                buf = f.read(int(hcb["ext_size"]))
+                record["bytes_read"] += len(buf)
+                header.ext = _parse_extended_header_buffer(buf, ext_endianess)
+                header_hash.update(buf)
+    header.sha256 = header_hash.hexdigest()
+    return header
+
+
+def source_fingerprint(file_path, header, options=None):
+    """
+    Fingerprint a Blue file so that a later run can tell whether it changed.
 
     Parameters
     ----------
     file_path : str
         Path to the Blue file.
+    header : BlueHeader
+        Header from read_header().
+    options : dict, optional
+        Conversion options that change the output. A conversion with other
+        options does not match.
+
+    Returns
+    -------
+    dict
+        Size, modification time, header hash and options, as stored in
+        ``core:blue_source_fingerprint``.
+    """
+    stat = os.stat(file_path)
+    return {
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "header_sha256": header.sha256,
+        "options": options or {},
+    }
+
+
+def is_up_to_date(meta_path, fingerprint, data_path=None):
+    """
+    Check whether an existing conversion was made from the same source with the same options.
+
+    Parameters
+    ----------
+    meta_path : str
+        Path to the .sigmf-meta file.
+    fingerprint : dict
+        Fingerprint of the source, see source_fingerprint().
+    data_path : str, optional
+        .sigmf-data file that must exist as well. Not needed for a
+        Non-Conforming Dataset.
+
+    Returns
+    -------
+    bool
+        True when the conversion can be skipped.
+    """
+    try:
+        with open(meta_path) as f:
+            recorded = json.load(f)["global"].get("core:blue_source_fingerprint")
+    except (OSError, ValueError, KeyError, TypeError):
+        return False
+    return recorded == fingerprint and (data_path is None or os.path.exists(data_path))
+
+
+def native_datatype(hcb):
+    """
+    Look up the SigMF datatype matching the samples stored in a Blue file.
+
+    Parameters
+    ----------
     hcb : dict
         Header Control Block dictionary.
-    endianess : str
-        Endianness ('<' for little-endian, '>' for big-endian).
 
     Returns
     -------
-    numpy.ndarray
-        Parsed samples.
+    str
+        SigMF datatype, for example 'ci16_le', or 'unknown'.
     """
+    # data_rep  : 'EEEI' or 'IEEE' # Little or big data endianess representation
+    data_map = DATATYPE_MAP_LE if hcb.get("data_rep") == "EEEI" else DATATYPE_MAP_BE
+    return data_map.get(hcb.get("format"), "unknown")
 
-    
-    print("===== Parsing blue file data values =====")
-    with open(file_path, "rb") as f:
-        data = f.read(HEADER_SIZE)
-        if len(data) < HEADER_SIZE:
-            raise ValueError("Incomplete header")
-        dtype = data[52:54].decode('utf-8') # eg 'CI', 'CF', 'SD'
-        print('Data type: ', dtype)
-        if dtype not in SUPPORTED_TYPES:
-            raise ValueError(f"Unsupported data type: {dtype}")
-
-        time_interval = np.frombuffer(data[264:272], dtype=np.float64)[0]
-        if time_interval <= 0:
-            raise ValueError(f"Invalid time interval: {time_interval}")
-        sample_rate = 1/time_interval
-        print('Sample rate: ', sample_rate/1e6, 'MHz')
-        extended_header_data_size = int.from_bytes(data[28:32], byteorder='little')
-        filesize = os.path.getsize(file_path)
-        print('File size: ', filesize)
 
-    # Determine destination path for SigMF data file
-    dest_path = file_path.rsplit(".",1)[0]
-  
-    # Complex data parsing
-
-    # complex 16-bit integer  IQ data > ci16_le in SigMF
-    if dtype == 'CI':
-      elem_size = np.dtype(np.int16).itemsize
-      elem_count = (filesize - extended_header_data_size) // elem_size
-      raw_samples = np.fromfile(file_path, dtype=np.int16, offset=HEADER_SIZE, count=elem_count)
-    # Reassemble interleaved IQ samples
-      samples = raw_samples[::2] + 1j*raw_samples[1::2] # convert to IQIQIQ...
-    # Normalize samples to -1.0 to +1.0 range
-      samples = samples.astype(np.float32)  / 32767.0
-    # Save out as SigMF IQ data file
-      samples.tofile(f"{dest_path}.sigmf-data")
-    
-    # complex 32-bit integer  IQ data > ci32_le in SigMF
-    if dtype == 'CL':
-      elem_size = np.dtype(np.int32).itemsize
-      elem_count = (filesize - extended_header_data_size) // elem_size
-      raw_samples = np.fromfile(file_path, dtype=np.int32, offset=HEADER_SIZE, count=elem_count)
-    # Reassemble interleaved IQ samples
-      samples = raw_samples[::2] + 1j*raw_samples[1::2] # convert to IQIQIQ...
-    # Normalize samples to -1.0 to +1.0 range
-      samples = samples.astype(np.float32) / 2147483647.0
-    # Save out as SigMF IQ data file
-      samples.tofile(f"{dest_path}.sigmf-data")
-
-    # complex 32-bit float  IQ data > cf32_le in SigMF
-    if dtype == 'CF':
-      # Each complex sample is 8 bytes total (2 × float32), so np.complex64 is appropriate
-      # No need to reassemble IQ — already complex
-      elem_size=np.dtype(np.complex64).itemsize  # Will be 8 bytes
-      elem_count = (filesize - extended_header_data_size) // elem_size
-      samples = np.fromfile(file_path, dtype=np.complex64, offset=HEADER_SIZE, count=elem_count)
-    # Save out as SigMF IQ data file
-      samples.tofile(f"{dest_path}.sigmf-data")
-     
-    # Scalar data parsing
-
-    # Scalar data parsing > ri8_le in SigMF
-    if dtype == 'SB': 
-      elem_size=np.dtype(np.int8).itemsize 
-      elem_count = (filesize - extended_header_data_size) // elem_size
-      samples = np.fromfile(file_path, dtype=np.int8, offset=HEADER_SIZE, count=elem_count)
-    # Normalize samples to -1.0 to +1.0 range
-      samples = samples.astype(np.float32)  / 127.0
-    # Save out as SigMF IQ data file
-      samples.tofile(f"{dest_path}.sigmf-data")
-
-    # Scalar data parsing > ri16_le in SigMF
-    if dtype == 'SI': 
-      elem_size = np.dtype(np.int16).itemsize
-      elem_count = (filesize - extended_header_data_size) // elem_size
-      samples = np.fromfile(file_path, dtype=np.int16, offset=HEADER_SIZE, count=elem_count)
-    # Normalize samples to -1.0 to +1.0 range
-      samples = samples / 32767.0
-    # Save out as SigMF IQ data file
-      samples.tofile(f"{dest_path}.sigmf-data")
-
-    # Scalar data parsing > ri32_le in SigMF
-    if dtype == 'SL':
-      elem_size=np.dtype(np.int32).itemsize 
-      elem_count = (filesize - extended_header_data_size) // elem_size
-      samples = np.fromfile(file_path, dtype=np.int32, offset=HEADER_SIZE, count=elem_count)
-    # Normalize samples to -1.0 to +1.0 range
-      samples = samples / 2147483647.0
-    # Save out as SigMF IQ data file
-      samples.tofile(f"{dest_path}.sigmf-data")
-
-    # Scalar data parsing > ri64_le in SigMF
-    if dtype == 'SX':
-      elem_size=np.dtype(np.int64).itemsize 
-      elem_count = (filesize - extended_header_data_size) // elem_size
-      samples = np.fromfile(file_path, dtype=np.int64, offset=HEADER_SIZE, count=elem_count)
-    # Save out as SigMF IQ data file
-      samples.tofile(f"{dest_path}.sigmf-data")
-
-    # Scalar data parsing > rf32_le in SigMF
-    if dtype == 'SF':
-      elem_size=np.dtype(np.float32).itemsize 
-      elem_count = (filesize - extended_header_data_size) // elem_size
-      samples = np.fromfile(file_path, dtype=np.float32, offset=HEADER_SIZE, count=elem_count)
-    # Save out as SigMF IQ data file
-    samples.tofile(f"{dest_path}.sigmf-data")
-
-    # Scalar data parsing > rf64_le in SigMF
-    if dtype == 'SD':
-      elem_size=np.dtype(np.float64).itemsize 
-      elem_count = (filesize - extended_header_data_size) // elem_size
-      samples = np.fromfile(file_path, dtype=np.float64, offset=HEADER_SIZE, count=elem_count)
-    # Save out as SigMF IQ data file
-    samples.astype(np.complex64).tofile(f"{dest_path}.sigmf-data")
-
-# TODO: validate handling of scalar types - Reshape per mathlab port shown here?
-
-    """
-
-        # Save out as SigMF IQ data file
-    if dtype in ("CI", "CL", "CF"):
-        # Complex IQ data → save as cf32_le
-        samples.astype(np.complex64).tofile(f"{dest_path}.sigmf-data")
+def resolve_output_datatype(hcb, output_datatype=None):
+    """
+    Validate the requested SigMF datatype for the converted data file.
+
+    Parameters
+    ----------
+    hcb : dict
+        Header Control Block dictionary.
+    output_datatype : str, optional
+        The native datatype in either byte order, for example 'ci16_le' or
+        'ci16_be', keeps the sample values as they are, byte swapping them
+        only if the Blue file uses the other byte order. 'cf32_le' (complex
+        formats) or 'rf32_le' (scalar formats) normalize them to 32-bit float.
+        None selects the little-endian native datatype.
+
+    Returns
+    -------
+    str
+        SigMF datatype of the converted data file.
+    """
+    data_format = hcb["format"]
+    native_le = DATATYPE_MAP_LE.get(data_format, "unknown")
+    native_be = DATATYPE_MAP_BE.get(data_format, "unknown")
+    if output_datatype is None:
+        return native_le
+
+    normalized = normalized_datatype(data_format)
+    if output_datatype not in (native_le, native_be, normalized):
+        raise ValueError(
+            f"Unsupported output datatype {output_datatype} for Blue format {data_format}, "
+            f"expected {native_le}, {native_be} or {normalized}"
+        )
+    return output_datatype
+
+
+def normalized_datatype(data_format):
+    """Return the 32-bit float SigMF datatype for a Blue data format code."""
+    return "cf32_le" if data_format.startswith("C") else "rf32_le"
+
+
+def frame_size(hcb):
+    """
+    Number of elements per frame of a type 2000 Blue file.
+
+    Parameters
+    ----------
+    hcb : dict
+        Header Control Block dictionary.
+
+    Returns
+    -------
+    int
+        The adjunct ``subsize``, or 0 for files that are not framed.
+    """
+    if hcb.get("type") != 2000:
+        return 0
+    return max(int(hcb.get("adjunct", {}).get("subsize", 0)), 0)
+
+
+def first_sample_timecode(hcb):
+    """
+    Time of the first sample of a Blue file, in seconds since January 1st 1950.
+
+    The first sample sits at the HCB timecode plus the adjunct start of the
+    time axis: xstart, or ystart between the frames of a type 2000 file.
+
+    Parameters
+    ----------
+    hcb : dict
+        Header Control Block dictionary.
+
+    Returns
+    -------
+    float
+        Blue timecode of the first sample.
+    """
+    time_axis = "ystart" if frame_size(hcb) else "xstart"
+    return hcb.get("timecode", 0.0) + hcb.get("adjunct", {}).get(time_axis, 0.0)
+
+
+def sample_window(hcb, start=None, count=None, start_time=None, duration=None):
+    """
+    Resolve a sample range or a time window to a first sample and a count.
+
+    Samples are Blue samples for type 1000 files and whole frames for type
+    2000 files. The start may be given as a sample or a time, and the length
+    as a count or a duration. Times are resolved through the adjunct xstart/xdelta, or
+    ystart/ydelta between the frames of a type 2000 file.
+
+    Parameters
+    ----------
+    hcb : dict
+        Header Control Block dictionary.
+    start, count : int, optional
+        First sample and number of samples. count None runs to the end.
+    start_time : float or datetime.datetime, optional
+        Time of the first sample, either on the adjunct axis (usually
+        seconds) or as an absolute timezone-aware datetime, which is resolved
+        against the HCB timecode plus the adjunct start.
+    duration : float, optional
+        Length of the window in adjunct units.
+
+    Returns
+    -------
+    tuple of (int, int or None)
+        First sample and number of samples.
+
+    Raises
+    ------
+    ValueError
+        If the window is inconsistent or starts before the first sample.
+    """
+    if start_time is not None and start is not None:
+        raise ValueError("Give either start or start_time, not both")
+    if duration is not None and count is not None:
+        raise ValueError("Give either count or duration, not both")
+    if start_time is None and duration is None:
+        return _window_start(start or 0), count
+
+    adjunct = hcb.get("adjunct", {})
+    if frame_size(hcb):
+        origin, spacing = adjunct.get("ystart", 0.0), adjunct.get("ydelta", 0.0)
+    else:
+        origin, spacing = adjunct.get("xstart", 0.0), adjunct.get("xdelta", 0.0)
+    if spacing <= 0:
+        raise ValueError(f"Invalid time interval: {spacing}")
+
+    start = start or 0
+    if isinstance(start_time, datetime):
+        # Blue timecodes count from 1950, 631152000 seconds before the POSIX epoch
+        elapsed = start_time.timestamp() + 631152000 - first_sample_timecode(hcb)
+        start = int(round(elapsed / spacing))
+    elif start_time is not None:
+        start = int(round((start_time - origin) / spacing))
+    if duration is not None:
+        count = int(round(duration / spacing))
+    return _window_start(start), count
+
+
+def _window_start(start):
+    """Check that a window does not start before the first sample, which would shift it later than asked."""
+    if start < 0:
+        raise ValueError(f"Window starts {-start} samples before the first sample of the file")
+    return start
+
+
+def window_hcb(hcb, start=0, count=None):
+    """
+    Narrow an HCB to a range of samples, so that only that range is converted.
+
+    Parameters
+    ----------
+    hcb : dict
+        Header Control Block dictionary.
+    start : int, optional
+        First sample (whole frame for type 2000 files) to keep.
+    count : int, optional
+        Number of samples to keep. None keeps everything from ``start``.
+
+    Returns
+    -------
+    dict
+        Copy of the HCB whose data_start, data_size and adjunct start
+        describe only the window. The timecode is kept, so the window starts
+        at the timecode plus the new adjunct start.
+    """
+    data_format = hcb["format"]
+    if data_format not in FORMAT_CODES:
+        raise ValueError(f"Unsupported data type: {data_format}")
+    elems_per_sample = FORMAT_CODES[data_format][1]
+    subsize = frame_size(hcb)
+    unit_bytes = TYPE_CODES[data_format[1]][1] * elems_per_sample * (subsize or 1)
+
+    total = int(hcb["data_size"]) // unit_bytes
+    if start < 0 or start > total:
+        raise ValueError(f"Start sample {start} outside of payload with {total} samples")
+    count = total - start if count is None else max(min(count, total - start), 0)
+
+    adjunct = dict(hcb.get("adjunct", {}))
+    axis = "y" if subsize else "x"
+    spacing = adjunct.get(f"{axis}delta", 0.0)
+    if f"{axis}start" in adjunct:
+        adjunct[f"{axis}start"] += start * spacing
+
+    windowed = dict(hcb)
+    windowed["data_start"] = hcb["data_start"] + start * unit_bytes
+    windowed["data_size"] = float(count * unit_bytes)
+    if "adjunct" in hcb:
+        windowed["adjunct"] = adjunct
+    return windowed
+
+
+def clip_annotations(annotations, start, count):
+    """
+    Keep only the part of each annotation that falls inside a sample window.
+
+    Parameters
+    ----------
+    annotations : list of dict
+        SigMF annotations with absolute ``core:sample_start`` indices.
+    start, count : int
+        Window of samples ``[start, start + count)`` that the dataset holds.
+
+    Returns
+    -------
+    list of dict
+        Annotations trimmed to the window. Those entirely outside it are dropped.
+    """
+    end = start + count
+    clipped = []
+    for annotation in annotations:
+        first = annotation["core:sample_start"]
+        last = first + annotation.get("core:sample_count", 0)
+        if first >= end or (first < start and last <= start):
+            continue
+        annotation = dict(annotation, **{"core:sample_start": max(first, start)})
+        if "core:sample_count" in annotation:
+            annotation["core:sample_count"] = min(last, end) - annotation["core:sample_start"]
+        clipped.append(annotation)
+    return clipped
+
+
+def _transcode_samples(raw, data_format, normalize=False, byte_order="<"):
+    """
+    Convert a block of raw Blue elements to the SigMF output representation.
+
+    Parameters
+    ----------
+    raw : numpy.ndarray
+        Raw elements as read from the Blue payload, typed with the payload
+        byte order. Must be writable if the elements need byte swapping.
+    data_format : str
+        Blue data format code, for example 'CI' or 'SD'.
+    normalize : bool, optional
+        When True, convert to little-endian 32-bit float, scaling integers to
+        the -1.0 to +1.0 range. Otherwise the elements are passed through.
+    byte_order : str, optional
+        Byte order ('<' or '>') of passed through elements. They are byte
+        swapped in place if the payload uses the other order.
+
+    Returns
+    -------
+    numpy.ndarray
+        Samples ready to be written to the .sigmf-data file.
+    """
+    if normalize:
+        # astype takes care of the payload byte order
+        samples = raw.astype("<f4")
+        scale = NORMALIZE_SCALE.get(data_format)
+        if scale is not None:
+            samples /= scale
     else:
-        # Scalar data → save in native dtype
-        samples.tofile(f"{dest_path}.sigmf-data")
+        samples = raw
+        out_dtype = raw.dtype.newbyteorder(byte_order)
+        if out_dtype != raw.dtype:
+            samples = raw.byteswap(inplace=True).view(out_dtype)
+
+    # complex IQ data - already IQIQIQ... so no need to reassemble
+    if data_format == 'CF' or (normalize and data_format.startswith("C")):
+        return samples.view(samples.dtype.str[0] + "c8")
+    return samples
+
+
+def _read_exact(f, buf):
     """
+    Fill ``buf`` from ``f``, looping over the short reads that pipes and sockets return.
+
+    Returns
+    -------
+    int
+        Number of bytes read, less than ``len(buf)`` only at end of stream.
+    """
+    filled = 0
+    while filled < len(buf):
+        n = f.readinto(buf[filled:])
+        if not n:
+            break
+        filled += n
+    return filled
 
-# TODO: validate handling of scalar types - Reshape per mathlab port shown here?
 
+def _transcode_payload(f_in, f_out, elem_dtype, data_format, normalize, byte_order, sample_count, chunk_size,
+                       sha512=None, stats=None, subsize=0, checkpoint=None):
     """
-            fmt_size_char = self.hcb["format"][0]
-            fmt_type_char = self.hcb["format"][1]
+    Transcode Blue samples from ``f_in`` to ``f_out`` in chunks of ``chunk_size`` samples.
 
-            elementsPerSample = self.FormatSize(fmt_size_char)
-            print('Elements Per Sample', elementsPerSample/1e6)
-            elem_count_per_sample = (
-                np.prod(elementsPerSample) if isinstance(elementsPerSample, (tuple, list)) else elementsPerSample
-            )
+    Parameters
+    ----------
+    f_in, f_out : file objects
+        Binary input positioned at the first sample, and the SigMF data output.
+    elem_dtype : numpy.dtype
+        Element type of the payload including its byte order.
+    data_format : str
+        Blue data format code.
+    normalize : bool
+        Convert to normalized float, see _transcode_samples().
+    byte_order : str
+        Byte order of passed through samples.
+    sample_count : int or None
+        Number of samples to convert, or None to read until end of stream.
+    chunk_size : int
+        Samples per chunk. For type 2000 this must be a whole number of frames.
+    sha512 : hashlib object, optional
+        Updated with every chunk as it is written.
+    stats : ConversionStats, optional
+        Records the 'data_transcode' and 'hashing' stages.
+    subsize : int, optional
+        Frame size of type 2000 data. A trailing partial frame at end of
+        stream is dropped.
+    checkpoint : ConversionCheckpoint, optional
+        Advanced after every chunk, so that an interrupted conversion can
+        resume. ``sha512`` must be its hash.
+
+    Returns
+    -------
+    tuple of (int, numpy.ndarray)
+        Number of samples written and the last chunk of samples.
+    """
+    import numpy as np
+
+    elems_per_sample = FORMAT_CODES[data_format][1]
+    sample_bytes = elem_dtype.itemsize * elems_per_sample
+
+    # One reusable, writable read buffer so byte swapping can happen in place
+    buffer_samples = chunk_size if sample_count is None else min(chunk_size, sample_count)
+    buffer = memoryview(bytearray(buffer_samples * sample_bytes))
+
+    samples = _transcode_samples(np.empty(0, dtype=elem_dtype), data_format, normalize, byte_order)
+    samples_written = 0
+    end_of_stream = False
+    while not end_of_stream and (sample_count is None or samples_written < sample_count):
+        count = chunk_size if sample_count is None else min(chunk_size, sample_count - samples_written)
+        with _stage(stats, "data_transcode") as record:
+            raw = buffer[:count * sample_bytes]
+            nbytes = _read_exact(f_in, raw)
+            record["bytes_read"] += nbytes
+            if nbytes < len(raw):
+                if sample_count is not None:
+                    raise ValueError("Unexpected end of data")
+                # End of stream - keep only whole samples, and whole frames for type 2000
+                end_of_stream = True
+                count = nbytes // sample_bytes
+                if subsize and count % subsize:
+                    log.debug("Dropping %d samples of a trailing partial frame", count % subsize)
+                    count -= count % subsize
+                raw = raw[:count * sample_bytes]
+            if count == 0:
+                break
+            samples = _transcode_samples(np.frombuffer(raw, dtype=elem_dtype), data_format, normalize, byte_order)
+            # Save out as SigMF IQ data file
+            f_out.write(samples)
+            record["bytes_written"] += samples.nbytes
+        if sha512 is not None:
+            with _stage(stats, "hashing") as record:
+                sha512.update(samples)
+                record["bytes_read"] += samples.nbytes
+        samples_written += count
+        if checkpoint is not None:
+            checkpoint.advance(count, samples.nbytes, f_out)
+    return samples_written, samples
+
+
+def _transcode_segment(fd_in, fd_out, in_offset, out_offset, nbytes, elem_dtype, data_format, normalize, byte_order):
+    """
+    Transcode one segment of the payload with positional reads and writes (runs in a worker thread).
+
+    Returns
+    -------
+    tuple of (numpy.ndarray, float, float)
+        The transcoded samples, and the wall and thread CPU seconds spent.
+    """
+    import numpy as np
+
+    wall_start = time.perf_counter()
+    cpu_start = time.thread_time()
+
+    raw = bytearray(nbytes)
+    view = memoryview(raw)
+    filled = 0
+    while filled < nbytes:
+        n = os.preadv(fd_in, [view[filled:]], in_offset + filled)
+        if n == 0:
+            raise ValueError("Unexpected end of data")
+        filled += n
+
+    samples = _transcode_samples(np.frombuffer(raw, dtype=elem_dtype), data_format, normalize, byte_order)
 
-            dtype_str, elem_bytes = self.FormatType(fmt_type_char)
-            bytesPerSample = int(elem_bytes) * int(elem_count_per_sample)
+    out = memoryview(samples).cast("B")
+    written = 0
+    while written < len(out):
+        written += os.pwrite(fd_out, out[written:], out_offset + written)
 
-            bytesRead = int(self.dataOffset - self.hcb["data_start"])
-            bytes_remaining = int(self.hcb["data_size"] - bytesRead)
+    return samples, time.perf_counter() - wall_start, time.thread_time() - cpu_start
 
+
+def _transcode_parallel(file_path, data_path, data_start, elem_dtype, data_format, normalize, byte_order,
+                        sample_count, chunk_size, threads, sha512=None, stats=None, first_sample=0, checkpoint=None):
+    """
+    Transcode the payload in segments of ``chunk_size`` samples on a pool of threads.
+
+    Each worker reads its segment with os.preadv and writes it with os.pwrite
+    at its own offset of the output, so the output is byte-identical to a
+    serial conversion. NumPy releases the GIL while casting and byte
+    swapping, so the segments convert in parallel. The SHA-512 is updated
+    with the segments in file order on the calling thread, which keeps the
+    hash the same as a serial conversion, and overlaps with the workers.
+    When resuming from ``first_sample`` the output written before it is kept,
+    and ``checkpoint`` is advanced as the segments are hashed in order.
+
+    Returns
+    -------
+    numpy.ndarray
+        The last segment of samples.
     """
+    import numpy as np
 
-   # Return the IQ data if needed for further processing if needed 
+    elems_per_sample = FORMAT_CODES[data_format][1]
+    sample_bytes = elem_dtype.itemsize * elems_per_sample
+    probe = _transcode_samples(np.zeros(elems_per_sample, dtype=elem_dtype), data_format, normalize, byte_order)
+    out_sample_bytes = probe.nbytes
+
+    samples = probe[:0]
+    fd_in = os.open(file_path, os.O_RDONLY)
+    try:
+        fd_out = os.open(data_path, os.O_WRONLY | os.O_CREAT | (0 if first_sample else os.O_TRUNC), 0o666)
+        try:
+            os.ftruncate(fd_out, sample_count * out_sample_bytes)
+            with ThreadPoolExecutor(max_workers=threads) as executor:
+                # Keep a bounded number of segments in flight so memory stays proportional to threads * chunk_size
+                pending = deque()
+                for first in range(first_sample, sample_count, chunk_size):
+                    count = min(chunk_size, sample_count - first)
+                    pending.append((count, executor.submit(
+                        _transcode_segment, fd_in, fd_out, data_start + first * sample_bytes,
+                        first * out_sample_bytes, count * sample_bytes, elem_dtype, data_format, normalize, byte_order,
+                    )))
+                    while len(pending) > 2 * threads or (pending and first + count >= sample_count):
+                        count, future = pending.popleft()
+                        samples, wall_seconds, cpu_seconds = future.result()
+                        if stats is not None:
+                            stats.add("data_transcode", wall_seconds, cpu_seconds,
+                                      count * sample_bytes, samples.nbytes)
+                        if sha512 is not None:
+                            with _stage(stats, "hashing") as record:
+                                sha512.update(samples)
+                                record["bytes_read"] += samples.nbytes
+                        if checkpoint is not None:
+                            checkpoint.advance(count, samples.nbytes, fd_out)
+        finally:
+            os.close(fd_out)
+    finally:
+        os.close(fd_in)
     return samples
 
 
-def blue_to_sigmf(hcb, ext_entries, file_path):
+def parse_data_values(file_path, hcb, endianess, chunk_size=None, sha512=None, output_datatype=None, stats=None,
+                      threads=1, checkpoint=None):
+    """
+    Convert the Blue data payload to a SigMF data file.
+
+    The payload is read, transcoded and written in chunks of ``chunk_size``
+    samples so that peak memory does not depend on the size of the file.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the Blue file.
+    hcb : dict
+        Header Control Block dictionary.
+    endianess : str
+        Endianness ('<' for little-endian, '>' for big-endian).
+    chunk_size : int, optional
+        Number of samples to convert per chunk. When None the whole payload
+        is converted in a single chunk. Type 2000 files are chunked on whole
+        frames of ``subsize`` samples.
+    sha512 : hashlib object, optional
+        Updated with every chunk as it is written, so the SigMF data file
+        hash is available without reading the output back.
+    output_datatype : str, optional
+        SigMF datatype to write, see resolve_output_datatype(). By default
+        the samples are written in their native datatype.
+    stats : ConversionStats, optional
+        Records the 'data_transcode' and 'hashing' stages.
+    threads : int, optional
+        When greater than 1, chunks are transcoded in parallel on this many
+        threads with positional reads and writes. The output and its hash
+        are identical to a serial conversion.
+    checkpoint : ConversionCheckpoint, optional
+        Write to the checkpoint's temporary file, continue after the samples
+        it has already converted and save progress as the data is written.
+        ``sha512`` must be the checkpoint's hash.
+
+    Returns
+    -------
+    numpy.ndarray
+        Parsed samples as written, with integer IQ data interleaved IQIQIQ...
+        When streaming in chunks this is a read-only memory map of the
+        written .sigmf-data file.
+    """
+    import numpy as np
+
+    log.debug("===== Parsing blue file data values =====")
+    dtype = hcb["format"] # eg 'CI', 'CF', 'SD'
+    log.debug("Data type: %s", dtype)
+    if dtype not in SUPPORTED_TYPES:
+        raise ValueError(f"Unsupported data type: {dtype}")
+
+    time_interval = hcb.get("adjunct", {}).get("xdelta", 0)
+    if time_interval <= 0:
+        raise ValueError(f"Invalid time interval: {time_interval}")
+    sample_rate = 1/time_interval
+    log.debug("Sample rate: %s MHz", sample_rate/1e6)
+    filesize = os.path.getsize(file_path)
+    log.debug("File size: %d", filesize)
+
+    if chunk_size is not None and chunk_size <= 0:
+        raise ValueError(f"Invalid chunk size: {chunk_size}")
+
+    datatype = resolve_output_datatype(hcb, output_datatype)
+    normalize = datatype not in (DATATYPE_MAP_LE[dtype], DATATYPE_MAP_BE[dtype])
+    byte_order = ">" if datatype.endswith("_be") else "<"
+
+    # Only read the payload the HCB describes - never the extended header behind it
+    data_start = int(hcb["data_start"])
+    data_size = min(int(hcb["data_size"]), filesize - data_start)
+
+    elem_type, elems_per_sample = FORMAT_CODES[dtype]
+    elem_dtype = np.dtype(elem_type).newbyteorder(endianess)
+    sample_bytes = elem_dtype.itemsize * elems_per_sample
+    sample_count = data_size // sample_bytes
+
+    # Type 2000 files hold frames of subsize elements - only ever convert and chunk whole frames
+    subsize = frame_size(hcb)
+    if subsize:
+        partial = sample_count % subsize
+        if partial:
+            log.debug("Dropping %d samples of a trailing partial frame", partial)
+        sample_count -= partial
+        if chunk_size is not None:
+            chunk_size = max(chunk_size // subsize, 1) * subsize
+
+    if chunk_size is None:
+        chunk_size = max(sample_count, 1)
+
+    # Determine destination path for SigMF data file
+    dest_path = os.path.splitext(file_path)[0]
+    data_path = f"{dest_path}.sigmf-data"
+
+    # Resumable conversions write to a temporary file that is renamed once complete
+    out_path = data_path if checkpoint is None else checkpoint.partial_path
+    first = 0 if checkpoint is None else checkpoint.samples_done
+
+    if threads > 1 and sample_count - first > chunk_size:
+        samples = _transcode_parallel(
+            file_path, out_path, data_start, elem_dtype, dtype, normalize, byte_order,
+            sample_count, chunk_size, threads, sha512, stats, first, checkpoint,
+        )
+    else:
+        with open(file_path, "rb") as f_in, open(out_path, "r+b" if first else "wb") as f_out:
+            f_in.seek(data_start + first * sample_bytes)
+            if first:
+                # Drop anything written after the last checkpoint
+                f_out.seek(checkpoint.bytes_done)
+                f_out.truncate()
+            _, samples = _transcode_payload(
+                f_in, f_out, elem_dtype, dtype, normalize, byte_order, sample_count - first, chunk_size, sha512,
+                stats, checkpoint=checkpoint,
+            )
+    if checkpoint is not None:
+        checkpoint.finish()
+
+    # In streaming mode, or when part of the output came from an earlier run, hand back a view of the output
+    if chunk_size < sample_count or first:
+        return np.memmap(data_path, dtype=samples.dtype, mode="r")
+
+    # Return the IQ data if needed for further processing if needed
+    return samples
+
+
+def blue_to_sigmf(
+    hcb,
+    ext_entries,
+    file_path,
+    create_ncd=False,
+    data_sha512=None,
+    datatype=None,
+    frame_layout="channels",
+    stats=None,
+    sample_offset=0,
+    fingerprint=None,
+):
     """
     Build a SigMF metadata dict from parsed Bluefile HCB and extended header.
 
@@ -417,6 +1339,31 @@ def blue_to_sigmf(hcb, ext_entries, file_path):
         Parsed extended header entries from parse_extended_header().
     data_path : str
         Path to the .sigmf-data file.
+    create_ncd : bool, optional
+        When True, describe the Blue file itself as a Non-Conforming Dataset
+        instead of a converted .sigmf-data file.
+    data_sha512 : str, optional
+        SHA-512 hex digest of the .sigmf-data file if already known. When None
+        the hash is computed by reading the data file back.
+    datatype : str, optional
+        SigMF datatype of the .sigmf-data file. When None the Blue file's own
+        datatype is used.
+    frame_layout : str, optional
+        How type 2000 frames are described. 'channels' maps each frame to one
+        multi-channel sample with ``subsize`` channels at the frame rate
+        1/ydelta. 'captures' keeps a single channel and starts a new capture
+        at every frame, recording its y-axis value.
+    stats : ConversionStats, optional
+        Records the 'metadata_write' stage, and 'hashing' if the data file
+        has to be read back to hash it.
+    sample_offset : int, optional
+        Index of the first converted sample in the original recording, when
+        only a window of it was converted. Recorded as ``core:offset``, and
+        capture and annotation sample indices count from it.
+    fingerprint : dict, optional
+        Source fingerprint from source_fingerprint(), recorded as
+        ``core:blue_source_fingerprint`` so that re-runs can skip the file.
+
     Returns
     -------
     dict
@@ -435,69 +1382,15 @@ def blue_to_sigmf(hcb, ext_entries, file_path):
                 return e["value"]
         return None
 
-# S - Scalar
-# C-  Complex
-# V - Vector
-# Q-  Quad - TODO: Pri 2 - Add support for other types if they are commonly used.
-
-# B: 8-bit integer
-# I: 16-bit integer
-# L: 32-bit integer
-# X: 64-bit integer
-# F: 32-bit float
-# D: 64-bit float
-
-    # --- Global datatype object - little endian---
-    datatype_map_le = {
-        "SB": "ri8_le",
-        "SI": "ri16_le",
-        "SL": "ri32_le",
-        "SX": "ri64_le",
-        "SF": "rf32_le",
-        "SD": "rf64_le",
-        "CB": "ci8_le",
-        "CI": "ci16_le",
-        "CL": "ci32_le",
-        "CX": "ci64_le",
-        "CF": "cf32_le",
-        "CD": "cf32_le",
-    }
-
-    # --- Global datatype object - big endian---
-    datatype_map_be = {
-        "SB": "ri8_be",
-        "SI": "ri16_be",
-        "SL": "ri32_be",
-        "SX": "ri64_be",
-        "SF": "rf32_be",
-        "SD": "rf64_be",
-        "CB": "ci8_be",
-        "CI": "ci16_be",
-        "CL": "ci32_be",
-        "CX": "ci64_be",
-        "CF": "cf32_be",
-        "CD": "cf32_be",
-    }
-
-
-    # header data representation  : 'EEEI' or 'IEEE' # Little or big data endianess representation
-    header_rep = hcb.get("head_rep")
-
     # data_rep  : 'EEEI' or 'IEEE' # Little or big data endianess representation
     data_rep = hcb.get("data_rep")
 
-    # data_format : For example 'CI'  or 'SD'  Data format code - real or complex, int or float
-    data_format = hcb.get("format")
-            
-    if data_rep == "EEEI": # Little Endian
-        data_map = datatype_map_le.get(data_format)
-    
-    elif data_rep == "IEEE": # Big Endian
-        data_map = datatype_map_be.get(data_format)
-    
-    datatype = data_map if data_map is not None else "unknown"
+    # The samples keep the Blue file's own datatype unless they were converted to another one
+    file_datatype = native_datatype(hcb)
+    if datatype is None:
+        datatype = file_datatype
 
-    print(f"Determined SigMF datatype: {datatype} and data representation: {data_rep}")
+    log.debug("Determined SigMF datatype: %s and data representation: %s", datatype, data_rep)
 
     # Sample rate: prefer adjunct.xdelta, else extended header SAMPLE_RATE
     if "adjunct" in hcb and "xdelta" in hcb["adjunct"]:
@@ -541,6 +1434,7 @@ def blue_to_sigmf(hcb, ext_entries, file_path):
         global_md[f"core:blue_adjunct_header_{key}"] = value   
 
     # --- Merge extended header fields ---
+    keyword_types = {}
     for e in ext_entries:
         name = e.get("tag")
         if name is None:
@@ -550,9 +1444,20 @@ def blue_to_sigmf(hcb, ext_entries, file_path):
         if hasattr(value, "item"):
             value = value.item()
         global_md[key] = value
+        # JSON loses the keyword's Blue type code (e.g. 'B' vs 'L'), keep it so the header can be rebuilt as it was
+        if e.get("type"):
+            keyword_types[name] = e["type"]
+    if keyword_types:
+        global_md["core:blue_keyword_types"] = keyword_types
   
+    if sample_offset:
+        global_md["core:offset"] = sample_offset
+
+    if fingerprint is not None:
+        global_md["core:blue_source_fingerprint"] = fingerprint
+
     # Convert the datetime object to an ISO 8601 formatted string
-    epoch_time_raw = int(hcb.get("timecode", 0))
+    epoch_time_raw = first_sample_timecode(hcb)
 
     # Adjust for Bluefile POSIX epoch (1950 vs 1970)
     bluefile_epoch_offset = 631152000  # seconds between 1950 and 1970
@@ -561,16 +1466,39 @@ def blue_to_sigmf(hcb, ext_entries, file_path):
     dt_object_utc = datetime.fromtimestamp(epoch_time, tz=timezone.utc)
     # Format with milliseconds and Zulu suffix
     iso_8601_string = dt_object_utc.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
-    print(f"Epoch time: {epoch_time}")
-    print(f"ISO 8601 time: {iso_8601_string}")
+    log.debug("Epoch time: %s", epoch_time)
+    log.debug("ISO 8601 time: %s", iso_8601_string)
 
     # --- Captures array ---
     captures = [{
         "core:datetime": iso_8601_string,
         "core:frequency": float(get_tag("RF_FREQ") or 0.0),
-        "core:sample_start": 0,
+        "core:sample_start": sample_offset,
     }]
 
+    # Calculate sample count from the size of the samples in the Blue file
+    data_size = int(hcb.get("data_size", 0))
+    if file_datatype not in DATATYPE_SIZES:
+        raise ValueError(f"Unsupported datatype {file_datatype}")
+    bytes_per_sample = DATATYPE_SIZES[file_datatype]
+    sample_count = int(data_size // bytes_per_sample)
+
+    # --- Type 2000 frames ---
+    subsize = frame_size(hcb)
+    frame_count = 0
+    if subsize:
+        adjunct = hcb["adjunct"]
+        frame_count = sample_count // subsize
+        sample_count = frame_count * subsize
+        if frame_layout == "channels":
+            # One frame per sample, frame elements become the channels
+            global_md["core:num_channels"] = subsize
+            if adjunct.get("ydelta", 0) > 0:
+                global_md["core:sample_rate"] = 1.0 / adjunct["ydelta"]
+            sample_count = frame_count
+        elif frame_layout != "captures":
+            raise ValueError(f"Unknown frame layout: {frame_layout}")
+
     # compute SHA‑512 hash of data file
     def compute_sha512(path, bufsize=1024*1024):
         """Compute SHA-512 hash of a file in chunks."""
@@ -581,52 +1509,51 @@ def blue_to_sigmf(hcb, ext_entries, file_path):
                 h.update(chunk)
         return h.hexdigest()
 
-    # Strip the extension from the original file path
-    base_file_name = os.path.splitext(file_path)[0]
-
-    # Build the .sigmf-data path
-    data_file_path = base_file_name + ".sigmf-data"
-
-    # Compute SHA-512 of the data file
-    data_sha512 = compute_sha512(data_file_path)   # path to the .sigmf-data file
-    global_md["core:sha512"] = data_sha512
+    if create_ncd:
+        # Non-Conforming Dataset - samples stay in the Blue file between the header and extended header
+        data_start = int(hcb.get("data_start", HEADER_SIZE))
+        data_size = int(hcb.get("data_size", 0))
+        used_size = (frame_count * subsize if subsize else sample_count) * bytes_per_sample
+        global_md["core:dataset"] = os.path.basename(file_path)
+        global_md["core:trailing_bytes"] = os.path.getsize(file_path) - data_start - used_size
+        captures[0]["core:header_bytes"] = data_start
+    else:
+        # Strip the extension from the original file path
+        base_file_name = os.path.splitext(file_path)[0]
+
+        # Build the .sigmf-data path
+        data_file_path = base_file_name + ".sigmf-data"
+
+        # Compute SHA-512 of the data file unless it was hashed as it was written
+        if data_sha512 is None:
+            with _stage(stats, "hashing") as record:
+                data_sha512 = compute_sha512(data_file_path)   # path to the .sigmf-data file
+                record["bytes_read"] += os.path.getsize(data_file_path)
+        global_md["core:sha512"] = data_sha512
+
+    # One capture per frame, each recording where it sits on the y axis
+    if subsize and frame_layout == "captures":
+        ystart = hcb["adjunct"].get("ystart", 0.0)
+        ydelta = hcb["adjunct"].get("ydelta", 0.0)
+        frame_captures = []
+        for frame in range(frame_count):
+            capture = dict(captures[0]) if frame == 0 else {
+                k: v for k, v in captures[0].items() if k != "core:header_bytes"
+            }
+            capture["core:sample_start"] = sample_offset + frame * subsize
+            capture["core:blue_frame_y"] = ystart + frame * ydelta
+            frame_captures.append(capture)
+        captures = frame_captures or captures
 
     # --- Annotations array ---
-    datatype_sizes = {
-        "ri8_le": 1,
-        "ri16_le": 2,
-        "ri32_le": 4,
-        "ci16_le": 4,
-        "ci32_le": 8,
-        "cf32_le": 8,
-        "rf32_le": 4,
-        "rf64_le": 8,
-        "ri64_le": 8,
-        "ri8_be": 1,
-        "ri16_be": 2,
-        "ri32_be": 4,
-        "ci16_be": 4,
-        "ci32_be": 8,
-        "cf32_be": 8,
-        "rf32_be": 4,
-        "rf64_be": 8,
-        "ri64_be": 8,
-    }
-
-    # Calculate sample count
-    data_size = int(hcb.get("data_size", 0))
-    if datatype not in datatype_sizes:
-        raise ValueError(f"Unsupported datatype {datatype}")
-    bytes_per_sample = datatype_sizes[datatype]
-    sample_count = int(data_size // bytes_per_sample)
-
     annotations = [{
-        "core:sample_start": 0,
+        "core:sample_start": sample_offset,
         "core:sample_count": sample_count,
         "core:freq_upper_edge": float(get_tag("RF_FREQ") or 0.0) + float(get_tag("SBT_BANDWIDTH") or 0.0),
         "core:freq_lower_edge": float(get_tag("RF_FREQ") or 0.0),
         "core:label": "Sceptere"
     }]
+    annotations = clip_annotations(annotations, sample_offset, sample_count)
 
     # --- Final SigMF object ---
     sigmf = {
@@ -639,14 +1566,30 @@ def blue_to_sigmf(hcb, ext_entries, file_path):
     base_file_name = os.path.splitext(file_path)[0]
     meta_path = base_file_name + ".sigmf-meta"
     
-    with open(meta_path, "w") as f:
+    with _stage(stats, "metadata_write") as record, open(meta_path, "w") as f:
         json.dump(sigmf, f, indent=2)
-    print(f"==== Wrote SigMF metadata to {meta_path} ====")
+        record["bytes_written"] += f.tell()
+    log.debug("==== Wrote SigMF metadata to %s ====", meta_path)
 
     return sigmf
 
 
-def blue_file_to_sigmf(file_path):
+def blue_file_to_sigmf(
+    file_path,
+    chunk_size=None,
+    create_ncd=False,
+    output_datatype=None,
+    frame_layout="channels",
+    stats=None,
+    start=None,
+    count=None,
+    start_time=None,
+    duration=None,
+    threads=1,
+    resume=False,
+    checkpoint_interval=None,
+    normalize=False,
+):
     """
     Convert a MIDIS Bluefile to SigMF metadata and data.
 
@@ -654,79 +1597,618 @@ def blue_file_to_sigmf(file_path):
     ----------
     file_path : str
         file_path to the Blue file.
+    chunk_size : int, optional
+        Stream the data payload in chunks of this many samples so that
+        memory use stays bounded. When None the payload is converted in one go.
+    create_ncd : bool, optional
+        When True, only write a .sigmf-meta that points at the samples in the
+        original Blue file (Non-Conforming Dataset) instead of copying them.
+    output_datatype : str, optional
+        SigMF datatype of the .sigmf-data file. By default the samples keep
+        their native datatype; 'cf32_le' or 'rf32_le' normalizes them to float.
+    frame_layout : str, optional
+        For type 2000 files, 'channels' (one channel per frame element) or
+        'captures' (one capture per frame), see blue_to_sigmf().
+    stats : ConversionStats, optional
+        Filled in with wall time, CPU time and bytes read and written for
+        the header parse, extended header parse, data transcode, hashing and
+        metadata write stages.
+    start, count : int, optional
+        Convert only ``count`` samples from sample ``start`` (whole frames for
+        type 2000 files). The payload is read from that offset directly.
+    start_time, duration : optional
+        Convert only a time window instead, see sample_window().
+    threads : int, optional
+        Transcode chunks of one file on this many threads, see
+        parse_data_values(). Needs ``chunk_size`` to split the payload.
+    resume : bool, optional
+        Skip the file when its existing .sigmf-meta records the same source
+        fingerprint, and continue an interrupted conversion from its last
+        checkpoint, see ConversionCheckpoint. The data file is then written
+        under a temporary name with checkpoints, so the run can be resumed.
+    checkpoint_interval : int, optional
+        Write the data file with checkpoints every this many bytes even
+        without ``resume``, so a later resumed run can continue it. By
+        default only resumed runs are checkpointed, at CHECKPOINT_INTERVAL.
+    normalize : bool, optional
+        When True and no ``output_datatype`` is given, normalize to the float
+        datatype of the file's format ('cf32_le' or 'rf32_le'), see
+        normalized_datatype().
 
     Returns
     -------
     samples : numpy.ndarray
-        IQ Data.
+        IQ Data, or None when creating a Non-Conforming Dataset or when the
+        file was skipped.
     """
 
-    print("==========================================")
-    print("===== Starting blue file processing =====")
-    print("==========================================")
-
-    # Read Header control block (HCB) from blue file to determine how to process the rest of the file
-    hcb = read_hcb(file_path) 
-
-    print("=== Header Control Block (HCB) Fields ===")
-    for name, _, _, _, desc in HCB_LAYOUT:
-        print(f"{name:10s}: {hcb[name]!r}  # {desc}")
-
-    print("\n=== Adjunct Header ===")
-    print(hcb.get("adjunct", hcb.get("adjunct_raw")))
+    log.debug("===== Starting blue file processing =====")
+
+    # Read Header control block (HCB) and extended header from blue file in a single pass
+    # to determine how to process the rest of the file
+    header = read_header(file_path, stats)
+    hcb = header.hcb
+
+    # Extended header entries
+    ext = header.ext
+
+    # Header dumps are only formatted when debug logging is on - they cost more than the parse on keyword-heavy files
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("=== Header Control Block (HCB) Fields ===")
+        for name, _, _, _, desc in HCB_LAYOUT:
+            log.debug("%-10s: %r  # %s", name, hcb[name], desc)
+
+        log.debug("=== Adjunct Header ===")
+        log.debug("%s", hcb.get("adjunct", hcb.get("adjunct_raw")))
+
+        log.debug("=== Extended Header Keywords ===")
+        for e in ext:
+            log.debug("%-20s:%s", e["tag"], e["value"])
+        log.debug("Total extended header entries: %d", len(ext))
+
+    data_endianess = header.data_endianess
+
+    # Narrow the header to the requested window so only that range is read and described
+    sample_offset = 0
+    if any(v is not None for v in (start, count, start_time, duration)):
+        start, count = sample_window(hcb, start, count, start_time, duration)
+        hcb = window_hcb(hcb, start, count)
+        # With one capture per frame, SigMF samples are the frame elements rather than whole frames
+        sample_offset = start * frame_size(hcb) if frame_size(hcb) and frame_layout == "captures" else start
+
+    # Everything that changes the output goes in the fingerprint, so a re-run only skips identical conversions
+    if normalize and output_datatype is None:
+        output_datatype = normalized_datatype(hcb["format"])
+    datatype = None if create_ncd else resolve_output_datatype(hcb, output_datatype)
+    fingerprint = source_fingerprint(file_path, header, {
+        "datatype": datatype,
+        "ncd": create_ncd,
+        "frame_layout": frame_layout,
+        "start": start,
+        "count": count,
+    })
+    base_file_name = os.path.splitext(file_path)[0]
+    data_path = None if create_ncd else base_file_name + ".sigmf-data"
+    if resume and is_up_to_date(base_file_name + ".sigmf-meta", fingerprint, data_path):
+        log.debug("%s is up to date, skipping", file_path)
+        return None
 
-    # data_rep  : 'EEEI' or 'IEEE' # Little or big extended header endianess representation
-    extended_header_endianess = hcb.get("head_rep")
-    
-    if extended_header_endianess == "EEEI":
-        ext_endianess = "<"   # little-endian
-    elif extended_header_endianess == "IEEE":
-        ext_endianess = ">"   # big-endian
-    else:
-        raise ValueError(f"Unknown head_rep value: {extended_header_endianess}")
-
-    # Parse extended header entries
-    ext = parse_extended_header(file_path, hcb, ext_endianess)
-    print("\n=== Extended Header Keywords ===")
-    for e in ext:
-        print(f"{e['tag']:20s}:{e['value']}")
-    print(f"Total extended header entries: {len(ext)}")
-
-   # data_rep  : 'EEEI' or 'IEEE' # Little or big data endianess representation
-    data_rep_endianess = hcb.get("data_rep")
-    data_endianess = "<" if data_rep_endianess == "EEEI" else ">"
- 
     # Parse key data values    
     # iq_data will be available if needed for further processing.
-    try:
-        iq_data = parse_data_values(file_path, hcb, data_endianess)
-    except Exception as e:
-        raise RuntimeError(f"Failed to parse data values: {e}")
+    iq_data = None
+    data_sha512 = None
+    if not create_ncd:
+        # One-shot conversions write the data file directly, without the cost of fsynced checkpoints
+        checkpoint = None
+        sha512 = hashlib.sha512()
+        if resume or checkpoint_interval is not None:
+            checkpoint = ConversionCheckpoint(data_path, fingerprint, checkpoint_interval)
+            if resume:
+                checkpoint.load(stats)
+            sha512 = checkpoint.sha512
+        try:
+            iq_data = parse_data_values(
+                file_path, hcb, data_endianess, chunk_size, sha512, datatype, stats, threads, checkpoint
+            )
+        except Exception as e:
+            raise RuntimeError(f"Failed to parse data values: {e}")
+        data_sha512 = sha512.hexdigest()
 
     # Call the SigMF conversion for metadata generation 
-    blue_to_sigmf(hcb, ext, file_path)
+    blue_to_sigmf(
+        hcb, ext, file_path, create_ncd, data_sha512, datatype, frame_layout, stats, sample_offset, fingerprint
+    )
 
     # Return the IQ data if needed for further processing if needed 
     return iq_data
 
-if __name__ == "__main__":
-    # Main calls blue_file_to_sigmf to convert dump blue file contents to SigMF.
-    # TODO: Add input args for file name - cdif or .tmp files
-    import argparse
-    parser = argparse.ArgumentParser()
-    parser.add_argument("blue_file")
-    # TODO: Uncomment for passing input args for file name - cdif or .tmp files
-    # args = parser.parse_args()
-    # TODO: Add input args for file name - cdif or .tmp files
-    file_path = 'C:\Data1\Ham_Radio\SDR\SigMF-MIDAS-Blue-File-Conversion\PythonDevCode\SceptreTestFile1.cdif'
-    # file_path = 'C:\Data1\Ham_Radio\SDR\SigMF-MIDAS-Blue-File-Conversion\PythonDevCode\RustBlueTestFiles\pulse_cx.tmp'
-    # file_path = 'C:\Data1\Ham_Radio\SDR\SigMF-MIDAS-Blue-File-Conversion\PythonDevCode\RustBlueTestFiles\sin.tmp' 
-    # file_path = 'C:\Data1\Ham_Radio\SDR\SigMF-MIDAS-Blue-File-Conversion\PythonDevCode\RustBlueTestFiles\penny.prm' 
-    # file_path = 'C:\Data1\Ham_Radio\SDR\SigMF-MIDAS-Blue-File-Conversion\PythonDevCode\RustBlueTestFiles\keyword_test_file.tmp' 
-    # file_path = 'C:\Data1\Ham_Radio\SDR\SigMF-MIDAS-Blue-File-Conversion\PythonDevCode\RustBlueTestFiles\lots_of_keywords.tmp'
+
+def _read_stream(stream, size):
+    """Read up to ``size`` bytes from a stream, fewer only if it ends first."""
+    buf = bytearray(size)
+    return bytes(buf[:_read_exact(stream, memoryview(buf))])
+
+
+def _skip_stream(stream, size, bufsize=1024*1024):
+    """Discard ``size`` bytes of a stream that cannot seek. Returns the number of bytes skipped."""
+    skipped = 0
+    while skipped < size:
+        n = len(_read_stream(stream, min(bufsize, size - skipped)))
+        if n == 0:
+            break
+        skipped += n
+    return skipped
+
+
+def blue_stream_to_sigmf(
+    stream, output_path, chunk_size=DEFAULT_CHUNK_SIZE, output_datatype=None, frame_layout="channels", stats=None
+):
+    """
+    Convert a Blue file arriving on a pipe, socket or other non-seekable stream.
+
+    The header is read once from the stream. An extended header in front of
+    the data is buffered and parsed; one behind the data is parsed if the
+    stream still carries it once the samples are done. Samples are transcoded
+    straight into the SigMF data file as they arrive. When the HCB ``pipe``
+    field is set or ``data_size`` is zero, as for a live recorder, samples are
+    read until the end of the stream.
+
+    Parameters
+    ----------
+    stream : binary file object
+        Stream positioned at the start of the HCB, for example
+        ``sys.stdin.buffer`` or ``socket.makefile("rb")``.
+    output_path : str
+        Name of the SigMF recording to write; its extension is replaced by
+        .sigmf-data and .sigmf-meta.
+    chunk_size : int, optional
+        Number of samples transcoded per chunk.
+    output_datatype : str, optional
+        SigMF datatype to write, see resolve_output_datatype().
+    frame_layout : str, optional
+        For type 2000 streams, see blue_to_sigmf().
+    stats : ConversionStats, optional
+        Filled in as for blue_file_to_sigmf().
+
+    Returns
+    -------
+    dict
+        SigMF metadata structure.
+    """
+    import numpy as np
+
+    log.debug("===== Starting blue stream processing =====")
+    if chunk_size <= 0:
+        raise ValueError(f"Invalid chunk size: {chunk_size}")
+
+    with _stage(stats, "header_parse") as record:
+        raw_hcb = _read_stream(stream, HEADER_SIZE)
+        record["bytes_read"] += len(raw_hcb)
+        if len(raw_hcb) < HEADER_SIZE:
+            raise ValueError("Stream ended inside the header control block")
+        header = BlueHeader(_parse_hcb(raw_hcb), [])
+    hcb = header.hcb
+    position = HEADER_SIZE
+
+    dtype = hcb["format"]
+    if dtype not in SUPPORTED_TYPES:
+        raise ValueError(f"Unsupported data type: {dtype}")
+    if hcb.get("adjunct", {}).get("xdelta", 0) <= 0:
+        raise ValueError(f"Invalid time interval: {hcb.get('adjunct', {}).get('xdelta')}")
+
+    data_start = int(hcb["data_start"])
+    data_size = int(hcb["data_size"])
+    ext_offset = int(hcb["ext_start"]) * BLOCK_SIZE
+    ext_size = int(hcb["ext_size"])
+    if data_start < position:
+        raise ValueError(f"Invalid data start: {data_start}")
+
+    # An extended header in front of the data only needs buffering as far as the data
+    if ext_size > 0 and position <= ext_offset < data_start:
+        with _stage(stats, "extended_header_parse") as record:
+            prefix = _read_stream(stream, data_start - position)
+            record["bytes_read"] += len(prefix)
+            ext_buf = prefix[ext_offset - position:ext_offset - position + ext_size]
+            header.ext = _parse_extended_header_buffer(ext_buf, header.header_endianess)
+        position += len(prefix)
+    position += _skip_stream(stream, data_start - position)
+    if position < data_start:
+        raise ValueError("Stream ended before the data")
+
+    datatype = resolve_output_datatype(hcb, output_datatype)
+    normalize = datatype not in (DATATYPE_MAP_LE[dtype], DATATYPE_MAP_BE[dtype])
+    byte_order = ">" if datatype.endswith("_be") else "<"
+
+    elem_type, elems_per_sample = FORMAT_CODES[dtype]
+    elem_dtype = np.dtype(elem_type).newbyteorder(header.data_endianess)
+    sample_bytes = elem_dtype.itemsize * elems_per_sample
+
+    # Live streams have no fixed size - read samples until the stream ends
+    live = bool(hcb.get("pipe")) or data_size <= 0
+    sample_count = None if live else data_size // sample_bytes
+    subsize = frame_size(hcb)
+    if subsize:
+        chunk_size = max(chunk_size // subsize, 1) * subsize
+        if sample_count is not None:
+            sample_count -= sample_count % subsize
+
+    data_path = os.path.splitext(output_path)[0] + ".sigmf-data"
+    sha512 = hashlib.sha512()
+    with open(data_path, "wb") as f_out:
+        samples_written, _ = _transcode_payload(
+            stream, f_out, elem_dtype, dtype, normalize, byte_order, sample_count, chunk_size, sha512, stats, subsize
+        )
+    position += samples_written * sample_bytes
+
+    # An extended header behind the data is picked up if the stream still carries it
+    if not live and ext_size > 0 and ext_offset >= data_start + data_size:
+        position += _skip_stream(stream, ext_offset - position)
+        with _stage(stats, "extended_header_parse") as record:
+            ext_buf = _read_stream(stream, ext_size) if position == ext_offset else b""
+            record["bytes_read"] += len(ext_buf)
+            if len(ext_buf) == ext_size:
+                header.ext = _parse_extended_header_buffer(ext_buf, header.header_endianess)
+            else:
+                log.debug("Stream ended before the extended header, converting without keywords")
+
+    # Describe the samples that actually arrived
+    hcb = dict(hcb, data_size=float(samples_written * sample_bytes))
+    return blue_to_sigmf(hcb, header.ext, output_path, False, sha512.hexdigest(), datatype, frame_layout, stats)
+
+
+class BlueFile:
+    """
+    Random-access reader for the samples in a Blue file.
+
+    The data payload is exposed as a read-only ``numpy.memmap`` so that only
+    the samples which are actually read are loaded from disk.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the Blue file.
+
+    Attributes
+    ----------
+    hcb : dict
+        Header Control Block from read_header().
+    ext : list of dict
+        Extended header entries from read_header().
+    data : numpy.memmap
+        The data payload in the file's own byte order. Scalar formats are 1-D,
+        CF is complex and the integer complex formats CI/CL have a trailing
+        axis of length 2 holding I and Q.
+    """
+
+    def __init__(self, file_path):
+        import numpy as np
+
+        self.file_path = file_path
+        header = read_header(file_path)
+        self.hcb = header.hcb
+        self.ext = header.ext
+
+        data_format = self.hcb["format"]
+        if data_format not in SUPPORTED_TYPES:
+            raise ValueError(f"Unsupported data type: {data_format}")
+        elem_type, elems_per_sample = FORMAT_CODES[data_format]
+        sample_bytes = np.dtype(elem_type).itemsize * elems_per_sample
+
+        data_endianess = header.data_endianess
+        if data_format == "CF":
+            dtype = np.dtype(np.complex64).newbyteorder(data_endianess)
+            sample_shape = ()
+        else:
+            dtype = np.dtype(elem_type).newbyteorder(data_endianess)
+            sample_shape = (elems_per_sample,) if elems_per_sample > 1 else ()
+
+        # Only map the payload the HCB describes
+        data_start = int(self.hcb["data_start"])
+        data_size = min(int(self.hcb["data_size"]), os.path.getsize(file_path) - data_start)
+        shape = (max(data_size, 0) // sample_bytes,) + sample_shape
+
+        if shape[0]:
+            self.data = np.memmap(file_path, dtype=dtype, mode="r", offset=data_start, shape=shape)
+        else:
+            # numpy cannot map an empty region
+            self.data = np.empty(shape, dtype=dtype)
+
+    def __len__(self):
+        return len(self.data)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Release the memory map of the data payload."""
+        self.data = None
+
+    @property
+    def xstart(self):
+        """Abscissa (time) of the first sample, from the adjunct header."""
+        return self.hcb.get("adjunct", {}).get("xstart", 0.0)
+
+    @property
+    def xdelta(self):
+        """Abscissa (time) increment between samples, from the adjunct header."""
+        xdelta = self.hcb.get("adjunct", {}).get("xdelta", 0.0)
+        if xdelta <= 0:
+            raise ValueError(f"Invalid time interval: {xdelta}")
+        return xdelta
+
+    def read(self, start=0, count=-1):
+        """
+        Read samples from the data payload.
+
+        Parameters
+        ----------
+        start : int, optional
+            Index of the first sample to read.
+        count : int, optional
+            Number of samples to read. -1 reads to the end of the payload.
+
+        Returns
+        -------
+        numpy.ndarray
+            Copy of the requested samples in native byte order.
+        """
+        if start < 0 or start > len(self.data):
+            raise ValueError(f"Start sample {start} outside of payload with {len(self.data)} samples")
+        stop = len(self.data) if count < 0 else min(start + count, len(self.data))
+        samples = self.data[start:stop]
+        return samples.astype(samples.dtype.newbyteorder("="))
+
+    def read_frames(self, start=0, count=-1):
+        """
+        Read whole frames from a type 2000 file.
+
+        Parameters
+        ----------
+        start : int, optional
+            Index of the first frame to read.
+        count : int, optional
+            Number of frames to read. -1 reads to the last whole frame.
+
+        Returns
+        -------
+        numpy.ndarray
+            Copy of the requested frames with shape (frames, subsize, ...).
+        """
+        subsize = frame_size(self.hcb)
+        if not subsize:
+            raise ValueError("Not a type 2000 file with framed data")
+        frame_count = len(self.data) // subsize
+        stop = frame_count if count < 0 else min(start + count, frame_count)
+        samples = self.read(start * subsize, max(stop - start, 0) * subsize)
+        return samples.reshape((-1, subsize) + samples.shape[1:])
+
+    def index_of(self, time):
+        """
+        Convert an abscissa (time) value to the index of the nearest sample.
+
+        Parameters
+        ----------
+        time : float
+            Time in the units of the adjunct header, usually seconds.
+
+        Returns
+        -------
+        int
+            Sample index.
+        """
+        return int(round((time - self.xstart) / self.xdelta))
+
+    def read_time(self, start_time, duration):
+        """
+        Read the samples covering a time window.
+
+        Parameters
+        ----------
+        start_time : float
+            Time of the first sample, on the same axis as the adjunct xstart.
+        duration : float
+            Length of the window, in the units of the adjunct xdelta.
+
+        Returns
+        -------
+        numpy.ndarray
+            Copy of the requested samples in native byte order.
+        """
+        start = max(self.index_of(start_time), 0)
+        count = int(round(duration / self.xdelta))
+        return self.read(start, count)
+
+
+def _convert_one(
+    file_path, chunk_size, create_ncd, normalize, frame_layout, verbose, window=(None, None, None, None), threads=1,
+    resume=True,
+):
+    """
+    Convert a single Blue file in a batch worker process.
+
+    Returns
+    -------
+    tuple
+        (file_path, error message or None, payload bytes converted, seconds, skipped)
+
+    ``window`` is (start, count, start_time, duration), see blue_file_to_sigmf().
+    """
+    if verbose:
+        # Header dumps are logged at debug level, show them with the worker they came from
+        logging.basicConfig(level=logging.DEBUG, format="%(processName)s: %(message)s")
+    start = time.perf_counter()
+    stats = ConversionStats()
     try:
-        blue_file_to_sigmf(file_path)
-        print("DONE")
+        blue_file_to_sigmf(
+            file_path,
+            chunk_size=chunk_size,
+            create_ncd=create_ncd,
+            normalize=normalize,
+            frame_layout=frame_layout,
+            start=window[0],
+            count=window[1],
+            start_time=window[2],
+            duration=window[3],
+            threads=threads,
+            stats=stats,
+            resume=resume,
+        )
     except Exception as e:
-        print(f"Processing failed: {e}")
+        return file_path, str(e) or type(e).__name__, 0, time.perf_counter() - start, False
+    # Files that are already up to date never get as far as writing metadata
+    skipped = "metadata_write" not in stats.stages
+    # Only the sample payload counts towards throughput, not the headers, padding or a skipped prefix
+    nbytes = stats.stages.get("data_transcode", {}).get("bytes_read", 0)
+    return file_path, None, nbytes, time.perf_counter() - start, skipped
 
+
+def find_blue_files(inputs):
+    """
+    Expand files, directories and glob patterns into a list of Blue files.
+
+    Parameters
+    ----------
+    inputs : list of str
+        Blue files, directories to search recursively, or glob patterns.
+
+    Returns
+    -------
+    list of str
+        Sorted, de-duplicated Blue file paths.
+    """
+    found = set()
+    for item in inputs:
+        paths = glob.glob(item, recursive=True) if glob.has_magic(item) else [item]
+        for path in paths:
+            if os.path.isdir(path):
+                for dir_path, _, file_names in os.walk(path):
+                    found.update(
+                        os.path.join(dir_path, name) for name in file_names if name.lower().endswith(BLUE_EXTENSIONS)
+                    )
+            elif os.path.isfile(path):
+                found.add(path)
+            else:
+                raise FileNotFoundError(f"No such file or directory: {path}")
+    return sorted(found)
+
+
+def main(argv=None):
+    """
+    Batch convert Blue files to SigMF.
+
+    Returns
+    -------
+    int
+        Process exit code, non-zero if any conversion failed.
+    """
+    parser = argparse.ArgumentParser(description="Convert MIDAS Blue files to SigMF")
+    parser.add_argument(
+        "inputs", nargs="+", help="Blue files (.cdif, .tmp, .prm, .blue), directories or glob patterns, or - for stdin"
+    )
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="number of conversion processes")
+    parser.add_argument(
+        "-t", "--threads", type=int, default=1, help="transcoding threads per file, for a few very large files"
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="samples converted per chunk, bounds memory use"
+    )
+    parser.add_argument("--ncd", action="store_true", help="write metadata only, pointing at the original Blue file")
+    parser.add_argument(
+        "--normalize", action="store_true", help="write cf32_le/rf32_le scaled to -1.0..+1.0 instead of native samples"
+    )
+    parser.add_argument(
+        "--frame-layout",
+        choices=("channels", "captures"),
+        default="channels",
+        help="type 2000 files: one channel per frame element, or one capture per frame",
+    )
+    parser.add_argument("-v", "--verbose", action="store_true", help="show header dumps from each conversion")
+    parser.add_argument("-o", "--output", help="SigMF recording name when converting from stdin ('-')")
+    parser.add_argument("--start", type=int, help="first sample (frame for type 2000) to convert")
+    parser.add_argument("--count", type=int, help="number of samples (frames for type 2000) to convert")
+    parser.add_argument("--start-time", type=float, help="time of the first sample to convert, on the adjunct axis")
+    parser.add_argument("--duration", type=float, help="length of the window to convert, in adjunct units")
+    parser.add_argument(
+        "--force", action="store_true", help="convert files that are already up to date, and ignore checkpoints"
+    )
+    args = parser.parse_args(argv)
+
+    # Single Blue stream on stdin, for example piped from a live recorder
+    if args.inputs == ["-"]:
+        if not args.output:
+            parser.error("--output is required when reading from stdin")
+        if args.ncd or args.normalize:
+            parser.error("--ncd and --normalize are not available when reading from stdin")
+        if any(v is not None for v in (args.start, args.count, args.start_time, args.duration)):
+            parser.error("--start, --count, --start-time and --duration are not available when reading from stdin")
+        if args.threads != 1:
+            parser.error("--threads is not available when reading from stdin")
+        if args.verbose:
+            logging.basicConfig(level=logging.DEBUG, format="%(message)s")
+        start = time.perf_counter()
+        stats = ConversionStats()
+        try:
+            blue_stream_to_sigmf(sys.stdin.buffer, args.output, args.chunk_size, None, args.frame_layout, stats)
+        except Exception as e:
+            print(f"FAILED stdin: {e}")
+            return 1
+        nbytes = stats.stages.get("data_transcode", {}).get("bytes_read", 0)
+        seconds = time.perf_counter() - start
+        print(f"OK     stdin -> {args.output}  {nbytes / 1e6:.1f} MB in {seconds:.2f} s")
+        return 0
+
+    try:
+        file_paths = find_blue_files(args.inputs)
+    except FileNotFoundError as e:
+        parser.error(str(e))
+
+    # multiprocessing is slow to import, only the batch CLI needs it
+    from concurrent.futures import ProcessPoolExecutor
+
+    failures = 0
+    skips = 0
+    total_bytes = 0
+    batch_start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=max(args.jobs, 1)) as executor:
+        futures = [
+            executor.submit(
+                _convert_one,
+                path,
+                args.chunk_size,
+                args.ncd,
+                args.normalize,
+                args.frame_layout,
+                args.verbose,
+                (args.start, args.count, args.start_time, args.duration),
+                args.threads,
+                not args.force,
+            )
+            for path in file_paths
+        ]
+        for future in as_completed(futures):
+            file_path, error, nbytes, seconds, skipped = future.result()
+            if skipped:
+                skips += 1
+                print(f"SKIP   {file_path}  up to date")
+            elif error is None:
+                total_bytes += nbytes
+                rate = nbytes / 1e6 / seconds if seconds > 0 else 0.0
+                print(f"OK     {file_path}  {nbytes / 1e6:.1f} MB in {seconds:.2f} s ({rate:.1f} MB/s)")
+            else:
+                failures += 1
+                print(f"FAILED {file_path}: {error}")
+
+    elapsed = time.perf_counter() - batch_start
+    rate = total_bytes / 1e6 / elapsed if elapsed > 0 else 0.0
+    print(
+        f"Converted {len(file_paths) - failures - skips} of {len(file_paths)} files ({skips} up to date), "
+        f"{total_bytes / 1e6:.1f} MB in {elapsed:.2f} s ({rate:.1f} MB/s)"
+    )
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
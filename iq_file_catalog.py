@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+
+# IQ file catalog scanner
+# Builds a metadata-only index of Blue files and R&S IQ.TAR archives so that
+# captures can be found by RF frequency, sample rate, format and time without
+# running the full converter on each one.
+# Only headers are read - the Blue HCB and extended header, and the XML
+# member of an IQ.TAR - and the sample payloads are never touched. IQ.TAR
+# metadata is read with the R&S converter's own archive index and streaming
+# XML parser, which stop before the samples and the PreviewData.
+# The index is a JSON-lines file keyed by path, size and mtime. Re-running a
+# scan only re-parses files that are new or have changed since the last run.
+
+import os
+import sys
+import json
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+from blue_file_to_sigmf import BLUE_EXTENSIONS, first_sample_timecode, read_header
+
+IQ_TAR_EXTENSION = ".iq.tar"
+
+# Blue timecodes count seconds from January 1st 1950
+BLUE_EPOCH = datetime(1950, 1, 1, tzinfo=timezone.utc)
+
+
+def _iso8601(dt):
+    """Format a datetime as an ISO 8601 string with a Zulu suffix."""
+    return dt.strftime("%Y-%m-%dT%H:%M:%S.%f") + "Z"
+
+
+def scan_blue(path):
+    """
+    Read the catalog fields of a Blue file from its headers.
+
+    Parameters
+    ----------
+    path : str
+        Path to the Blue file.
+
+    Returns
+    -------
+    dict
+        Catalog fields.
+    """
+    header = read_header(path)
+    hcb = header.hcb
+    adjunct = hcb.get("adjunct", {})
+    keywords = {e["tag"]: e["value"] for e in header.ext}
+
+    xdelta = adjunct.get("xdelta")
+    rf_freq = keywords.get("RF_FREQ")
+    timecode = hcb.get("timecode")
+
+    record = {
+        "kind": "blue",
+        "format": hcb.get("format"),
+        "type": hcb.get("type"),
+        "data_rep": hcb.get("data_rep"),
+        "data_size": int(hcb.get("data_size", 0)),
+        "sample_rate": 1.0 / xdelta if xdelta else None,
+        "rf_freq": float(rf_freq) if isinstance(rf_freq, (int, float)) else None,
+        "timecode": timecode,
+        # Time of the first sample, as the converter writes it to core:datetime
+        "datetime": _iso8601(BLUE_EPOCH + timedelta(seconds=first_sample_timecode(hcb))) if timecode else None,
+    }
+    if hcb.get("type") == 2000:
+        record["subsize"] = adjunct.get("subsize")
+    return record
+
+
+def scan_iq_tar(path):
+    """
+    Read the catalog fields of an R&S IQ.TAR archive from its XML member.
+
+    The XML is read straight out of the archive and parsed up to the
+    PreviewData; nothing is extracted.
+
+    Parameters
+    ----------
+    path : str
+        Path to the IQ.TAR archive.
+
+    Returns
+    -------
+    dict
+        Catalog fields.
+    """
+    # The R&S converter is installed as sigmf.convert.rohdeschwarz in sigmf-python. It needs NumPy,
+    # so it is only imported once there is an archive to scan.
+    from sigmf.convert.rohdeschwarz import _parse_rohdeschwarz_xml, _read_iq_tar_index
+
+    xml_bytes, _ = _read_iq_tar_index(path, xml_only=True)
+    fields, _ = _parse_rohdeschwarz_xml(xml_bytes)
+
+    def number_of(tag, cast=float):
+        try:
+            return cast(fields.get(tag))
+        except (TypeError, ValueError):
+            return None
+
+    epoch_nanos = number_of("EpochNanos", int)
+    return {
+        "kind": "rohdeschwarz",
+        "format": fields.get("Format"),
+        "data_type": fields.get("DataType"),
+        "num_channels": number_of("NumberOfChannels", int) or 1,
+        "sample_count": number_of("Samples", int),
+        "sample_rate": number_of("Clock"),
+        "rf_freq": None,  # IQ.TAR files do not carry a center frequency
+        "name": fields.get("Name"),
+        "datetime": (
+            _iso8601(datetime.fromtimestamp(epoch_nanos // 1_000_000_000, tz=timezone.utc)
+                     + timedelta(microseconds=(epoch_nanos % 1_000_000_000) / 1000))
+            if epoch_nanos is not None else None
+        ),
+    }
+
+
+def scan_file(path, size, mtime_ns):
+    """
+    Build the index record for one file. Parse errors are recorded rather than raised.
+
+    Parameters
+    ----------
+    path : str
+        Path to the file.
+    size : int
+        File size in bytes, from os.stat.
+    mtime_ns : int
+        File modification time in nanoseconds, from os.stat.
+
+    Returns
+    -------
+    dict
+        Index record.
+    """
+    record = {"path": path, "size": size, "mtime_ns": mtime_ns}
+    try:
+        if path.lower().endswith(IQ_TAR_EXTENSION):
+            record.update(scan_iq_tar(path))
+        else:
+            record.update(scan_blue(path))
+    except Exception as e:
+        record["error"] = str(e)
+    return record
+
+
+def find_files(paths):
+    """
+    Find Blue files and IQ.TAR archives under the given files and directories.
+
+    Parameters
+    ----------
+    paths : list of str
+        Files or directories to search.
+
+    Returns
+    -------
+    list of str
+        Absolute paths of matching files.
+
+    Raises
+    ------
+    FileNotFoundError
+        If a path does not exist.
+    """
+    extensions = BLUE_EXTENSIONS + (IQ_TAR_EXTENSION,)
+    found = []
+    for path in paths:
+        if os.path.isdir(path):
+            for dir_path, _, file_names in os.walk(path):
+                found.extend(
+                    os.path.join(dir_path, name) for name in file_names if name.lower().endswith(extensions)
+                )
+        elif os.path.isfile(path):
+            found.append(path)
+        else:
+            raise FileNotFoundError(f"No such file or directory: {path}")
+    return sorted(os.path.abspath(p) for p in found)
+
+
+def load_index(index_path):
+    """
+    Load an existing JSON-lines index.
+
+    Parameters
+    ----------
+    index_path : str
+        Path to the index file.
+
+    Returns
+    -------
+    dict
+        Index records keyed by path. Empty when the index does not exist yet.
+    """
+    index = {}
+    if not os.path.exists(index_path):
+        return index
+    with open(index_path, "r") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                record = json.loads(line)
+                index[record["path"]] = record
+    return index
+
+
+def write_index(index_path, records):
+    """
+    Write index records as JSON lines, replacing the old index atomically.
+
+    Parameters
+    ----------
+    index_path : str
+        Path to the index file.
+    records : iterable of dict
+        Index records.
+    """
+    temp_path = index_path + ".tmp"
+    with open(temp_path, "w") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+    os.replace(temp_path, index_path)
+
+
+def scan(paths, index_path, jobs=8):
+    """
+    Scan files into the catalog index, re-parsing only new or changed files.
+
+    Parameters
+    ----------
+    paths : list of str
+        Files or directories to scan.
+    index_path : str
+        Path to the JSON-lines index file.
+    jobs : int, optional
+        Number of header parsing threads.
+
+    Returns
+    -------
+    dict
+        Counts of 'total', 'parsed', 'unchanged' and 'errors'.
+    """
+    previous = load_index(index_path)
+    found = find_files(paths)
+
+    # Keep entries from earlier scans of other paths, as long as the file is still there
+    found_set = set(found)
+    records = {path: record for path, record in previous.items() if path not in found_set and os.path.exists(path)}
+    pending = []
+
+    for path in found:
+        stat = os.stat(path)
+        old = previous.get(path)
+        if old is not None and old["size"] == stat.st_size and old["mtime_ns"] == stat.st_mtime_ns:
+            records[path] = old
+        else:
+            pending.append((path, stat.st_size, stat.st_mtime_ns))
+
+    # Header parsing is dominated by file system latency, so threads overlap it well
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        for record in executor.map(lambda args: scan_file(*args), pending):
+            records[record["path"]] = record
+
+    write_index(index_path, (records[path] for path in sorted(records)))
+
+    return {
+        "total": len(records),
+        "parsed": len(pending),
+        "unchanged": len(found) - len(pending),
+        "errors": sum(1 for record in records.values() if "error" in record),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build a metadata index of Blue files and R&S IQ.TAR archives")
+    parser.add_argument("paths", nargs="+", help="files or directories to scan")
+    parser.add_argument("-o", "--index", default="iq_catalog.jsonl", help="JSON-lines index file to create or update")
+    parser.add_argument("-j", "--jobs", type=int, default=8, help="number of header parsing threads")
+    args = parser.parse_args(argv)
+
+    try:
+        counts = scan(args.paths, args.index, args.jobs)
+    except FileNotFoundError as e:
+        parser.error(str(e))
+    print(
+        f"{counts['total']} files indexed in {args.index}: "
+        f"{counts['parsed']} parsed, {counts['unchanged']} unchanged, {counts['errors']} errors"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
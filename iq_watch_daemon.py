@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+
+# IQ watch-folder conversion daemon
+# Watches landing directories for Blue files and R&S IQ.TAR archives and
+# converts each one to SigMF once it has finished arriving.
+# A file counts as complete when its size and modification time have not
+# changed for a settle period. Conversions run in a process pool with a fixed
+# number of workers, fed from a bounded queue so that a burst of new files
+# applies backpressure to the scanner instead of piling up work in memory.
+# Every converted file is appended to a JSON-lines done-list keyed by path,
+# size and mtime, so a restart never converts the same file twice. Failed
+# files are not done: they are retried with an increasing delay, and again
+# after a restart. A conversion cut short by a restart continues from its
+# last checkpoint. A worker process that crashes is replaced and its file
+# converted again in the new pool.
+
+import os
+import sys
+import json
+import time
+import signal
+import asyncio
+import logging
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from blue_file_to_sigmf import DEFAULT_CHUNK_SIZE, blue_file_to_sigmf
+from iq_file_catalog import IQ_TAR_EXTENSION, find_files, load_index
+
+log = logging.getLogger(__name__)
+
+# Seconds before a failed file is retried, doubled on every further failure up to the maximum
+RETRY_DELAY = 30.0
+RETRY_MAX_DELAY = 3600.0
+
+
+def convert_file(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Convert one Blue file or IQ.TAR archive to SigMF next to the original (runs in a worker process).
+
+    Parameters
+    ----------
+    path : str
+        Path to the file.
+    chunk_size : int, optional
+        Samples per chunk for Blue files.
+
+    Returns
+    -------
+    float
+        Conversion time in seconds.
+    """
+    start = time.perf_counter()
+    if path.lower().endswith(IQ_TAR_EXTENSION):
+        # The R&S converter is installed as sigmf.convert.rohdeschwarz in sigmf-python
+        from sigmf.convert.rohdeschwarz import rohdeschwarz_to_sigmf
+
+        rohdeschwarz_to_sigmf(path, out_path=path[: -len(IQ_TAR_EXTENSION)], overwrite=True, resume=True)
+    else:
+        blue_file_to_sigmf(path, chunk_size=chunk_size, resume=True)
+    return time.perf_counter() - start
+
+
+class WatchDaemon:
+    """
+    Watch directories and convert complete files with bounded concurrency.
+
+    Parameters
+    ----------
+    directories : list of str
+        Landing directories to watch, searched recursively.
+    done_list : str
+        JSON-lines file recording every converted file.
+    jobs : int, optional
+        Number of conversion worker processes.
+    queue_size : int, optional
+        Number of complete files that may wait for a worker. The scanner
+        blocks once the queue is full.
+    interval : float, optional
+        Seconds between directory scans.
+    settle : float, optional
+        Seconds a file's size and mtime must stay unchanged before it is
+        considered complete.
+    chunk_size : int, optional
+        Samples per chunk for Blue files.
+    retry_delay : float, optional
+        Seconds before a failed file is retried. The delay doubles with every
+        further failure of the unchanged file, up to ``retry_max_delay``.
+    retry_max_delay : float, optional
+        Longest delay between retries of a failed file.
+    """
+
+    def __init__(self, directories, done_list, jobs=2, queue_size=8, interval=5.0, settle=10.0,
+                 chunk_size=DEFAULT_CHUNK_SIZE, retry_delay=RETRY_DELAY, retry_max_delay=RETRY_MAX_DELAY):
+        self.directories = directories
+        self.done_list = done_list
+        self.jobs = jobs
+        self.queue_size = queue_size
+        self.interval = interval
+        self.settle = settle
+        self.chunk_size = chunk_size
+        self.retry_delay = retry_delay
+        self.retry_max_delay = retry_max_delay
+
+        # path -> done-list record, so restarts skip files that have not changed since.
+        # Done-lists written by older versions also hold failures, those are retried.
+        self.done = {path: record for path, record in load_index(done_list).items() if "error" not in record}
+        # path -> (size, mtime_ns, failed attempts, monotonic time of the next retry)
+        self.failed = {}
+        # path -> (size, mtime_ns, monotonic time that stat was first seen)
+        self.candidates = {}
+        # paths queued or being converted
+        self.in_flight = set()
+        self.stopping = asyncio.Event()
+        self.executor = None
+
+    def _is_done(self, path, stat):
+        record = self.done.get(path)
+        return record is not None and record["size"] == stat.st_size and record["mtime_ns"] == stat.st_mtime_ns
+
+    def _complete_files(self, paths):
+        """Return the paths whose size and mtime have been stable for the settle period."""
+        now = time.monotonic()
+        ready = []
+        seen = set()
+        for path in paths:
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            seen.add(path)
+            if path in self.in_flight or self._is_done(path, stat):
+                continue
+            key = (stat.st_size, stat.st_mtime_ns)
+            failure = self.failed.get(path)
+            if failure is not None:
+                if failure[:2] != key:
+                    # Changed since it failed - convert it like a new file once it settles
+                    del self.failed[path]
+                elif now >= failure[3]:
+                    ready.append((path, stat.st_size, stat.st_mtime_ns))
+                    continue
+                else:
+                    continue
+            previous = self.candidates.get(path)
+            if previous is None or previous[:2] != key:
+                # New or still growing - restart its settle timer
+                self.candidates[path] = key + (now,)
+            elif now - previous[2] >= self.settle:
+                ready.append((path, stat.st_size, stat.st_mtime_ns))
+
+        # Forget files that disappeared before they settled or were retried
+        for path in set(self.candidates) - seen:
+            del self.candidates[path]
+        for path in set(self.failed) - seen - self.in_flight:
+            del self.failed[path]
+        return ready
+
+    def _record_done(self, record):
+        """Append a record to the done-list so it survives restarts."""
+        self.done[record["path"]] = record
+        self.failed.pop(record["path"], None)
+        with open(self.done_list, "a") as f:
+            f.write(json.dumps(record) + "\n")
+
+    def _record_failure(self, path, size, mtime_ns):
+        """Schedule a retry of a failed file, backing off while it keeps failing unchanged."""
+        previous = self.failed.get(path)
+        attempts = previous[2] + 1 if previous is not None and previous[:2] == (size, mtime_ns) else 1
+        delay = min(self.retry_delay * 2 ** (attempts - 1), self.retry_max_delay)
+        self.failed[path] = (size, mtime_ns, attempts, time.monotonic() + delay)
+        return delay
+
+    def _replace_executor(self, broken):
+        """Replace a process pool broken by a crashed worker, once for all workers that saw it break."""
+        if self.executor is broken:
+            log.warning("conversion process died, starting a new process pool")
+            broken.shutdown(wait=False, cancel_futures=True)
+            self.executor = ProcessPoolExecutor(max_workers=self.jobs)
+
+    def _find_files(self):
+        """Find files in the landing directories, skipping any that have gone away."""
+        directories = [directory for directory in self.directories if os.path.isdir(directory)]
+        for directory in set(self.directories) - set(directories):
+            log.warning("landing directory %s does not exist", directory)
+        return find_files(directories)
+
+    async def _scanner(self, queue):
+        loop = asyncio.get_running_loop()
+        while not self.stopping.is_set():
+            # Directory walks and stats block, keep them off the event loop
+            paths = await loop.run_in_executor(None, self._find_files)
+            ready = await loop.run_in_executor(None, self._complete_files, paths)
+            for path, size, mtime_ns in ready:
+                self.candidates.pop(path, None)
+                self.in_flight.add(path)
+                # Blocks while every worker is busy and the queue is full
+                await queue.put((path, size, mtime_ns))
+                if self.stopping.is_set():
+                    return
+            try:
+                await asyncio.wait_for(self.stopping.wait(), self.interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _convert(self, path):
+        """Convert a file in the process pool, once more in a new pool if a worker process dies."""
+        loop = asyncio.get_running_loop()
+        for attempt in range(2):
+            executor = self.executor
+            try:
+                return await loop.run_in_executor(executor, convert_file, path, self.chunk_size)
+            except BrokenProcessPool:
+                self._replace_executor(executor)
+                # A file that kills the new pool as well is the cause, not a bystander
+                if attempt:
+                    raise
+
+    async def _worker(self, queue):
+        while True:
+            path, size, mtime_ns = await queue.get()
+            try:
+                seconds = await self._convert(path)
+            except Exception as e:
+                delay = self._record_failure(path, size, mtime_ns)
+                log.error("FAILED %s: %s (retry in %.1f s)", path, str(e) or type(e).__name__, delay)
+            else:
+                log.info("OK     %s  %.1f MB in %.2f s", path, size / 1e6, seconds)
+                self._record_done(
+                    {"path": path, "size": size, "mtime_ns": mtime_ns, "seconds": round(seconds, 3),
+                     "finished": time.time()}
+                )
+            self.in_flight.discard(path)
+            queue.task_done()
+
+    def stop(self):
+        """Stop scanning; files already queued are still converted."""
+        self.stopping.set()
+
+    async def run(self):
+        """Watch and convert until stop() is called."""
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self.executor = ProcessPoolExecutor(max_workers=self.jobs)
+        try:
+            workers = [asyncio.create_task(self._worker(queue)) for _ in range(self.jobs)]
+            log.info("watching %s with %d workers", ", ".join(self.directories), self.jobs)
+            await self._scanner(queue)
+
+            # Drain what was already accepted, then shut the workers down
+            await queue.join()
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+        finally:
+            self.executor.shutdown()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Watch directories and convert Blue and IQ.TAR files to SigMF")
+    parser.add_argument("directories", nargs="+", help="landing directories to watch")
+    parser.add_argument("--done-list", default="iq_watch_done.jsonl", help="JSON-lines record of converted files")
+    parser.add_argument("-j", "--jobs", type=int, default=2, help="number of conversion processes")
+    parser.add_argument("--queue-size", type=int, default=8, help="complete files allowed to wait for a worker")
+    parser.add_argument("--interval", type=float, default=5.0, help="seconds between directory scans")
+    parser.add_argument("--settle", type=float, default=10.0, help="seconds a file must stay unchanged")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="samples per chunk for Blue files")
+    parser.add_argument(
+        "--retry-delay", type=float, default=RETRY_DELAY, help="seconds before a failed file is retried"
+    )
+    parser.add_argument(
+        "--retry-max-delay", type=float, default=RETRY_MAX_DELAY, help="longest delay between retries of a failed file"
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+
+    for directory in args.directories:
+        if not os.path.isdir(directory):
+            parser.error(f"Not a directory: {directory}")
+
+    async def serve():
+        daemon = WatchDaemon(
+            args.directories,
+            args.done_list,
+            jobs=max(args.jobs, 1),
+            queue_size=max(args.queue_size, 1),
+            interval=args.interval,
+            settle=args.settle,
+            chunk_size=args.chunk_size,
+            retry_delay=args.retry_delay,
+            retry_max_delay=args.retry_max_delay,
+        )
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, daemon.stop)
+        await daemon.run()
+
+    asyncio.run(serve())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
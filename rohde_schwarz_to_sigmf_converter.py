@@ -9,24 +9,247 @@
 """Rohde and Schwarz Converter"""
 
 import io
+import os
+import json
+import time
+import hashlib
 import logging
 import tarfile
 import getpass
 import tempfile
+import contextlib
 import xml.etree.ElementTree as ET
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 import numpy as np
 
-from .. import SigMFFile, fromfile
+from .. import SigMFCollection, SigMFFile, fromfile
 from ..error import SigMFConversionError
 from ..sigmffile import get_sigmf_filenames
 from ..utils import SIGMF_DATETIME_ISO8601_FMT
 
 log = logging.getLogger()
 
+# bytes of output written between checkpoints of a resumable conversion
+CHECKPOINT_INTERVAL = 256 * 1024 * 1024
+
+# preview traces are decimated to at most this many points, and rounded to this many decimals (dB)
+PREVIEW_MAX_POINTS = 1024
+PREVIEW_DECIMALS = 3
+
+# rohdeschwarz DataType -> SigMF datatype of the complex samples, R&S files are little endian
+DATATYPE_MAP = {
+    "int8": "ci8",
+    "int16": "ci16_le",
+    "int32": "ci32_le",
+    "float32": "cf32_le",
+    "float64": "cf64_le",
+}
+
+# SigMF datatype -> NumPy type of one I or Q element
+ELEMENT_DTYPES = {
+    "ci8": "i1",
+    "ci16_le": "<i2",
+    "ci32_le": "<i4",
+    "cf32_le": "<f4",
+    "cf64_le": "<f8",
+}
+
+# top-level rohdeschwarz XML fields read by the converter
+XML_FIELDS = (
+    "Name",
+    "Comment",
+    "Samples",
+    "Clock",
+    "Format",
+    "DataType",
+    "ScalingFactor",
+    "ScaleFactor",
+    "NumberOfChannels",
+    "DataFilename",
+    "UserData",
+    "EpochNanos",
+)
+
+
+class ConversionStats:
+    """
+    Wall time, CPU time and byte counts for each stage of a conversion.
+
+    Pass an instance to rohdeschwarz_to_sigmf() and read ``stages`` afterwards,
+    or give it a callback to be told about every timed section as it ends.
+
+    Parameters
+    ----------
+    callback : callable, optional
+        Called as ``callback(stage_name, record)`` after every timed section,
+        with the running totals of that stage.
+    """
+
+    def __init__(self, callback: Optional[Callable[[str, dict], None]] = None):
+        self.callback = callback
+        self.stages = {}
+
+    @contextlib.contextmanager
+    def stage(self, name: str) -> Iterator[dict]:
+        """Time a section of work and add it to the totals of stage ``name``, yielding the stage record."""
+        record = self.stages.setdefault(
+            name, {"wall_seconds": 0.0, "cpu_seconds": 0.0, "bytes_read": 0, "bytes_written": 0, "calls": 0}
+        )
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield record
+        finally:
+            record["wall_seconds"] += time.perf_counter() - wall_start
+            record["cpu_seconds"] += time.process_time() - cpu_start
+            record["calls"] += 1
+            if self.callback is not None:
+                self.callback(name, record)
+
+    def as_dict(self) -> dict:
+        """Stage records as a plain dict, ready to export as JSON."""
+        return {name: dict(record) for name, record in self.stages.items()}
+
+
+def _stage(stats: Optional[ConversionStats], name: str):
+    """Time a stage on ``stats``, or do nothing when no stats object was given."""
+    if stats is None:
+        return contextlib.nullcontext({"bytes_read": 0, "bytes_written": 0})
+    return stats.stage(name)
+
+
+class ConversionCheckpoint:
+    """
+    Resumable output of one conversion.
+
+    The data file is written as ``<data file>.partial`` and renamed once complete. Every ``interval`` bytes
+    the samples done and the SHA-512 of the output so far are saved to ``<data file>.checkpoint``, so an
+    interrupted conversion of the same archive with the same options continues from there. Hash objects
+    cannot be saved, so on resume the written prefix is read back, hashed and checked against the saved digest.
+
+    Parameters
+    ----------
+    data_path : Path
+        Final path of the .sigmf-data file.
+    fingerprint : dict
+        Source fingerprint, see _source_fingerprint(). A checkpoint left by another source or options is ignored.
+    interval : int, optional
+        Bytes of output between checkpoints, CHECKPOINT_INTERVAL by default.
+    """
+
+    def __init__(self, data_path: Path, fingerprint: dict, interval: Optional[int] = None):
+        self.data_path = Path(data_path)
+        self.partial_path = self.data_path.with_name(self.data_path.name + ".partial")
+        self.path = self.data_path.with_name(self.data_path.name + ".checkpoint")
+        self.fingerprint = fingerprint
+        self.interval = CHECKPOINT_INTERVAL if interval is None else interval
+        self.sha512 = hashlib.sha512()
+        self.samples_done = 0
+        self.bytes_done = 0
+        self._saved_bytes = 0
+
+    def load(self, stats: Optional[ConversionStats] = None, bufsize: int = 1024 * 1024) -> int:
+        """Continue from the last valid checkpoint. Returns the number of samples already converted."""
+        try:
+            saved = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return 0
+        if saved.get("fingerprint") != self.fingerprint:
+            log.debug("ignoring checkpoint %s left by a different source or options", self.path)
+            return 0
+
+        # re-hash the prefix the checkpoint covers, so the final hash includes it
+        sha512 = hashlib.sha512()
+        remaining = saved["bytes_done"]
+        try:
+            with _stage(stats, "hashing") as record, open(self.partial_path, "rb") as handle:
+                while remaining and (chunk := handle.read(min(bufsize, remaining))):
+                    sha512.update(chunk)
+                    remaining -= len(chunk)
+                    record["bytes_read"] += len(chunk)
+        except OSError:
+            return 0
+        if remaining or sha512.hexdigest() != saved["sha512"]:
+            log.debug("partial output %s does not match its checkpoint, starting again", self.partial_path)
+            return 0
+
+        self.sha512 = sha512
+        self.samples_done = saved["samples_done"]
+        self.bytes_done = self._saved_bytes = saved["bytes_done"]
+        log.info("resuming %s after %d samples", self.data_path, self.samples_done)
+        return self.samples_done
+
+    def advance(self, samples: int, nbytes: int, handle) -> None:
+        """Count output that is written to ``handle`` and hashed, saving a checkpoint every ``interval`` bytes."""
+        self.samples_done += samples
+        self.bytes_done += nbytes
+        if self.bytes_done - self._saved_bytes >= self.interval:
+            self.save(handle)
+
+    def save(self, handle) -> None:
+        """Save a checkpoint of the output written so far to ``handle``."""
+        # the checkpoint must never claim data that is not on disk yet
+        handle.flush()
+        os.fsync(handle.fileno())
+        temp_path = self.path.with_name(self.path.name + ".tmp")
+        temp_path.write_text(
+            json.dumps(
+                {
+                    "fingerprint": self.fingerprint,
+                    "samples_done": self.samples_done,
+                    "bytes_done": self.bytes_done,
+                    "sha512": self.sha512.hexdigest(),
+                }
+            )
+        )
+        os.replace(temp_path, self.path)
+        self._saved_bytes = self.bytes_done
+
+    def finish(self) -> None:
+        """Move the completed output to its final name and drop the checkpoint."""
+        os.replace(self.partial_path, self.data_path)
+        self.path.unlink(missing_ok=True)
+
+
+def _source_fingerprint(rohdeschwarz_path: Path, xml_bytes: bytes, options: Optional[dict] = None) -> dict:
+    """
+    Fingerprint an IQ.TAR archive so that a later run can tell whether it changed.
+
+    Parameters
+    ----------
+    rohdeschwarz_path : Path
+        Path to the IQ.TAR archive.
+    xml_bytes : bytes
+        Content of its XML member, see _read_iq_tar_index().
+    options : dict, optional
+        Conversion options that change the output.
+
+    Returns
+    -------
+    dict
+        Size, modification time, XML hash and options, as stored in ``rohdeschwarz:source_fingerprint``.
+    """
+    stat = Path(rohdeschwarz_path).stat()
+    return {
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "header_sha256": hashlib.sha256(xml_bytes).hexdigest(),
+        "options": options or {},
+    }
+
+
+def _is_up_to_date(meta_path: Path, data_path: Path, fingerprint: dict) -> bool:
+    """Check whether ``meta_path`` records the same source fingerprint and ``data_path`` exists."""
+    try:
+        recorded = json.loads(Path(meta_path).read_text())["global"].get("rohdeschwarz:source_fingerprint")
+    except (OSError, ValueError, KeyError, TypeError):
+        return False
+    return recorded == fingerprint and Path(data_path).exists()
+
+
 def xml_to_dict(elem):
     """
     Preview trace is a defined in IQ.TAR files as an XML sctructure - convert to JSON
@@ -60,6 +283,137 @@ def xml_to_dict(elem):
     return result
 
 
+def _encode_trace(values: np.ndarray, reduce: np.ufunc, max_points: Optional[int]) -> dict:
+    """
+    Encode a preview trace compactly as numbers.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        Trace values.
+    reduce : numpy.ufunc
+        Combines the points of a decimation block: np.minimum for a Min trace, np.maximum for a Max
+        trace, np.add (averaged) otherwise, so the decimated trace keeps the envelope of the original.
+    max_points : int, optional
+        Decimate the trace to at most this many points. None keeps every point.
+
+    Returns
+    -------
+    dict
+        Original length, decimation factor, minimum, maximum and the (decimated) values.
+    """
+    length = values.size
+    decimation = 1 if not max_points or length <= max_points else -(-length // max_points)
+    if decimation > 1:
+        starts = np.arange(0, length, decimation)
+        reduced = reduce.reduceat(values, starts)
+        if reduce is np.add:
+            reduced /= np.diff(np.append(starts, length))
+        values_out = reduced
+    else:
+        values_out = values
+    return {
+        "length": length,
+        "decimation": decimation,
+        "min": float(values.min()) if length else None,
+        "max": float(values.max()) if length else None,
+        "values": np.round(values_out, PREVIEW_DECIMALS).tolist(),
+    }
+
+
+def _decode_preview(preview_xml: bytes) -> Tuple[ET.Element, List[np.ndarray]]:
+    """
+    Decode every ArrayOfFloat of the PreviewData XML in bulk.
+
+    The <float> elements are never parsed as XML. The text of each array is cut out of the bytes and
+    converted by NumPy in one call, and the array is replaced by an empty ``<ArrayOfFloat trace="i"/>``
+    so that only the small remaining structure goes through the XML parser.
+
+    Returns
+    -------
+    tuple of (Element, list of numpy.ndarray)
+        PreviewData element, and the trace values indexed by the ``trace`` attribute.
+    """
+    parts = []
+    traces = []
+    pos = 0
+    while (begin := preview_xml.find(b"<ArrayOfFloat", pos)) >= 0:
+        tag_end = preview_xml.find(b">", begin)
+        if preview_xml[tag_end - 1 : tag_end] == b"/":
+            # empty <ArrayOfFloat .../> - leave it to the XML parser
+            parts.append(preview_xml[pos : tag_end + 1])
+            pos = tag_end + 1
+            continue
+        end = preview_xml.find(b"</ArrayOfFloat>", tag_end)
+        if end < 0:
+            raise SigMFConversionError("Invalid rohdeschwarz XML: unterminated ArrayOfFloat in PreviewData")
+        text = preview_xml[tag_end + 1 : end].replace(b"<float>", b" ").replace(b"</float>", b" ")
+        try:
+            traces.append(np.array(text.split(), dtype=np.float64))
+        except ValueError as err:
+            raise SigMFConversionError(f"Invalid rohdeschwarz preview trace: {err}") from err
+        parts.append(preview_xml[pos:begin])
+        parts.append(b'%s trace="%d"/>' % (preview_xml[begin:tag_end], len(traces) - 1))
+        pos = end + len(b"</ArrayOfFloat>")
+    parts.append(preview_xml[pos:])
+
+    try:
+        return ET.fromstring(b"".join(parts)), traces
+    except ET.ParseError as err:
+        raise SigMFConversionError(f"Invalid rohdeschwarz PreviewData: {err}") from err
+
+
+def _preview_element_to_dict(elem: ET.Element, traces: List[np.ndarray], max_points: Optional[int], reduce: np.ufunc):
+    """Convert a decoded PreviewData element like xml_to_dict(), encoding its traces with _encode_trace()."""
+    if elem.tag == "ArrayOfFloat":
+        trace = elem.get("trace")
+        values = traces[int(trace)] if trace is not None else np.empty(0)
+        return _encode_trace(values, reduce, max_points)
+
+    text = (elem.text or "").strip()
+    if text and len(elem) == 0:
+        return text
+
+    if elem.tag == "Min":
+        reduce = np.minimum
+    elif elem.tag == "Max":
+        reduce = np.maximum
+
+    result = dict(elem.attrib)
+    for child in elem:
+        child_value = _preview_element_to_dict(child, traces, max_points, reduce)
+        # repeated tags (e.g. several <Channel>) become a list
+        if child.tag in result:
+            if not isinstance(result[child.tag], list):
+                result[child.tag] = [result[child.tag]]
+            result[child.tag].append(child_value)
+        else:
+            result[child.tag] = child_value
+    return result
+
+
+def preview_to_dict(preview_xml: bytes, max_points: Optional[int] = PREVIEW_MAX_POINTS) -> dict:
+    """
+    Convert PreviewData to a dict like xml_to_dict(), with every trace decoded in bulk to a NumPy array
+    and stored as compact numbers, see _encode_trace().
+
+    Parameters
+    ----------
+    preview_xml : bytes
+        PreviewData element as XML, see _parse_rohdeschwarz_xml().
+    max_points : int, optional
+        Decimate traces to at most this many points, keeping the envelope of Min and Max traces.
+        None keeps every point.
+
+    Returns
+    -------
+    dict
+        Converted PreviewData.
+    """
+    root, traces = _decode_preview(preview_xml)
+    return _preview_element_to_dict(root, traces, max_points, np.add)
+
+
 def extract_iq_tar_to_directory(rohdeschwarz_path, file_dest_dir=None):
     tar_path = Path(rohdeschwarz_path)
 
@@ -78,37 +432,156 @@ def extract_iq_tar_to_directory(rohdeschwarz_path, file_dest_dir=None):
     # Assuming there is only one XML file in the archive, return its path for further processing
     return xml_files[0]  
 
-def _text_of(root: ET.Element, tag: str) -> Optional[str]:
-    """Extract and strip text from XML element."""
-    elem = root.find(tag)
-    return elem.text.strip() if (elem is not None and elem.text is not None) else None
 
-def validate_rohdeschwarz(xml_path: Path) -> None:
+def _read_iq_tar_index(rohdeschwarz_path: Path, xml_only: bool = False) -> Tuple[bytes, dict]:
+    """
+    Locate the members of an IQ.TAR archive without extracting it.
+
+    IQ.TAR archives are uncompressed, so the samples of the data member can be read in place at its
+    offset within the archive.
+
+    Parameters
+    ----------
+    rohdeschwarz_path : Path
+        Path to the IQ.TAR archive.
+    xml_only : bool, optional
+        Stop at the XML member, for callers that only need the metadata. The members behind it are
+        then missing from the returned dict.
+
+    Returns
+    -------
+    tuple of (bytes, dict)
+        Content of the XML member, and the (offset, size) in bytes of every file member by file name.
+
+    Raises
+    ------
+    SigMFConversionError
+        If the archive is compressed or not a tar archive.
+    """
+    try:
+        tar = tarfile.open(rohdeschwarz_path, "r:")
+    except tarfile.ReadError as err:
+        raise SigMFConversionError(f"Cannot read {rohdeschwarz_path} as an uncompressed tar archive: {err}") from err
+
+    xml_bytes = None
+    members = {}
+    with tar:
+        for member in tar:
+            if not member.isfile():
+                continue
+            members[Path(member.name).name] = (member.offset_data, member.size)
+            if xml_bytes is None and member.name.lower().endswith(".xml"):
+                xml_bytes = tar.extractfile(member).read()
+                if xml_only:
+                    break
+
+    if xml_bytes is None:
+        raise FileNotFoundError("No XML metadata file found inside IQ.TAR archive")
+    return xml_bytes, members
+
+
+def _parse_rohdeschwarz_xml(
+    xml_path: Union[Path, bytes], preview: bool = False
+) -> Tuple[Dict[str, Optional[str]], Optional[bytes]]:
+    """
+    Read the fields the converter needs from the rohdeschwarz XML in a single streaming pass.
+
+    Each field element is dropped as soon as its text is read, so no tree is built. PreviewData is the
+    last element of the iq-tar format and by far the largest, so the parse stops where it starts and the
+    preview traces are never tokenized. When ``preview`` is set the raw PreviewData is handed back for
+    preview_to_dict() to decode.
+
+    Parameters
+    ----------
+    xml_path : Path or bytes
+        Path to the rohdeschwarz XML file, or its content as read out of the archive.
+    preview : bool, optional
+        When True, return the PreviewData element as XML bytes.
+
+    Returns
+    -------
+    tuple of (dict, bytes or None)
+        Stripped text of every field in XML_FIELDS that is present, and the PreviewData XML.
+
+    Raises
+    ------
+    SigMFConversionError
+        If the XML is not well formed.
+    """
+    xml_bytes = xml_path if isinstance(xml_path, bytes) else Path(xml_path).read_bytes()
+    fields = {}
+    preview_xml = None
+    depth = 0
+    try:
+        for event, elem in ET.iterparse(io.BytesIO(xml_bytes), events=("start", "end")):
+            if event == "start":
+                depth += 1
+                if elem.tag == "PreviewData":
+                    break
+                continue
+            depth -= 1
+            if depth == 1:
+                # direct child of the root element - keep the first of each field
+                if elem.tag in XML_FIELDS and elem.tag not in fields:
+                    fields[elem.tag] = elem.text.strip() if elem.text is not None else None
+                elem.clear()
+        else:
+            preview = False
+    except ET.ParseError as err:
+        raise SigMFConversionError(f"Invalid rohdeschwarz XML: {err}") from err
+
+    if preview:
+        begin = xml_bytes.find(b"<PreviewData")
+        end = xml_bytes.rfind(b"</PreviewData>")
+        if begin >= 0 and end > begin:
+            preview_xml = xml_bytes[begin : end + len(b"</PreviewData>")]
+    return fields, preview_xml
+
+
+def _iq_file_size(xml_path: Union[Path, bytes], datafilename: str, members: Optional[dict]) -> int:
+    """Size of the IQ file, from the archive members or from the file next to an extracted XML."""
+    if members is not None:
+        if Path(datafilename).name not in members:
+            raise SigMFConversionError(f"Could not find associated IQ file in archive: {datafilename}")
+        return members[Path(datafilename).name][1]
+    iq_file_path = Path(xml_path).parent / datafilename
+    if not iq_file_path.exists():
+        raise SigMFConversionError(f"Could not find associated IQ file: {iq_file_path}")
+    return iq_file_path.stat().st_size
+
+def validate_rohdeschwarz(
+    xml_path: Union[Path, bytes], members: Optional[dict] = None, fields: Optional[dict] = None
+) -> None:
     """
     Validate required rohdeschwarz XML metadata fields and associated IQ file.
 
     Parameters
     ----------
-    xml_path : Path
-        Path to the rohdeschwarz XML file.
+    xml_path : Path or bytes
+        Path to the rohdeschwarz XML file, or its content.
+    members : dict, optional
+        Archive members from _read_iq_tar_index(), to find the IQ file in the archive instead of next
+        to the XML file.
+    fields : dict, optional
+        Fields already read by _parse_rohdeschwarz_xml(), so the XML is not parsed again.
 
     Raises
     ------
     SigMFConversionError
         If required fields are missing or invalid, or IQ file doesn't exist.
     """
-    tree = ET.parse(xml_path)
-    root = tree.getroot()
+    if fields is None:
+        fields, _ = _parse_rohdeschwarz_xml(xml_path)
 
     # validate CenterFrequency
-    center_freq_raw = _text_of(root, "Clock")
+    center_freq_raw = fields.get("Clock")
     try:
         center_frequency = float(center_freq_raw)
     except (TypeError, ValueError) as err:
         raise SigMFConversionError(f"Invalid or missing CenterFrequency: {center_freq_raw}") from err
 
     # validate SampleRate
-    num_samples_raw = _text_of(root, "Samples")
+    num_samples_raw = fields.get("Samples")
     try:
         sample_rate = float(num_samples_raw)
     except (TypeError, ValueError) as err:
@@ -118,60 +591,71 @@ def validate_rohdeschwarz(xml_path: Path) -> None:
         raise SigMFConversionError(f"Invalid SampleRate: {sample_rate} (must be > 0)")
 
     # validate ScalingFactor, for example, "1"
-    scaling_factor_raw = _text_of(root, "ScalingFactor")
+    scaling_factor_raw = fields.get("ScalingFactor")
     if scaling_factor_raw is None:
         raise SigMFConversionError("Missing ScalingFactor in rohdeschwarz XML")
 
     # validate DataType, for example, "float32"
-    data_type_raw = _text_of(root, "DataType")
-    if data_type_raw == "int8" or data_type_raw == "int16" or data_type_raw == "int32":
-         raise SigMFConversionError("Data types int8, int16, or int32 are not currently supported in the converter")
-    if data_type_raw == "float64":
-         raise SigMFConversionError("Data type float64 is not currently supported in the converter")
+    data_type_raw = fields.get("DataType")
     if data_type_raw is None:
         raise SigMFConversionError("Missing DataType in rohdeschwarz XML")
+    if data_type_raw not in DATATYPE_MAP:
+        raise SigMFConversionError(f"Unsupported rohdeschwarz DataType: {data_type_raw}")
 
     # TODO: Determine if support should be added to determine for real and polar
     # validate Format - expecting "complex"
-    format_raw = _text_of(root, "Format")
+    format_raw = fields.get("Format")
     if format_raw == "real" or format_raw == "polar":
          raise SigMFConversionError("Real an Polar Formats are not currently supported in the converter")
     if format_raw is None:
          raise SigMFConversionError("Missing Format in rohdeschwarz XML")
 
     # validate channel for example, "1"
-    numberofchannels_raw = _text_of(root, "NumberOfChannels")
+    numberofchannels_raw = fields.get("NumberOfChannels")
     if numberofchannels_raw is None:
         # Missing NumberOfChannels in rohdeschwarz XML so use 1
         numberofchannels_raw =1
+    try:
+        numberofchannels = int(numberofchannels_raw)
+    except (TypeError, ValueError) as err:
+        raise SigMFConversionError(f"Invalid NumberOfChannels: {numberofchannels_raw}") from err
+    if numberofchannels < 1:
+        raise SigMFConversionError(f"Invalid NumberOfChannels: {numberofchannels} (must be >= 1)")
    
     # validate associated IQ file exists - example IQ file name "File.complex.1ch.float32"
-    datafilename_raw = _text_of(root, "DataFilename")
+    datafilename_raw = fields.get("DataFilename")
     if datafilename_raw is None:
         raise SigMFConversionError("Missing DataFilename in rohdeschwarz XML")
 
-    iq_file_path = xml_path.parent / datafilename_raw
-
-    # iq_file_path = xml_path # Not assuming .iq extension for the associated IQ file
-    if not iq_file_path.exists():
-        raise SigMFConversionError(f"Could not find associated IQ file: {iq_file_path}")
+    # Not assuming .iq extension for the associated IQ file
+    filesize = _iq_file_size(xml_path, datafilename_raw, members)
 
-    # validate IQ file size is aligned to sample boundary
-    filesize = iq_file_path.stat().st_size
-    elem_size = np.dtype(np.float32).itemsize
-    frame_bytes = 2 * elem_size  # I and Q components
+    # validate IQ file size is aligned to sample boundary - one sample holds I and Q of every channel
+    elem_size = np.dtype(ELEMENT_DTYPES[DATATYPE_MAP[data_type_raw]]).itemsize
+    frame_bytes = 2 * elem_size * numberofchannels  # I and Q components
     if filesize % frame_bytes != 0:
         raise SigMFConversionError(f"IQ file size {filesize} not divisible by {frame_bytes}; partial sample present")
 
 
-def _build_metadata(xml_path: Path) -> Tuple[dict, dict, list, int]:
+def _build_metadata(
+    xml_path: Union[Path, bytes],
+    members: Optional[dict] = None,
+    preview: bool = False,
+    preview_points: Optional[int] = PREVIEW_MAX_POINTS,
+) -> Tuple[dict, dict, list, int]:
     """
     Build SigMF metadata components from the rohdeschwarz XML file.
 
     Parameters
     ----------
-    xml_path : Path
-        Path to the rohdeschwarz XML file.
+    xml_path : Path or bytes
+        Path to the rohdeschwarz XML file, or its content.
+    members : dict, optional
+        Archive members from _read_iq_tar_index(), see validate_rohdeschwarz().
+    preview : bool, optional
+        When True, include PreviewData as ``rohdeschwarz:preview_trace``. It is not parsed otherwise.
+    preview_points : int, optional
+        Decimate preview traces to at most this many points, see preview_to_dict().
 
     Returns
     -------
@@ -185,19 +669,16 @@ def _build_metadata(xml_path: Path) -> Tuple[dict, dict, list, int]:
     """
     log.info("converting rohdeschwarz xml metadata to sigmf format")
 
-    xml_path = Path(xml_path)
-    tree = ET.parse(xml_path)
-    root = tree.getroot()
-
-    # validate required fields and associated IQ file
-    validate_rohdeschwarz(xml_path)
+    # one pass over the XML for every field, validated without parsing it again
+    fields, preview_xml = _parse_rohdeschwarz_xml(xml_path, preview)
+    validate_rohdeschwarz(xml_path, members, fields)
 
     # extract and convert required fields
 
     # TODO: R&S files don't seem to have a center frequency field, so maybe add a comment about this being an Oscilloscope capture.
     center_frequency = float("0")
 
-    numberofchannels_raw = _text_of(root, "NumberOfChannels")
+    numberofchannels_raw = fields.get("NumberOfChannels")
 
     if numberofchannels_raw is None:
         # Missing NumberOfChannels in R&S XML → default to 1
@@ -205,29 +686,25 @@ def _build_metadata(xml_path: Path) -> Tuple[dict, dict, list, int]:
     else:
         numberofchannels = int(numberofchannels_raw)
 
-    sample_rate = float(_text_of(root, "Clock")) 
+    sample_rate = float(fields.get("Clock")) 
     
-    data_type_raw = _text_of(root, "DataType")
+    data_type_raw = fields.get("DataType")
 
     # optional EpochNanos field
     epoch_nanos = None
-    epoch_nanos_raw = _text_of(root, "EpochNanos")
+    epoch_nanos_raw = fields.get("EpochNanos")
     if epoch_nanos_raw:
         try:
             epoch_nanos = int(epoch_nanos_raw)
         except ValueError:
             log.warning(f"could not parse EpochNanos: {epoch_nanos_raw}")
 
-    # TODO: Determine if other datatypes are used and if so, use similar logic to blue file for datatypes 
-    # R&S seem to be little endian
-    if data_type_raw == "float32":
-        data_type = "cf32_le"  # complex float32 little-endian
-    else:
-        raise SigMFConversionError(f"Unsupported rohdeschwarz DataType: {data_type_raw}")
+    # R&S samples are little endian, every DataType maps to a native SigMF datatype
+    data_type = DATATYPE_MAP[data_type_raw]
 
     # optional fields - only convert if present and valid
     scaling_factor = None
-    scaling_factor_raw = _text_of(root, "ScalingFactor")
+    scaling_factor_raw = fields.get("ScalingFactor")
     if scaling_factor_raw:
         try:
             scaling_factor = float(scaling_factor_raw)
@@ -235,7 +712,7 @@ def _build_metadata(xml_path: Path) -> Tuple[dict, dict, list, int]:
             log.warning(f"could not parse ScalingFactor: {scaling_factor_raw}")
 
     datafilename  = None
-    datafilename_raw = _text_of(root, "DataFilename")
+    datafilename_raw = fields.get("DataFilename")
     if datafilename_raw:
         try:
             datafilename  = str(datafilename_raw)
@@ -243,24 +720,23 @@ def _build_metadata(xml_path: Path) -> Tuple[dict, dict, list, int]:
             log.warning(f"could not parse DataFileName: {datafilename_raw}")
 
     scale_factor = None
-    scale_factor_raw = _text_of(root, "ScaleFactor")
+    scale_factor_raw = fields.get("ScaleFactor")
     if scale_factor_raw:
         try:
             scale_factor = float(scale_factor_raw)
         except ValueError:
             log.warning(f"could not parse ScaleFactor: {scale_factor_raw}")
 
-    # parse optional preview data if present
-    preview_node = root.find(".//PreviewData")
-    if preview_node is not None:
-        preview_data = xml_to_dict(preview_node)
+    # convert optional preview data if it was asked for and is present
+    if preview_xml is not None:
+        preview_data = preview_to_dict(preview_xml, preview_points)
     else:
         preview_data = None    
 
-    name = _text_of(root, "Name")
-    comment = _text_of(root, "Comment")
-    userdata = _text_of(root, "UserData")
-    datafilename = _text_of(root, "DataFilename")
+    name = fields.get("Name")
+    comment = fields.get("Comment")
+    userdata = fields.get("UserData")
+    datafilename = fields.get("DataFilename")
 
     # build hardware description with available information
     hw_parts = []
@@ -278,16 +754,14 @@ def _build_metadata(xml_path: Path) -> Tuple[dict, dict, list, int]:
 
     hardware_description = ", ".join(hw_parts) if hw_parts else "Rohde and Schwarz Device"
 
-    # strip the extension from the original file path
-    data_file_path = xml_path.parent / Path(datafilename).name
-    filesize = data_file_path.stat().st_size
+    filesize = _iq_file_size(xml_path, datafilename, members)
 
-    # TODO: Validate for R&S
-    # # R&S IQ.TAR uses complex float32 IQ data -> cf32_le in SigMF terms
-    elem_size = np.dtype(np.float32).itemsize
-    frame_bytes = 2 * elem_size  # I and Q components
+    # channels are interleaved sample by sample (I and Q of channel 1, then of channel 2, ...),
+    # which is also the SigMF multi-channel layout
+    elem_size = np.dtype(ELEMENT_DTYPES[data_type]).itemsize
+    frame_bytes = 2 * elem_size * numberofchannels  # I and Q components of every channel
 
-    # calculate sample count using the original IQ data file size
+    # calculate the per-channel sample count using the original IQ data file size
     sample_count_calculated = filesize // frame_bytes
     log.debug("sample count: %d", sample_count_calculated)
 
@@ -351,50 +825,288 @@ def _build_metadata(xml_path: Path) -> Tuple[dict, dict, list, int]:
     return global_md, capture_info, annotations, sample_count_calculated
 
 
-def convert_iq_data(data_file_path: Path, sample_count: int) -> np.ndarray:
+def convert_iq_data(
+    data_file_path: Path,
+    sample_count: int,
+    stats: Optional[ConversionStats] = None,
+    start: int = 0,
+    data_offset: int = 0,
+    num_channels: int = 1,
+    datatype: str = "cf32_le",
+) -> np.ndarray:
     """
     Convert IQ data in .iq file to SigMF based on values in rohdeschwarz XML file.
 
+    The samples are memory mapped in place rather than read into memory, so they can be written out
+    in chunks straight from the page cache.
+
     Parameters
     ----------
     data_file_path : Path
-        Path to the IQ file.
+        Path to the IQ file, or to the IQ.TAR archive holding it.
     sample_count : int
         Number of samples to read.
+    stats : ConversionStats, optional
+        Records the 'data_transcode' stage.
+    start : int, optional
+        Index of the first sample to read. The read starts at its byte offset.
+    data_offset : int, optional
+        Byte offset of the IQ data within ``data_file_path``, the member offset for an archive.
+    num_channels : int, optional
+        Number of interleaved channels. ``sample_count`` and ``start`` count samples per channel.
+    datatype : str, optional
+        Native SigMF datatype of the samples, from the DataType field, see DATATYPE_MAP.
 
     Returns
     -------
     numpy.ndarray
-        Parsed samples.
+        Parsed samples, a read-only memory map of the interleaved I and Q of every channel.
     """
     log.debug("parsing rohdeschwarz file data values")
 
-    # calculate element count (I and Q samples)
-    elem_count = sample_count * 2  # *2 for I and Q samples
-
-    # complex 32-bit float IQ data > cf32_le in SigMF
-    elem_size = np.dtype(np.float32).itemsize
+    # calculate element count (I and Q samples of every channel)
+    elem_count = sample_count * 2 * num_channels  # *2 for I and Q samples
 
-    # TODO: Investigate for R&S and validate multichannel  
-    # read raw interleaved float32 IQ
-    samples = np.fromfile(data_file_path, dtype=np.float32, offset=0, count=elem_count)
+    # I and Q elements keep their native type, e.g. int16 for ci16_le
+    elem_dtype = np.dtype(ELEMENT_DTYPES[datatype])
+    elem_size = elem_dtype.itemsize
 
-    # trim trailing partial bytes
-    if samples.nbytes % elem_size != 0:
-        trim = samples.nbytes % elem_size
-        log.warning("trimming %d trailing byte(s) to align samples", trim)
-        samples = samples[: -(trim // elem_size)]
+    # map raw interleaved IQ - the pages are only read as the samples are written out
+    with _stage(stats, "data_transcode") as record:
+        if elem_count == 0:
+            samples = np.empty(0, dtype=elem_dtype)
+        else:
+            samples = np.memmap(
+                data_file_path,
+                dtype=elem_dtype,
+                mode="r",
+                offset=data_offset + start * 2 * elem_size * num_channels,
+                shape=(elem_count,),
+            )
+        record["bytes_read"] += samples.nbytes
 
     return samples
 
 
+def _resolve_window(
+    capture_info: dict,
+    sample_rate: float,
+    sample_count: int,
+    start: Optional[int] = None,
+    count: Optional[int] = None,
+    start_time: Optional[Union[float, datetime]] = None,
+    duration: Optional[float] = None,
+) -> Tuple[int, int]:
+    """
+    Resolve a sample range or a time window to a first sample and a count.
+
+    Parameters
+    ----------
+    capture_info : dict
+        Capture metadata, whose datetime (from EpochNanos) anchors absolute times.
+    sample_rate : float
+        Sample rate in Hz, from the XML Clock.
+    sample_count : int
+        Number of samples in the recording.
+    start, count : int, optional
+        First sample and number of samples.
+    start_time : float or datetime, optional
+        Time of the first sample, in seconds from the start of the recording
+        or as an absolute timezone-aware datetime.
+    duration : float, optional
+        Length of the window in seconds.
+
+    Returns
+    -------
+    tuple of (int, int)
+        First sample and number of samples, clipped to the recording.
+
+    Raises
+    ------
+    SigMFConversionError
+        If the window is inconsistent, starts before the recording or
+        starts after its end.
+    """
+    if start_time is not None and start is not None:
+        raise SigMFConversionError("Give either start or start_time, not both")
+    if duration is not None and count is not None:
+        raise SigMFConversionError("Give either count or duration, not both")
+
+    if isinstance(start_time, datetime):
+        if SigMFFile.DATETIME_KEY not in capture_info:
+            raise SigMFConversionError("Absolute start_time needs EpochNanos in the rohdeschwarz XML")
+        capture_start = datetime.strptime(capture_info[SigMFFile.DATETIME_KEY], SIGMF_DATETIME_ISO8601_FMT)
+        start_time = (start_time - capture_start.replace(tzinfo=timezone.utc)).total_seconds()
+    if start_time is not None:
+        start = int(round(start_time * sample_rate))
+    if duration is not None:
+        count = int(round(duration * sample_rate))
+
+    start = start or 0
+    if start < 0:
+        raise SigMFConversionError(f"Window starts {-start} samples before the first sample of the recording")
+    if start > sample_count:
+        raise SigMFConversionError(f"Start sample {start} outside of recording with {sample_count} samples")
+    count = sample_count - start if count is None else max(min(count, sample_count - start), 0)
+    return start, count
+
+
+def _write_iq_data(
+    iq_data: np.ndarray,
+    data_path: Path,
+    chunk_size: int = 1024 * 1024,
+    stats: Optional[ConversionStats] = None,
+    checkpoint: Optional[ConversionCheckpoint] = None,
+    sample_elements: int = 2,
+    scale: Optional[float] = None,
+) -> str:
+    """
+    Write converted IQ data to the SigMF data file, hashing it as it is written.
+
+    Parameters
+    ----------
+    iq_data : numpy.ndarray
+        Converted samples.
+    data_path : Path
+        Path to the output data file.
+    chunk_size : int, optional
+        Number of elements written per chunk.
+    stats : ConversionStats, optional
+        Records the writes under 'data_transcode' and the hash updates under 'hashing'.
+    checkpoint : ConversionCheckpoint, optional
+        Append ``iq_data`` to the checkpoint's partial file after the samples it already holds, saving
+        progress as it is written, and move the file to ``data_path`` when done.
+    sample_elements : int, optional
+        Elements per sample, 2 for interleaved I and Q. Chunks and checkpoints fall on whole samples.
+    scale : float, optional
+        Write the elements as float32 multiplied by ``scale`` instead of passing them through.
+
+    Returns
+    -------
+    str
+        SHA-512 hex digest of the written data file.
+    """
+    sha512 = hashlib.sha512() if checkpoint is None else checkpoint.sha512
+    elements = np.ascontiguousarray(iq_data).reshape(-1)
+    chunk_size = max(chunk_size // sample_elements, 1) * sample_elements
+    # scaled chunks are converted into one reused buffer, so memory stays bounded by the chunk size
+    buffer = np.empty(min(chunk_size, elements.size), dtype=np.float32) if scale is not None else None
+
+    if checkpoint is None:
+        handle = open(data_path, "wb")
+    elif checkpoint.samples_done:
+        # drop anything written after the last checkpoint
+        handle = open(checkpoint.partial_path, "r+b")
+        handle.seek(checkpoint.bytes_done)
+        handle.truncate()
+    else:
+        handle = open(checkpoint.partial_path, "wb")
+
+    with handle:
+        for start in range(0, elements.size, chunk_size):
+            chunk = elements[start : start + chunk_size]
+            with _stage(stats, "data_transcode") as record:
+                if scale is not None:
+                    chunk = np.multiply(chunk, np.float32(scale), out=buffer[: chunk.size], casting="unsafe")
+                handle.write(chunk)
+                record["bytes_written"] += chunk.nbytes
+            with _stage(stats, "hashing") as record:
+                sha512.update(chunk)
+                record["bytes_read"] += chunk.nbytes
+            if checkpoint is not None:
+                checkpoint.advance(chunk.size // sample_elements, chunk.nbytes, handle)
+    if checkpoint is not None:
+        checkpoint.finish()
+
+    return sha512.hexdigest()
+
+
+def _write_channels(
+    iq_data: np.ndarray,
+    data_paths: List[Path],
+    chunk_size: int = 1024 * 1024,
+    stats: Optional[ConversionStats] = None,
+    threads: Optional[int] = None,
+    scale: Optional[float] = None,
+) -> List[str]:
+    """
+    De-interleave multi-channel IQ data into one SigMF data file per channel, hashing each as it is written.
+
+    The source is read once, a chunk at a time. The channels of each chunk are copied out, written and hashed
+    on a thread pool, so the files are written in parallel while memory stays bounded by the chunk size.
+
+    Parameters
+    ----------
+    iq_data : numpy.ndarray
+        Converted samples, the interleaved I and Q of every channel, see convert_iq_data().
+    data_paths : list of Path
+        Path to the output data file of each channel.
+    chunk_size : int, optional
+        Number of elements written per chunk and channel.
+    stats : ConversionStats, optional
+        Records the writes under 'data_transcode'. Hashing runs on the same threads and is included.
+    threads : int, optional
+        Number of writer threads, by default one per channel up to the number of CPUs.
+    scale : float, optional
+        Write the elements as float32 multiplied by ``scale``, see _write_iq_data().
+
+    Returns
+    -------
+    list of str
+        SHA-512 hex digest of each written data file.
+    """
+    # imported here like the other optional machinery, single-channel conversions never need it
+    from concurrent.futures import ThreadPoolExecutor
+
+    num_channels = len(data_paths)
+    frames = np.ascontiguousarray(iq_data).reshape(-1, num_channels, 2)
+    chunk_samples = max(chunk_size // 2, 1)
+    hashes = [hashlib.sha512() for _ in data_paths]
+
+    with contextlib.ExitStack() as stack:
+        handles = [stack.enter_context(open(path, "wb")) for path in data_paths]
+        workers = threads or min(num_channels, os.cpu_count() or 1)
+        executor = stack.enter_context(ThreadPoolExecutor(max_workers=workers))
+
+        def write_channel(channel: int, chunk: np.ndarray) -> int:
+            # numpy copies, file writes and sha512 all release the GIL
+            if scale is not None:
+                samples = np.multiply(chunk[:, channel, :], np.float32(scale), dtype=np.float32, casting="unsafe")
+            else:
+                samples = np.ascontiguousarray(chunk[:, channel, :])
+            handles[channel].write(samples)
+            hashes[channel].update(samples)
+            return samples.nbytes
+
+        for start in range(0, frames.shape[0], chunk_samples):
+            chunk = frames[start : start + chunk_samples]
+            with _stage(stats, "data_transcode") as record:
+                written = executor.map(write_channel, range(num_channels), [chunk] * num_channels)
+                record["bytes_written"] += sum(written)
+
+    return [sha512.hexdigest() for sha512 in hashes]
+
+
 def rohdeschwarz_to_sigmf(
     rohdeschwarz_path: Path,
     out_path: Optional[Path] = None,
     create_archive: bool = False,
     create_ncd: bool = False,
     overwrite: bool = False,
-) -> SigMFFile:
+    stats: Optional[ConversionStats] = None,
+    start: Optional[int] = None,
+    count: Optional[int] = None,
+    start_time: Optional[Union[float, datetime]] = None,
+    duration: Optional[float] = None,
+    resume: bool = False,
+    preview: bool = False,
+    preview_points: Optional[int] = PREVIEW_MAX_POINTS,
+    split_channels: bool = False,
+    create_collection: bool = False,
+    threads: Optional[int] = None,
+    output_datatype: Optional[str] = None,
+    checkpoint_interval: Optional[int] = None,
+) -> Union[SigMFFile, List[SigMFFile]]:
     """
     Read a rohdeschwarz file, optionally write sigmf archive, return associated SigMF object.
 
@@ -410,11 +1122,51 @@ def rohdeschwarz_to_sigmf(
         When True, create Non-Conforming Dataset
     overwrite : bool, optional
         If False, raise exception if output files already exist.
+    stats : ConversionStats, optional
+        Filled in with wall time, CPU time and bytes read and written for the
+        tar index, XML parse, data transcode, hashing and metadata write
+        stages.
+    start, count : int, optional
+        Convert only ``count`` samples from sample ``start``.
+    start_time : float or datetime, optional
+        Start of the window instead of ``start``, in seconds from the start of
+        the recording or as an absolute datetime resolved through EpochNanos.
+    duration : float, optional
+        Length of the window in seconds, instead of ``count``.
+    resume : bool, optional
+        Return the existing conversion without redoing it when its metadata records the same source
+        fingerprint, and continue an interrupted data file from its last checkpoint, see
+        ConversionCheckpoint. Only applies to separate meta and data files, archives and
+        Non-Conforming Datasets are always converted in full.
+    preview : bool, optional
+        When True, keep the PreviewData traces as ``rohdeschwarz:preview_trace``. By default they are
+        skipped without being parsed.
+    preview_points : int, optional
+        Preview traces are stored as numeric arrays decimated to at most this many points, keeping
+        their min/max envelope. None keeps every point.
+    split_channels : bool, optional
+        When True, de-interleave a multi-channel capture into one recording per channel, named
+        ``<out_path>_ch<N>``. By default all channels stay interleaved in one dataset with
+        ``core:num_channels`` set. Needs separate meta and data files and is always converted in full.
+    create_collection : bool, optional
+        When True, also write ``<out_path>.sigmf-collection`` listing the per-channel recordings.
+        Only with ``split_channels``.
+    threads : int, optional
+        Number of threads writing the per-channel recordings, see _write_channels().
+    output_datatype : str, optional
+        SigMF datatype of the converted data file. None or the native datatype of the DataType field
+        (ci8, ci16_le, ci32_le or cf64_le) passes the samples through unscaled. 'cf32_le' converts the
+        samples of every DataType, float32 included, to float32 multiplied by ScalingFactor, i.e. in Volt.
+        ``rohdeschwarz:scaling_applied`` records which one was written. Non-Conforming Datasets cannot
+        be scaled.
+    checkpoint_interval : int, optional
+        Write the data file with checkpoints every this many bytes even without ``resume``, so a later
+        resumed run can continue it. By default only resumed runs are checkpointed, at CHECKPOINT_INTERVAL.
 
     Returns
     -------
-    SigMFFile
-        SigMF object, potentially as Non-Conforming Dataset.
+    SigMFFile or list of SigMFFile
+        SigMF object, potentially as Non-Conforming Dataset, or one per channel with ``split_channels``.
 
     Raises
     ------
@@ -422,46 +1174,120 @@ def rohdeschwarz_to_sigmf(
         If the rohdeschwarz file cannot be read.
     """
 
-    xml_file_to_parse = extract_iq_tar_to_directory(rohdeschwarz_path)
+    # the archive is read in place - only the XML member is read here, the samples are mapped at their offset
+    tar_path = Path(rohdeschwarz_path)
+    with _stage(stats, "tar_index") as record:
+        xml_bytes, members = _read_iq_tar_index(tar_path)
+        record["bytes_read"] += len(xml_bytes)
+
+    # everything that changes the output goes in the fingerprint, so a re-run only skips identical conversions
+    fingerprint = _source_fingerprint(
+        tar_path,
+        xml_bytes,
+        {
+            "ncd": create_ncd or out_path is None,
+            "archive": create_archive,
+            "start": start,
+            "count": count,
+            "start_time": start_time.isoformat() if isinstance(start_time, datetime) else start_time,
+            "duration": duration,
+            "preview": preview,
+            "preview_points": preview_points,
+            "split_channels": split_channels,
+            "output_datatype": output_datatype,
+        },
+    )
+    if resume and out_path is not None and not (create_ncd or create_archive or split_channels):
+        filenames = get_sigmf_filenames(Path(out_path))
+        if _is_up_to_date(filenames["meta_fn"], filenames["data_fn"], fingerprint):
+            log.info("%s is up to date, skipping", tar_path)
+            return fromfile(filenames["meta_fn"], skip_checksum=True)
 
-    rohdeschwarz_path = Path(xml_file_to_parse)
     out_path = None if out_path is None else Path(out_path)
 
     # auto-enable NCD when no output path is specified
     if out_path is None:
         create_ncd = True
 
+    # the channels of a Non-Conforming Dataset or an archive stay interleaved
+    if split_channels and (create_ncd or create_archive):
+        raise SigMFConversionError("Channels can only be split into separate meta and data files")
+    if create_collection and not split_channels:
+        raise SigMFConversionError("A collection is only written for channels split into separate recordings")
+
     # call the SigMF conversion for metadata generation
-    global_info, capture_info, annotations, sample_count = _build_metadata(rohdeschwarz_path)
+    with _stage(stats, "xml_parse") as record:
+        global_info, capture_info, annotations, sample_count = _build_metadata(
+            xml_bytes, members, preview, preview_points
+        )
+        record["bytes_read"] += len(xml_bytes)
+    global_info["rohdeschwarz:source_fingerprint"] = fingerprint
+
+    # samples are passed through in their native datatype unless converted to float32 Volt
+    native_datatype = global_info[SigMFFile.DATATYPE_KEY]
+    if output_datatype not in (None, native_datatype, "cf32_le"):
+        raise SigMFConversionError(
+            f"Unsupported output datatype {output_datatype} for {native_datatype} samples, "
+            f"expected {native_datatype} or cf32_le"
+        )
+    # an explicit cf32_le is always in Volt, whatever the DataType - the spec assumes 1 V without ScalingFactor
+    scale = None
+    scaling_applied = output_datatype == "cf32_le"
+    if scaling_applied:
+        scaling_factor = global_info.get("rohdeschwarz:scaling_factor", 1.0)
+        if scaling_factor != 1.0 or native_datatype != "cf32_le":
+            if create_ncd:
+                raise SigMFConversionError("A Non-Conforming Dataset keeps the native samples, it cannot be scaled")
+            scale = scaling_factor
+        global_info[SigMFFile.DATATYPE_KEY] = output_datatype
+    global_info["rohdeschwarz:scaling_applied"] = scaling_applied
+
+    # narrow the conversion to the requested window - sample indices keep counting from the
+    # start of the recording (core:offset) and the capture time moves to the first sample
+    start, sample_count = _resolve_window(
+        capture_info, global_info[SigMFFile.SAMPLE_RATE_KEY], sample_count, start, count, start_time, duration
+    )
+    if start:
+        global_info[SigMFFile.OFFSET_KEY] = start
+        if SigMFFile.DATETIME_KEY in capture_info:
+            capture_start = datetime.strptime(capture_info[SigMFFile.DATETIME_KEY], SIGMF_DATETIME_ISO8601_FMT)
+            window_start = capture_start + timedelta(seconds=start / global_info[SigMFFile.SAMPLE_RATE_KEY])
+            capture_info[SigMFFile.DATETIME_KEY] = window_start.strftime(SIGMF_DATETIME_ISO8601_FMT)
+    for annotation in annotations:
+        annotation[SigMFFile.START_INDEX_KEY] = start
+        annotation[SigMFFile.LENGTH_INDEX_KEY] = sample_count
 
     # get filenames for metadata, data, and archive based on output path and input file name
     if out_path is None:
-        base_path = rohdeschwarz_path
+        base_path = tar_path
     else:
         base_path = Path(out_path)
 
     filenames = get_sigmf_filenames(base_path)
 
-    # Get unique IQ filename from global_info
+    # Get unique IQ filename from global_info, and where its samples start within the archive
     iq_filename = global_info.get("rohdeschwarz:iq_datafilename")
-    print(f"iq_filename: {iq_filename}")
-
+    log.debug("iq_filename: %s", iq_filename)
+    data_offset = members[Path(iq_filename).name][0]
+    num_channels = global_info[SigMFFile.NUM_CHANNELS_KEY]
 
     # create NCD if specified, otherwise create standard SigMF dataset or archive
     if create_ncd:
-        # rohdeschwarz files have no header or trailing bytes
-        global_info[SigMFFile.DATASET_KEY] = rohdeschwarz_path.with_suffix(".iq").name
-        global_info[SigMFFile.TRAILING_BYTES_KEY] = 0
-        capture_info[SigMFFile.HEADER_BYTES_KEY] = 0
-
-        # build the .iq file path for data file
-        data_file_path = rohdeschwarz_path.parent / iq_filename
+        # the dataset is the IQ.TAR archive itself - everything in front of the window (tar headers, the
+        # XML member and skipped samples) is header, everything behind it (including tar padding) is trailing
+        frame_bytes = 2 * np.dtype(ELEMENT_DTYPES[native_datatype]).itemsize * num_channels
+        header_bytes = data_offset + start * frame_bytes
+        global_info[SigMFFile.DATASET_KEY] = tar_path.name
+        global_info[SigMFFile.TRAILING_BYTES_KEY] = (
+            tar_path.stat().st_size - header_bytes - sample_count * frame_bytes
+        )
+        capture_info[SigMFFile.HEADER_BYTES_KEY] = header_bytes
 
         # create metadata-only SigMF for NCD pointing to original file
         meta = SigMFFile(global_info=global_info)
-        meta.set_data_file(data_file=data_file_path, offset=0)
+        meta.set_data_file(data_file=tar_path, offset=header_bytes, size_bytes=sample_count * frame_bytes)
         meta.data_buffer = io.BytesIO()
-        meta.add_capture(0, metadata=capture_info)
+        meta.add_capture(start, metadata=capture_info)
 
         # add annotations from metadata
         for annotation in annotations:
@@ -477,33 +1303,99 @@ def rohdeschwarz_to_sigmf(
         if out_path is not None:
             output_dir = filenames["meta_fn"].parent
             output_dir.mkdir(parents=True, exist_ok=True)
-            meta.tofile(filenames["meta_fn"], toarchive=False)
+            with _stage(stats, "metadata_write") as record:
+                meta.tofile(filenames["meta_fn"], toarchive=False, overwrite=overwrite)
+                record["bytes_written"] += filenames["meta_fn"].stat().st_size
             log.info("wrote SigMF non-conforming metadata to %s", filenames["meta_fn"])
 
         log.debug("created %r", meta)
         return meta
 
+    if split_channels:
+        # one recording per channel, all de-interleaved in a single pass over the archive
+        try:
+            iq_data = convert_iq_data(
+                tar_path, sample_count, stats, start, data_offset, num_channels, native_datatype
+            )
+        except Exception as e:
+            raise SigMFConversionError(f"Failed to convert or parse IQ data values: {e}") from e
+
+        channel_filenames = [
+            get_sigmf_filenames(f"{filenames['base_fn']}_ch{channel + 1}") for channel in range(num_channels)
+        ]
+        output_dir = filenames["meta_fn"].parent
+        output_dir.mkdir(parents=True, exist_ok=True)
+        hashes = _write_channels(
+            iq_data,
+            [channel_fns["data_fn"] for channel_fns in channel_filenames],
+            stats=stats,
+            threads=threads,
+            scale=scale,
+        )
+        log.debug("wrote %d channel datasets for %s", num_channels, filenames["base_fn"])
+
+        metas = []
+        for channel, (channel_fns, sha512) in enumerate(zip(channel_filenames, hashes)):
+            channel_info = {
+                **global_info,
+                SigMFFile.NUM_CHANNELS_KEY: 1,
+                SigMFFile.HASH_KEY: sha512,
+                "rohdeschwarz:channel": channel + 1,
+            }
+            meta = SigMFFile(data_file=channel_fns["data_fn"], global_info=channel_info, skip_checksum=True)
+            meta.add_capture(start, metadata=dict(capture_info))
+
+            # add annotations from metadata
+            for annotation in annotations:
+                start_idx = annotation.get(SigMFFile.START_INDEX_KEY, 0)
+                length = annotation.get(SigMFFile.LENGTH_INDEX_KEY)
+                annot_metadata = {
+                    k: v
+                    for k, v in annotation.items()
+                    if k not in [SigMFFile.START_INDEX_KEY, SigMFFile.LENGTH_INDEX_KEY]
+                }
+                meta.add_annotation(start_idx, length=length, metadata=annot_metadata)
+
+            with _stage(stats, "metadata_write") as record:
+                meta.tofile(channel_fns["meta_fn"], toarchive=False, overwrite=overwrite)
+                record["bytes_written"] += channel_fns["meta_fn"].stat().st_size
+            log.info("wrote SigMF metadata for channel %d to %s", channel + 1, channel_fns["meta_fn"])
+            metas.append(meta)
+
+        if create_collection:
+            collection = SigMFCollection(
+                metafiles=[channel_fns["meta_fn"].name for channel_fns in channel_filenames], base_path=output_dir
+            )
+            collection.tofile(filenames["collection_fn"], overwrite=overwrite)
+            log.info("wrote SigMF collection to %s", filenames["collection_fn"])
+
+        return metas
+
     # create archive if specified, otherwise write separate meta and data files
     if create_archive:
-        # determine unique IQ file name
-        data_file_path = rohdeschwarz_path.parent / iq_filename
-   
+        # the IQ data is read in place from the archive
+        data_file_path = tar_path
+
         # use temporary directory for data file when creating archive
         with tempfile.TemporaryDirectory() as temp_dir:
             data_path = Path(temp_dir) / filenames["data_fn"].name
 
             # convert iq data and write to temp directory
             try:
-                iq_data = convert_iq_data(data_file_path, sample_count)
+                iq_data = convert_iq_data(
+                    data_file_path, sample_count, stats, start, data_offset, num_channels, native_datatype
+                )
             except Exception as e:
                 raise SigMFConversionError(f"Failed to convert or parse IQ data values: {e}") from e
 
-            # write converted iq data to temporary file
-            iq_data.tofile(data_path)
+            # write converted iq data to temporary file, hashing it on the way out
+            global_info[SigMFFile.HASH_KEY] = _write_iq_data(
+                iq_data, data_path, stats=stats, sample_elements=2 * num_channels, scale=scale
+            )
             log.debug("wrote converted iq data to %s", data_path)
 
-            meta = SigMFFile(data_file=data_path, global_info=global_info)
-            meta.add_capture(0, metadata=capture_info)
+            meta = SigMFFile(data_file=data_path, global_info=global_info, skip_checksum=True)
+            meta.add_capture(start, metadata=capture_info)
 
             # add annotations from metadata
             for annotation in annotations:
@@ -518,32 +1410,51 @@ def rohdeschwarz_to_sigmf(
 
             output_dir = filenames["archive_fn"].parent
             output_dir.mkdir(parents=True, exist_ok=True)
-            meta.tofile(filenames["archive_fn"], toarchive=True)
+            with _stage(stats, "metadata_write") as record:
+                meta.tofile(filenames["archive_fn"], toarchive=True, overwrite=overwrite)
+                record["bytes_written"] += filenames["archive_fn"].stat().st_size
             log.info("wrote SigMF archive to %s", filenames["archive_fn"])
-            # metadata returned should be for this archive
-            meta = fromfile(filenames["archive_fn"])
+            # metadata returned should be for this archive - the hash was computed while writing
+            meta = fromfile(filenames["archive_fn"], skip_checksum=True)
 
     else:
         # write separate meta and data files
         # convert iq data for rohdeschwarz file
-        # determine unique IQ file name
-        data_file_path = rohdeschwarz_path.parent / iq_filename
-        print(f"data_file_path: {data_file_path}")
+        # the IQ data is read in place from the archive
+        data_file_path = tar_path
+        log.debug("data_file_path: %s", data_file_path)
+
+        # resumable runs write the data file under a temporary name with checkpoints, one-shot runs write
+        # it directly without paying for the fsyncs
+        checkpoint = None
+        done = 0
+        if resume or checkpoint_interval is not None:
+            checkpoint = ConversionCheckpoint(filenames["data_fn"], fingerprint, checkpoint_interval)
+            done = checkpoint.load(stats) if resume else 0
 
         try:
-            iq_data = convert_iq_data(data_file_path, sample_count)
+            iq_data = convert_iq_data(
+                data_file_path, sample_count - done, stats, start + done, data_offset, num_channels, native_datatype
+            )
         except Exception as e:
             raise SigMFConversionError(f"Failed to convert or parse IQ data values: {e}") from e
 
         # write data file
         output_dir = filenames["data_fn"].parent
         output_dir.mkdir(parents=True, exist_ok=True)
-        iq_data.tofile(filenames["data_fn"])
+        global_info[SigMFFile.HASH_KEY] = _write_iq_data(
+            iq_data,
+            filenames["data_fn"],
+            stats=stats,
+            checkpoint=checkpoint,
+            sample_elements=2 * num_channels,
+            scale=scale,
+        )
         log.debug("wrote SigMF dataset to %s", filenames["data_fn"])
 
-        # create sigmffile with converted iq data
-        meta = SigMFFile(data_file=filenames["data_fn"], global_info=global_info)
-        meta.add_capture(0, metadata=capture_info)
+        # create sigmffile with converted iq data, hash was computed while writing
+        meta = SigMFFile(data_file=filenames["data_fn"], global_info=global_info, skip_checksum=True)
+        meta.add_capture(start, metadata=capture_info)
 
         # add annotations from metadata
         for annotation in annotations:
@@ -556,7 +1467,9 @@ def rohdeschwarz_to_sigmf(
             meta.add_annotation(start_idx, length=length, metadata=annot_metadata)
 
         # write metadata file
-        meta.tofile(filenames["meta_fn"], toarchive=False)
+        with _stage(stats, "metadata_write") as record:
+            meta.tofile(filenames["meta_fn"], toarchive=False, overwrite=overwrite)
+            record["bytes_written"] += filenames["meta_fn"].stat().st_size
         log.info("wrote SigMF metadata to %s", filenames["meta_fn"])
 
     log.debug("created %r", meta)
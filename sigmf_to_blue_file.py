@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+
+# SigMF to Blue File converter
+# Writes a MIDAS Blue file (HCB, adjunct and extended header keywords) from a
+# SigMF recording, the reverse of blue_file_to_sigmf.py, so data can be handed
+# back to MIDAS based tools.
+# Samples are streamed from the .sigmf-data file in chunks and converted to
+# the requested Blue format and byte order on the fly, so multi-GB recordings
+# never need to fit in memory.
+
+import os
+import re
+import sys
+import json
+import struct
+import argparse
+from datetime import datetime, timezone
+
+import numpy as np
+
+from blue_file_to_sigmf import (
+    BLOCK_SIZE,
+    DEFAULT_CHUNK_SIZE,
+    FORMAT_CODES,
+    HCB_LAYOUT,
+    HEADER_SIZE,
+    NORMALIZE_SCALE,
+    STRUCT_CODES,
+)
+
+# Blue timecodes count seconds from January 1st 1950
+BLUE_EPOCH = datetime(1950, 1, 1, tzinfo=timezone.utc)
+
+# Prefix used by blue_file_to_sigmf for extended header keywords in the global metadata
+EXTENDED_HEADER_PREFIX = "core:blue_extended_header_"
+
+# Global metadata key where blue_file_to_sigmf keeps the Blue type code of each keyword
+KEYWORD_TYPES_KEY = "core:blue_keyword_types"
+
+# SigMF datatype, for example 'ci16_le' -> complex, element kind, bits, byte order
+SIGMF_DATATYPE_PATTERN = re.compile(r"^(r|c)(f|i|u)(8|16|32|64)(?:_(le|be))?$")
+
+# (element kind, bits) -> Blue format type character
+BLUE_TYPE_CHARS = {
+    ("i", 8): "B",
+    ("i", 16): "I",
+    ("i", 32): "L",
+    ("i", 64): "X",
+    ("f", 32): "F",
+    ("f", 64): "D",
+}
+
+
+def sigmf_datatype_to_blue(datatype):
+    """
+    Map a SigMF datatype to the matching Blue format code and byte order.
+
+    Parameters
+    ----------
+    datatype : str
+        SigMF datatype, for example 'ci16_le'.
+
+    Returns
+    -------
+    tuple of (str, numpy.dtype)
+        Blue format code, for example 'CI', and the element type of the
+        SigMF samples including byte order.
+
+    Raises
+    ------
+    ValueError
+        If the datatype has no Blue equivalent.
+    """
+    match = SIGMF_DATATYPE_PATTERN.match(datatype or "")
+    if match is None:
+        raise ValueError(f"Invalid SigMF datatype: {datatype}")
+    complex_or_real, kind, bits, order = match.groups()
+    type_char = BLUE_TYPE_CHARS.get((kind, int(bits)))
+    if type_char is None:
+        raise ValueError(f"SigMF datatype {datatype} has no Blue equivalent")
+    element_dtype = np.dtype(f"{kind}{int(bits) // 8}").newbyteorder(">" if order == "be" else "<")
+    return ("C" if complex_or_real == "c" else "S") + type_char, element_dtype
+
+
+def datetime_to_timecode(iso_8601_string):
+    """
+    Convert a SigMF ISO 8601 datetime to a Blue timecode (seconds since 1950).
+
+    Parameters
+    ----------
+    iso_8601_string : str
+        Datetime such as '2023-11-14T22:13:20.000Z'.
+
+    Returns
+    -------
+    float
+        Blue timecode.
+    """
+    whole, _, fraction = iso_8601_string.rstrip("Z").partition(".")
+    dt = datetime.strptime(whole, "%Y-%m-%dT%H:%M:%S").replace(tzinfo=timezone.utc)
+    return (dt - BLUE_EPOCH).total_seconds() + (float(f"0.{fraction}") if fraction else 0.0)
+
+
+def build_hcb(fields, adjunct, endian="<"):
+    """
+    Pack HCB fields and adjunct values into a 512-byte header block.
+
+    Parameters
+    ----------
+    fields : dict
+        HCB field values keyed by the names in HCB_LAYOUT. Missing fields are zero.
+    adjunct : list of tuple
+        Adjunct values as (struct format, value), packed in order from byte 256.
+    endian : str, optional
+        Header endianness ('<' for little-endian, '>' for big-endian).
+
+    Returns
+    -------
+    bytearray
+        The header block.
+    """
+    header = bytearray(HEADER_SIZE)
+    for name, offset, size, fmt, desc in HCB_LAYOUT:
+        value = fields.get(name)
+        if value is None:
+            continue
+        if isinstance(value, str):
+            value = value.encode("ascii", errors="replace")
+        if fmt == "8d" and not isinstance(value, (list, tuple)):
+            value = [value] * 8
+        struct.pack_into(endian + fmt, header, offset, *(value if fmt == "8d" else [value]))
+
+    # Adjunct starts at 256
+    offset = 256
+    for fmt, value in adjunct:
+        struct.pack_into(endian + fmt, header, offset, value)
+        offset += struct.calcsize(fmt)
+    return header
+
+
+def _pack_keyword_value(value, type_char, endian):
+    """Pack a keyword value as Blue type ``type_char``, or return None if it does not fit that type."""
+    if len(type_char) != 1 or not type_char.isascii():
+        return None
+    values = value if isinstance(value, (list, tuple)) else [value]
+    code = STRUCT_CODES.get(type_char)
+    if code is None:
+        # Text types are written back as they were read
+        return value.encode("ascii", errors="replace") if isinstance(value, str) else None
+    if not values or not all(isinstance(v, (bool, int, float, np.number)) for v in values):
+        return None
+    try:
+        if code in "fd":
+            return struct.pack(f"{endian}{len(values)}{code}", *(float(v) for v in values))
+        if not all(float(v).is_integer() for v in values):
+            return None
+        return struct.pack(f"{endian}{len(values)}{code}", *(int(v) for v in values))
+    except struct.error:
+        return None
+
+
+def _infer_keyword_record(value, endian):
+    """Pick the Blue type for a keyword value from its JSON type, returning (type char, packed value)."""
+    values = value if isinstance(value, (list, tuple)) else [value]
+    if isinstance(value, str):
+        return "A", value.encode("ascii", errors="replace")
+    if values and all(isinstance(v, (bool, int, np.integer)) for v in values):
+        type_char = "L" if all(-(2**31) <= int(v) < 2**31 for v in values) else "X"
+        return type_char, struct.pack(f"{endian}{len(values)}{STRUCT_CODES[type_char]}", *(int(v) for v in values))
+    if values and all(isinstance(v, (int, float, np.number)) for v in values):
+        return "D", struct.pack(f"{endian}{len(values)}d", *(float(v) for v in values))
+    # Anything else is kept as its JSON text
+    return "A", json.dumps(value).encode("ascii", errors="replace")
+
+
+def build_extended_header(keywords, endian="<", types=None):
+    """
+    Encode extended header keyword records, the inverse of parse_extended_header.
+
+    Each record is lkey (int32), lext (int16), ltag (int8) and a type
+    character, followed by the value, the tag and padding to 8 bytes.
+
+    Parameters
+    ----------
+    keywords : list of tuple
+        (tag, value) pairs. Strings are written as 'A', integers as 'L' (or
+        'X' if they do not fit) and floats as 'D'. Lists are written as
+        arrays of the type of their first element.
+    endian : str, optional
+        Endianness ('<' for little-endian, '>' for big-endian).
+    types : dict, optional
+        Blue type code of each tag, as recorded by blue_file_to_sigmf in
+        ``core:blue_keyword_types``. A value that still fits its recorded
+        type is written with it, so the original record comes back.
+
+    Returns
+    -------
+    bytes
+        The extended header block.
+    """
+    records = []
+    for tag, value in keywords:
+        # Tags were decoded with errors="replace", so non-ASCII characters come back as "?"
+        tag_bytes = tag.encode("ascii", errors="replace")
+        if len(tag_bytes) > 127:
+            raise ValueError(f"Extended header tag too long: {tag}")
+
+        # Keep the recorded type while the value still fits it, otherwise pick one from the value
+        type_char = (types or {}).get(tag)
+        value_bytes = _pack_keyword_value(value, type_char, endian) if type_char else None
+        if value_bytes is None:
+            type_char, value_bytes = _infer_keyword_record(value, endian)
+
+        total = 4 + 2 + 1 + 1 + len(value_bytes) + len(tag_bytes)
+        pad = (8 - (total % 8)) % 8
+        lkey = total + pad
+        lext = lkey - len(value_bytes)
+        records.append(
+            struct.pack(f"{endian}ihb", lkey, lext, len(tag_bytes))
+            + type_char.encode("ascii", errors="replace")
+            + value_bytes
+            + tag_bytes
+            + b"\x00" * pad
+        )
+    return b"".join(records)
+
+
+def _convert_elements(raw, src_format, dst_format, dst_dtype):
+    """
+    Convert a block of elements between Blue formats.
+
+    Integer formats are scaled through the -1.0 to +1.0 range used by
+    blue_file_to_sigmf when the element type changes between integer and
+    float, and clipped to the range of the destination type.
+
+    Parameters
+    ----------
+    raw : numpy.ndarray
+        Source elements.
+    src_format, dst_format : str
+        Blue format codes of the source and destination.
+    dst_dtype : numpy.dtype
+        Destination element type including byte order.
+
+    Returns
+    -------
+    numpy.ndarray
+        Converted elements.
+    """
+    if src_format[1] == dst_format[1]:
+        # Same element type, only the byte order can differ
+        return raw.astype(dst_dtype, copy=False)
+
+    values = raw.astype(np.float64)
+    if src_format in NORMALIZE_SCALE:
+        values /= NORMALIZE_SCALE[src_format]
+    if dst_format in NORMALIZE_SCALE:
+        info = np.iinfo(dst_dtype)
+        values *= NORMALIZE_SCALE[dst_format]
+        np.rint(values, out=values)
+        np.clip(values, info.min, info.max, out=values)
+    return values.astype(dst_dtype)
+
+
+def sigmf_to_blue_file(meta_path, blue_path=None, data_format=None, data_rep="EEEI", chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Convert a SigMF recording to a MIDAS Blue file.
+
+    Parameters
+    ----------
+    meta_path : str
+        Path to the .sigmf-meta file.
+    blue_path : str, optional
+        Path of the Blue file to write. Defaults to the recording name with a
+        .tmp extension.
+    data_format : str, optional
+        Blue format code to write, for example 'CI'. Defaults to the format
+        matching the SigMF datatype.
+    data_rep : str, optional
+        'EEEI' (little-endian) or 'IEEE' (big-endian) for the header and data.
+    chunk_size : int, optional
+        Number of samples converted per chunk.
+
+    Returns
+    -------
+    str
+        Path of the written Blue file.
+    """
+    if data_rep not in ("EEEI", "IEEE"):
+        raise ValueError(f"Unknown data representation: {data_rep}")
+    endian = "<" if data_rep == "EEEI" else ">"
+
+    with open(meta_path, "r") as f:
+        metadata = json.load(f)
+    global_md = metadata.get("global", {})
+    captures = metadata.get("captures") or [{}]
+
+    base_file_name = os.path.splitext(meta_path)[0]
+    if blue_path is None:
+        blue_path = base_file_name + ".tmp"
+
+    # Non-Conforming Datasets point at their data file and skip its header and trailer
+    dataset = global_md.get("core:dataset")
+    if dataset:
+        data_path = os.path.join(os.path.dirname(meta_path), dataset)
+    else:
+        data_path = base_file_name + ".sigmf-data"
+    data_offset = int(captures[0].get("core:header_bytes", 0))
+    data_end = os.path.getsize(data_path) - int(global_md.get("core:trailing_bytes", 0))
+
+    # --- Source and destination sample layout ---
+    src_format, src_dtype = sigmf_datatype_to_blue(global_md.get("core:datatype"))
+    dst_format = data_format or src_format
+    if dst_format not in FORMAT_CODES:
+        raise ValueError(f"Unsupported Blue data format: {dst_format}")
+    if src_format[0] != dst_format[0]:
+        raise ValueError(f"Cannot convert {global_md.get('core:datatype')} samples to Blue format {dst_format}")
+
+    dst_type, elems_per_sample = FORMAT_CODES[dst_format]
+    dst_dtype = np.dtype(dst_type).newbyteorder(endian)
+
+    num_channels = int(global_md.get("core:num_channels", 1))
+    src_sample_bytes = src_dtype.itemsize * elems_per_sample * num_channels
+    sample_count = max(data_end - data_offset, 0) // src_sample_bytes
+    data_size = sample_count * dst_dtype.itemsize * elems_per_sample * num_channels
+
+    # --- Extended header keywords ---
+    keywords = []
+    for key, value in global_md.items():
+        if key.startswith(EXTENDED_HEADER_PREFIX) and value is not None:
+            keywords.append((key[len(EXTENDED_HEADER_PREFIX):], value))
+    if "core:frequency" in captures[0] and not any(tag == "RF_FREQ" for tag, _ in keywords):
+        keywords.append(("RF_FREQ", float(captures[0]["core:frequency"])))
+    ext_bytes = build_extended_header(keywords, endian, global_md.get(KEYWORD_TYPES_KEY))
+
+    # --- HCB and adjunct ---
+    sample_rate = float(global_md.get("core:sample_rate") or 1.0)
+    description = global_md.get("core:description", "")[:92]
+    ext_start = (HEADER_SIZE + data_size + BLOCK_SIZE - 1) // BLOCK_SIZE
+    fields = {
+        "version": "BLUE",
+        "head_rep": data_rep,
+        "data_rep": data_rep,
+        "ext_start": ext_start,
+        "ext_size": len(ext_bytes),
+        "data_start": float(HEADER_SIZE),
+        "data_size": float(data_size),
+        "type": 1000,
+        "format": dst_format,
+        "timecode": datetime_to_timecode(captures[0]["core:datetime"]) if "core:datetime" in captures[0] else 0.0,
+        "keylength": len(description),
+        "keywords": description,
+    }
+    if num_channels > 1:
+        # Multi-channel samples become type 2000 frames with one element per channel
+        fields["type"] = 2000
+        adjunct = [("d", 0.0), ("d", 1.0), ("i", 0), ("i", num_channels), ("d", 0.0), ("d", 1.0 / sample_rate), ("i", 1)]
+    else:
+        adjunct = [("d", 0.0), ("d", 1.0 / sample_rate), ("i", 1)]
+
+    # --- Stream the samples ---
+    elems_per_chunk = chunk_size * elems_per_sample * num_channels
+    with open(data_path, "rb") as f_in, open(blue_path, "wb") as f_out:
+        f_out.write(build_hcb(fields, adjunct, endian))
+        f_in.seek(data_offset)
+        elems_remaining = sample_count * elems_per_sample * num_channels
+        while elems_remaining > 0:
+            count = min(elems_per_chunk, elems_remaining)
+            raw = np.fromfile(f_in, dtype=src_dtype, count=count)
+            if raw.size < count:
+                raise ValueError("Unexpected end of SigMF data")
+            f_out.write(_convert_elements(raw, src_format, dst_format, dst_dtype))
+            elems_remaining -= count
+
+        # Extended header starts on the next 512-byte block after the data
+        f_out.write(b"\x00" * (ext_start * BLOCK_SIZE - HEADER_SIZE - data_size))
+        f_out.write(ext_bytes)
+
+    return blue_path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert a SigMF recording to a MIDAS Blue file")
+    parser.add_argument("sigmf_meta", help="path to the .sigmf-meta file")
+    parser.add_argument("-o", "--output", help="Blue file to write, defaults to <recording>.tmp")
+    parser.add_argument("--format", choices=sorted(FORMAT_CODES), help="Blue data format, defaults to match the SigMF datatype")
+    parser.add_argument("--data-rep", choices=("EEEI", "IEEE"), default="EEEI", help="little (EEEI) or big (IEEE) endian")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="samples converted per chunk")
+    args = parser.parse_args(argv)
+
+    blue_path = sigmf_to_blue_file(args.sigmf_meta, args.output, args.format, args.data_rep, args.chunk_size)
+    print(f"Wrote Blue file {blue_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())